@@ -0,0 +1,89 @@
+"""Throughput of the bulk angle converter on synthetic angle files.
+
+Writes ``--rows`` angles per file in three shapes and converts each with
+``bulk.convert_file`` into a throwaway CSV, reporting rows/s:
+
+* ``whole degrees`` - integers in [-720, 720), the classroom case;
+* ``decimal degrees`` - three decimals, nearly every angle distinct;
+* ``radian expressions`` - a mix of ``3π/4``-style text and decimals.
+
+Peak memory is traced with ``--memory`` (slower), to check that it follows
+the chunk size rather than the file size::
+
+    python benchmarks/bulk.py --rows 100000 1000000 --memory
+"""
+import argparse
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathcraft import bulk  # noqa: E402
+from mathcraft.angles import TABLE  # noqa: E402
+
+
+def angle_file(shape, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    if shape == "whole degrees":
+        values = [str(v) for v in rng.integers(-720, 720, rows).tolist()]
+    elif shape == "decimal degrees":
+        values = [f"{v:.3f}" for v in rng.uniform(-720, 720, rows).tolist()]
+    else:
+        labels = [entry.label for entry in TABLE]
+        values = [labels[i] if i < len(labels) else f"{v:.4f}"
+                  for i, v in zip(rng.integers(0, 2 * len(labels), rows).tolist(),
+                                  rng.uniform(-7, 7, rows).tolist())]
+    return ("\n".join(values) + "\n").encode()
+
+
+SHAPES = {"whole degrees": "degrees", "decimal degrees": "degrees", "radian expressions": "radians"}
+
+
+def run(shape, rows, chunk_rows, memory):
+    data = angle_file(shape, rows)
+    unit = SHAPES[shape]
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        if memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        for progress in bulk.convert_file(io.BytesIO(data), out, unit, chunk_rows=chunk_rows):
+            pass
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if memory else None
+        tracemalloc.stop()
+    return {"shape": shape, "rows": progress.rows, "file_mb": len(data) / 1e6, "seconds": elapsed,
+            "rows_per_s": progress.rows / elapsed, "peak_mb": peak / 1e6 if memory else None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--chunk-rows", type=int, default=bulk.CHUNK_ROWS)
+    parser.add_argument("--memory", action="store_true", help="trace peak Python memory")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'shape':<20} {'rows':>10} {'file MB':>8} {'seconds':>8} {'rows/s':>11}"
+          + (f" {'peak MB':>8}" if args.memory else ""))
+    for count in args.rows:
+        for shape in SHAPES:
+            row = run(shape, count, args.chunk_rows, args.memory)
+            rows.append(row)
+            line = (f"{shape:<20} {row['rows']:>10,} {row['file_mb']:>8.1f} {row['seconds']:>8.2f} "
+                    f"{row['rows_per_s']:>11,.0f}")
+            print(line + (f" {row['peak_mb']:>8.1f}" if args.memory else ""), flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
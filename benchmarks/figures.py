@@ -0,0 +1,165 @@
+"""Figure construction cost: plain-dict specs vs. validated Plotly objects.
+
+For each diagram the lessons draw it times what a rerun pays up to the JSON
+``st.plotly_chart`` sends (``to_dict`` included, since Streamlit calls it):
+
+* ``spec`` - the lesson's ``mathcraft.figspec`` builder, wrapped with
+  ``go.Figure(spec, _validate=False)``;
+* ``validated`` - the same spec pushed through Plotly's validators, which is
+  what building it from ``go.Scatter``/``add_annotation`` calls costs;
+* ``baseline`` (with ``--baseline REV``) - the lesson's figure builder as it
+  was at git revision ``REV``, e.g. the ``go.*`` version before figspec.
+
+It also checks that the outputs are equal, so a spec the validators would
+rewrite (or a builder that drifted from the baseline) is reported::
+
+    python benchmarks/figures.py --baseline <rev-before-figspec>
+"""
+import argparse
+import base64
+import importlib.util
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lessons import applications, definitions, functions, unit_circle  # noqa: E402
+
+# name -> (module, builder name, argument tuples)
+DIAGRAMS = {
+    "right_triangle": (definitions, "triangle_figure", [(10,), (37,), (45,), (80,)]),
+    "circle_definition": (definitions, "circle_figure", [(5, 45), (3, 200), (10, 0)]),
+    "unit_circle": (unit_circle, "unit_circle_figure", [("Degrees", 45), ("Radians", 5), ("Degrees", 90)]),
+    "unit_circle_animation": (unit_circle, "unit_circle_animation", [("Degrees", 15), ("Radians", 15)]),
+    "function_explorer": (functions, "function_figure",
+                          [(1.0, 1.0, 0.0, 0.0, ("sin", "cos")), (2.0, 0.5, 1.0, -1.0, ("cos", "tan"))]),
+    "ocean_wave": (applications, "ocean_wave_animation",
+                   [(((2.0, 20, 8, 0.0),),), (((2.0, 20, 8, 0.0), (1.0, 15, 6, 0.0)),)]),
+    "sound_wave": (applications, "sound_figure", [(("A4",), 0.5, 20), (("C4", "E4", "G4"), 1.0, 1000)]),
+}
+
+
+def _builder(module, name):
+    # Skip the profiling and mathcraft.caching.cached wrappers: every call should build.
+    return inspect.unwrap(getattr(module, name))
+
+
+def _baseline_module(module, rev):
+    relative = os.path.relpath(module.__file__, ROOT)
+    source = subprocess.run(["git", "show", f"{rev}:{relative}"], cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    with tempfile.NamedTemporaryFile("w", suffix=".py", delete=False, encoding="utf-8") as f:
+        f.write(source)
+    spec = importlib.util.spec_from_file_location(f"baseline_{module.__name__.replace('.', '_')}", f.name)
+    baseline = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(baseline)
+    os.unlink(f.name)
+    return baseline
+
+
+def _array(values):
+    # NaN (a gap in a curve) never equals itself; compare it as None.
+    rounded = np.round(np.asarray(values, dtype=float), 12)
+    return ("array", tuple(None if np.isnan(v) else v for v in rounded.tolist()))
+
+
+def _normalized(value):
+    """Comparable form of a figure dict: arrays (base64 or lists) as rounded float tuples."""
+    if isinstance(value, dict):
+        if "bdata" in value and "dtype" in value:
+            return _array(np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"]))
+        return {k: _normalized(v) for k, v in value.items() if k != "template"}
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+            return _array(value)
+        return [_normalized(v) for v in value]
+    if isinstance(value, float):
+        return round(value, 12)
+    return value
+
+
+def _per_call_ms(func, calls, repeat):
+    func()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best * 1000
+
+
+def run(name, module, builder_name, argsets, calls, repeat, baseline=None):
+    build = _builder(module, builder_name)
+    specs = [build(*args) for args in argsets]
+    row = {"diagram": name, "equal": True}
+
+    def spec_path():
+        for args in argsets:
+            go.Figure(build(*args), _validate=False).to_dict()
+
+    def validated_path():
+        for spec in specs:
+            go.Figure(spec).to_dict()
+
+    paths = [("spec", spec_path), ("validated", validated_path)]
+    reference = [_normalized(go.Figure(spec).to_dict()) for spec in specs]
+    if baseline is not None:
+        old = _builder(baseline, builder_name)
+        paths.append(("baseline", lambda: [old(*args).to_dict() for args in argsets]))
+        reference += [_normalized(old(*args).to_dict()) for args in argsets]
+    emitted = [_normalized(go.Figure(spec, _validate=False).to_dict()) for spec in specs]
+    row["equal"] = all(ref == emitted[i % len(emitted)] for i, ref in enumerate(reference))
+
+    for path, func in paths:
+        row[f"{path}_ms"] = _per_call_ms(func, calls, repeat) / len(argsets)
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", metavar="REV", help="also time the builders at this git revision")
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="diagram names to run (default: all)")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    baselines = {}
+    rows = []
+    header = f"{'diagram':<24} {'spec ms':>8} {'validated ms':>13} {'speedup':>8}"
+    print(header + (f" {'baseline ms':>12} {'speedup':>8}" if args.baseline else "") + "  equal")
+    for name, (module, builder_name, argsets) in DIAGRAMS.items():
+        if args.only and name not in args.only:
+            continue
+        baseline = None
+        if args.baseline:
+            if module not in baselines:
+                baselines[module] = _baseline_module(module, args.baseline)
+            baseline = baselines[module]
+        row = run(name, module, builder_name, argsets, args.calls, args.repeat, baseline)
+        rows.append(row)
+        line = (f"{name:<24} {row['spec_ms']:>8.3f} {row['validated_ms']:>13.3f} "
+                f"{row['validated_ms'] / row['spec_ms']:>7.1f}x")
+        if baseline is not None:
+            line += f" {row['baseline_ms']:>12.3f} {row['baseline_ms'] / row['spec_ms']:>7.1f}x"
+        print(line + f"  {'yes' if row['equal'] else 'NO'}", flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    if not all(row["equal"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
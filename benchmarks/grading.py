@@ -0,0 +1,121 @@
+"""Throughput of the answer grading engine on a synthetic class worksheet.
+
+Builds ``--students`` × the 16 conversion angles of submissions written the
+ways students actually type them (``3π/4``, ``0.75pi``, ``135*pi/180``,
+``2.356``, typos, wrong angles) and grades them three ways:
+
+* ``loop`` - ``grading.grade`` per answer, the per-student path;
+* ``batch cold`` - ``grading.grade_batch`` with the parser cache cleared;
+* ``batch warm`` - the same with the cache already holding every string.
+
+::
+
+    python benchmarks/grading.py --students 200 1000 5000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathcraft import grading  # noqa: E402
+from mathcraft.angles import BY_DEGREES  # noqa: E402
+from mathcraft.problems import CONVERSION_ANGLES  # noqa: E402
+
+
+def _spellings(degrees):
+    entry = BY_DEGREES[degrees]
+    turns = Fraction(degrees, 180)
+    return [
+        entry.label,
+        entry.label.replace("π", "pi"),
+        f"{float(turns):g}pi",
+        f"{degrees}*pi/180",
+        f"{entry.radians:.3f}",
+        f"{entry.radians:.2f}",
+        f"{turns.numerator}/{turns.denominator} π",
+    ]
+
+
+def worksheet(students, seed=0, wrong_rate=0.2, garbage_rate=0.02):
+    """(answers, expected degrees) arrays, one row per student."""
+    rng = random.Random(seed)
+    answers, expected = [], []
+    for _ in range(students):
+        for degrees in CONVERSION_ANGLES:
+            roll = rng.random()
+            if roll < garbage_rate:
+                answer = rng.choice(["idk", "", "pi/", "45°", "π²"])
+            elif roll < garbage_rate + wrong_rate:
+                answer = rng.choice(_spellings(rng.choice(CONVERSION_ANGLES)))
+            else:
+                answer = rng.choice(_spellings(degrees))
+            answers.append(answer)
+            expected.append(degrees)
+    return np.array(answers, dtype=object), np.array(expected)
+
+
+def _best(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), statistics.median(times), result
+
+
+def run(students, repeat):
+    answers, expected = worksheet(students)
+
+    def loop():
+        return np.array([grading.grade(a, e) for a, e in zip(answers, expected)], dtype=np.int8)
+
+    def batch_cold():
+        grading.parse_answer.cache_clear()
+        return grading.grade_batch(answers, expected)
+
+    def batch_warm():
+        return grading.grade_batch(answers, expected)
+
+    row = {"students": students, "answers": len(answers)}
+    results = []
+    for name, func in (("loop", loop), ("batch cold", batch_cold), ("batch warm", batch_warm)):
+        best, median, result = _best(func, repeat)
+        results.append(result)
+        row[name] = {"best_ms": best * 1000, "median_ms": median * 1000, "answers_per_s": len(answers) / best}
+    if not all(np.array_equal(results[0], r) for r in results[1:]):
+        raise AssertionError("batch and per-answer grading disagree")
+    row["verdicts"] = {grading.VERDICTS[v]: int((results[0] == v).sum()) for v in grading.VERDICTS}
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'answers':>8} {'loop ms':>9} {'cold ms':>9} {'warm ms':>9} {'warm answers/s':>15}")
+    for students in args.students:
+        row = run(students, args.repeat)
+        rows.append(row)
+        print(f"{row['answers']:>8} {row['loop']['best_ms']:>9.2f} {row['batch cold']['best_ms']:>9.2f} "
+              f"{row['batch warm']['best_ms']:>9.2f} {row['batch warm']['answers_per_s']:>15,.0f}", flush=True)
+    print("verdicts (last run):", rows[-1]["verdicts"])
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
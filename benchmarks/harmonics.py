@@ -0,0 +1,92 @@
+"""Cost of evaluating a harmonic series: per-term np.sin loop vs. cached basis.
+
+For each term count, builds the square-wave series on a chord and times
+three ways of getting the plotted signal:
+
+* ``loop`` - ``Σ b·np.sin(2π f t)`` with one ``np.sin`` call per term, as a
+  direct translation of the formula would;
+* ``basis`` - ``harmonics.basis`` for every term plus one
+  ``harmonics.evaluate`` matrix product (a cache miss in the lesson);
+* ``matmul`` - ``harmonics.evaluate`` alone on a cached basis, which is all
+  a coefficient edit costs.
+
+It also checks that all three give the same signal::
+
+    python benchmarks/harmonics.py --terms 10 50 200 --notes C4 E4 G4
+"""
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathcraft import harmonics  # noqa: E402
+from mathcraft.audio import NOTES  # noqa: E402
+
+
+def _best_ms(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, statistics.median(times) * 1000, result
+
+
+def run(notes, terms, samples, window, repeat):
+    n, coefficients = harmonics.series("square", terms)
+    frequencies = np.multiply.outer([NOTES[note] for note in notes], n)
+    t = np.linspace(0, window, samples)
+
+    def loop():
+        y = np.zeros(samples)
+        for f, b in zip(frequencies.ravel(), np.tile(coefficients, len(notes))):
+            y += b * np.sin(2 * math.pi * f * t)
+        return y
+
+    basis = harmonics.basis(frequencies, t)
+    row = {"notes": list(notes), "terms": terms, "samples": samples}
+    for name, func in (("loop", loop),
+                       ("basis", lambda: harmonics.evaluate(coefficients, harmonics.basis(frequencies, t))),
+                       ("matmul", lambda: harmonics.evaluate(coefficients, basis))):
+        row[f"{name}_ms"], row[f"{name}_median_ms"], row[name] = _best_ms(func, repeat)
+    row["max_difference"] = float(max(np.max(np.abs(row[name] - row["loop"])) for name in ("basis", "matmul")))
+    for name in ("loop", "basis", "matmul"):
+        del row[name]
+    # The basis is float32, so agreement is to float32 rounding, not exact.
+    if row["max_difference"] > 1e-4 * max(1.0, np.abs(coefficients).sum() * len(notes)):
+        raise AssertionError(f"signals differ by up to {row['max_difference']:.2e}")
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--terms", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--notes", nargs="+", default=["C4", "E4", "G4"], choices=list(NOTES))
+    parser.add_argument("--samples", type=int, default=2048)
+    parser.add_argument("--window-ms", type=float, default=10.0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'terms':>6} {'sines':>7} {'loop ms':>9} {'basis ms':>9} {'matmul ms':>10}")
+    for terms in args.terms:
+        row = run(args.notes, terms, args.samples, args.window_ms / 1000, args.repeat)
+        rows.append(row)
+        print(f"{terms:>6} {terms * len(args.notes):>7} {row['loop_ms']:>9.2f} {row['basis_ms']:>9.2f} "
+              f"{row['matmul_ms']:>10.3f}", flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Local multi-session load generator for the MathCraft app.
+
+Simulates N independent students, each an AppTest session of app.py, who
+navigate between lessons and press "Generate New Problem", "New Challenge"
+and "🔄 New Fact" after exponentially distributed think times. Sessions are
+spread over a process pool; inside each worker they share one interpreter,
+exactly as sessions share one Streamlit server process, and are served one
+rerun at a time in order of when they are due.
+
+For each session count it reports reruns/sec, latency percentiles, the
+queueing lag between when a student acted and when their rerun started (the
+first number to grow once a process is saturated) and resident memory per
+session. RSS moves in allocator-sized steps, so per-session memory is only
+meaningful with at least a few dozen sessions per process. Everything runs
+locally; no server or network is involved::
+
+    python benchmarks/loadgen.py --sessions 1 10 30 --duration 30
+"""
+import argparse
+import heapq
+import json
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from startup import DEFAULT_SCRIPT, share_script_cache
+
+PRACTICE = "🎯 Practice Problems"
+
+# (weight, action) pairs; Student.act() turns an action into widget steps.
+ACTIONS = [
+    (3, "generate_problem"),
+    (3, "new_challenge"),
+    (2, "new_fact"),
+    (2, "navigate"),
+]
+
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        # Peak rather than current RSS, but the best portable fallback.
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _button(at, label, sidebar=False):
+    buttons = at.sidebar.button if sidebar else at.button
+    return next(b for b in buttons if b.label == label)
+
+
+class Student:
+    """One simulated browser session with its own RNG."""
+
+    def __init__(self, script, seed):
+        from streamlit.testing.v1 import AppTest
+
+        self.rng = random.Random(seed)
+        self.at = AppTest.from_file(script, default_timeout=120)
+        self.lessons = None
+
+    def _timed_run(self, latencies):
+        start = time.perf_counter()
+        self.at.run()
+        latencies.append(time.perf_counter() - start)
+
+    def open(self, latencies):
+        self._timed_run(latencies)
+        self.lessons = self.at.sidebar.selectbox[0].options
+
+    def _go_to(self, lesson, latencies, problem_type=None):
+        if self.at.sidebar.selectbox[0].value != lesson:
+            self.at.sidebar.selectbox[0].select(lesson)
+            self._timed_run(latencies)
+        if problem_type and self.at.selectbox[0].value != problem_type:
+            self.at.selectbox[0].select(problem_type)
+            self._timed_run(latencies)
+
+    def act(self, action, latencies):
+        if action == "generate_problem":
+            self._go_to(PRACTICE, latencies, "Degree ↔ Radian Conversion")
+            _button(self.at, "Generate New Problem").click()
+        elif action == "new_challenge":
+            self._go_to(PRACTICE, latencies, "Unit Circle Values")
+            _button(self.at, "New Challenge").click()
+        elif action == "new_fact":
+            _button(self.at, "🔄 New Fact", sidebar=True).click()
+        else:
+            self.at.sidebar.selectbox[0].select(self.rng.choice(self.lessons))
+        self._timed_run(latencies)
+        if self.at.exception:
+            raise RuntimeError(f"{action}: {self.at.exception[0].message}")
+
+    def think(self, mean):
+        return max(0.2, self.rng.expovariate(1 / mean))
+
+    def pick_action(self):
+        weights, names = zip(*ACTIONS)
+        return self.rng.choices(names, weights)[0]
+
+
+def run_worker(script, sessions, duration, think_mean, seed):
+    """Serve ``sessions`` students for ``duration`` seconds in this process."""
+    share_script_cache()
+    # Warm the interpreter with one throwaway session that visits every
+    # lesson, so per-session memory excludes imports and module-level tables.
+    warm = Student(script, seed - 1)
+    warm.open([])
+    for lesson in warm.lessons:
+        warm.at.sidebar.selectbox[0].select(lesson).run()
+    for _, action in ACTIONS:
+        warm.act(action, [])
+    del warm
+    rss_before = _rss_bytes()
+
+    latencies, lags = [], []
+    students = [Student(script, seed + i) for i in range(sessions)]
+    for student in students:
+        student.open([])
+    rss_after_open = _rss_bytes()
+
+    start = time.perf_counter()
+    due = [(start + s.think(think_mean), i) for i, s in enumerate(students)]
+    heapq.heapify(due)
+    while True:
+        when, i = heapq.heappop(due)
+        if when - start > duration:
+            break
+        now = time.perf_counter()
+        if when > now:
+            time.sleep(when - now)
+        lags.append(max(0.0, time.perf_counter() - when))
+        student = students[i]
+        student.act(student.pick_action(), latencies)
+        heapq.heappush(due, (time.perf_counter() + student.think(think_mean), i))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "sessions": sessions,
+        "elapsed_s": elapsed,
+        "latencies": latencies,
+        "lags": lags,
+        "rss_before": rss_before,
+        "rss_after_open": rss_after_open,
+        "rss_end": _rss_bytes(),
+    }
+
+
+def run_level(script, sessions, processes, duration, think_mean, seed):
+    processes = max(1, min(processes, sessions))
+    shares = [sessions // processes + (i < sessions % processes) for i in range(processes)]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = [pool.submit(run_worker, script, n, duration, think_mean, seed + 1000 * i)
+                   for i, n in enumerate(shares)]
+        results = [f.result() for f in futures]
+
+    latencies = np.array([x for r in results for x in r["latencies"]]) * 1000
+    lags = np.array([x for r in results for x in r["lags"]]) * 1000
+    per_session = [(r["rss_end"] - r["rss_before"]) / r["sessions"] for r in results]
+    elapsed = max(r["elapsed_s"] for r in results)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if len(latencies) else (0, 0, 0)
+    return {
+        "sessions": sessions,
+        "processes": processes,
+        "reruns": int(len(latencies)),
+        "reruns_per_s": len(latencies) / elapsed,
+        "latency_ms": {"p50": float(p50), "p95": float(p95), "p99": float(p99)},
+        "lag_ms": {"p95": float(np.percentile(lags, 95)) if len(lags) else 0.0,
+                   "max": float(lags.max()) if len(lags) else 0.0},
+        "rss_per_session_kb": float(np.mean(per_session)) / 1024,
+        "rss_total_mb": sum(r["rss_end"] for r in results) / 2**20,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default=DEFAULT_SCRIPT)
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--processes", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds per session count")
+    parser.add_argument("--think", type=float, default=2.0, help="mean think time in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    script = os.path.abspath(args.script)
+    rows = []
+    print(f"{'sessions':>8} {'procs':>5} {'reruns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'lag p95':>8} {'KB/session':>11} {'RSS MB':>8}")
+    for sessions in args.sessions:
+        row = run_level(script, sessions, args.processes, args.duration, args.think, args.seed)
+        rows.append(row)
+        lat = row["latency_ms"]
+        print(f"{row['sessions']:>8} {row['processes']:>5} {row['reruns_per_s']:>9.1f} {lat['p50']:>8.1f} "
+              f"{lat['p95']:>8.1f} {lat['p99']:>8.1f} {row['lag_ms']['p95']:>8.1f} "
+              f"{row['rss_per_session_kb']:>11.1f} {row['rss_total_mb']:>8.1f}", flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Bytes of per-session state: the old dict/NumPy layout vs. the compact one.
+
+Both layouts describe the same student: every lesson visited, three
+conversion problems drawn, a challenge angle and a sidebar fact. The old
+layout drew from the process-wide ``np.random``; the new one keeps the
+session's ``SessionProblems`` (its generators and ready problems). Sizes are
+deep sizes (containers and referenced objects, shared objects counted once);
+interned lesson titles and small ints are shared across sessions in reality,
+so the old layout's figure is a lower bound.
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from lessons import LESSONS  # noqa: E402
+from mathcraft.problems import SessionProblems  # noqa: E402
+from mathcraft.progress import StudentProgress, deep_sizeof  # noqa: E402
+
+FACT = "Sine waves describe everything from sound to light to ocean waves!"
+ANGLES = [30, 45, 60, 90, 120, 135, 150, 180, 210, 225, 240, 270, 300, 315, 330, 360]
+
+
+def old_state():
+    return {
+        "student_progress": {
+            "lessons_completed": [title for title in LESSONS],
+            "problems_attempted": 0,
+            "correct_answers": 0,
+        },
+        "problem_angles": np.random.choice(ANGLES, 3),
+        "challenge_angle": np.random.choice(["45°", "60°"]),
+        "current_fact": np.random.choice([FACT]),
+    }
+
+
+def new_state():
+    progress = StudentProgress()
+    for i in range(len(LESSONS)):
+        progress.visit(i)
+    problems = SessionProblems(12345)
+    return {
+        "student_progress": progress,
+        "problem_angles": problems.next("conversion"),
+        "challenge_angle": problems.next("challenge"),
+        "current_fact": problems.choice([FACT]),
+        "problems": problems,
+    }
+
+
+def main():
+    old, new = old_state(), new_state()
+    print(f"{'key':<20} {'old bytes':>10} {'new bytes':>10}")
+    for key in dict.fromkeys([*old, *new]):
+        print(f"{key:<20} {deep_sizeof(old[key]) if key in old else '-':>10} "
+              f"{deep_sizeof(new[key]) if key in new else '-':>10}")
+    print(f"{'total':<20} {deep_sizeof(old):>10} {deep_sizeof(new):>10}")
+    per_thousand = (deep_sizeof(old) - deep_sizeof(new)) * 1000 / 2**20
+    print(f"Saved per 1,000 sessions: {per_thousand:.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
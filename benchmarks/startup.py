@@ -0,0 +1,162 @@
+"""Startup and per-rerun benchmark for the MathCraft app.
+
+Measures two things with Streamlit's headless AppTest runner:
+
+* cold start: a fresh interpreter running the script once (imports included),
+  repeated in separate processes so nothing is cached between samples;
+* rerun: the script time of a rerun on each lesson once the process is warm,
+  which is what a widget outside any panel costs a student;
+* fragment: the time of running each of the lesson's ``lessons.panels``
+  panels (``panels.PANELS``) as a page of its own, which is close to what a
+  fragment rerun from one of their sliders costs.
+
+Compare before/after by pointing ``--script`` at another copy of the app, e.g.::
+
+    git show <rev>:app.py > /tmp/app_before.py
+    python benchmarks/startup.py --script /tmp/app_before.py
+    python benchmarks/startup.py
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_SCRIPT = os.path.join(ROOT, "app.py")
+sys.path.insert(0, ROOT)
+
+
+def _child_cold_start(script):
+    from streamlit.testing.v1 import AppTest
+
+    before = set(sys.modules)
+    start = time.perf_counter()
+    at = AppTest.from_file(script, default_timeout=60)
+    at.run()
+    elapsed = time.perf_counter() - start
+    print(json.dumps({
+        "first_run_s": elapsed,
+        "modules_imported": len(set(sys.modules) - before),
+        "exception": bool(at.exception),
+    }))
+
+
+def cold_start(script, samples):
+    results = []
+    for _ in range(samples):
+        out = subprocess.run(
+            [sys.executable, __file__, "--script", script, "--child-cold"],
+            check=True, capture_output=True, text=True, cwd=os.path.dirname(script),
+        )
+        results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    times = [r["first_run_s"] for r in results]
+    return {
+        "median_s": statistics.median(times),
+        "min_s": min(times),
+        "modules_imported": results[-1]["modules_imported"],
+    }
+
+
+def share_script_cache():
+    # AppTest builds a fresh ScriptCache for every run, so each rerun would pay
+    # the AST "magic" rewrite of the main script. A real server keeps one cache
+    # per process; mirror that so rerun numbers only count script execution.
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import local_script_runner
+
+    shared = ScriptCache()
+    local_script_runner.ScriptCache = lambda: shared
+
+
+def _panel_page(module, name):
+    # The body of a one-panel page for AppTest.from_function.
+    import importlib
+
+    from lessons import panels
+
+    importlib.import_module(module)
+    panels.PANELS[name]()
+
+
+def lesson_panels(module):
+    """Names of the registered panels defined in lesson ``module``, in registration order."""
+    from lessons import panels
+
+    return [name for name, run in panels.PANELS.items() if run.__module__ == module]
+
+
+def _timed_runs(at, reruns):
+    samples = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "median_ms": statistics.median(samples) * 1000,
+        "p95_ms": samples[int(0.95 * (len(samples) - 1))] * 1000,
+    }
+
+
+def rerun_times(script, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    import lessons
+
+    share_script_cache()
+    at = AppTest.from_file(script, default_timeout=60)
+    at.run()
+    report = {}
+    for lesson in at.sidebar.selectbox[0].options:
+        at.sidebar.selectbox[0].select(lesson).run()
+        report[lesson] = _timed_runs(at, reruns)
+        report[lesson]["fragments"] = {}
+        module = f"lessons.{lessons.LESSONS[lesson]}"
+        for name in lesson_panels(module):
+            page = AppTest.from_function(_panel_page, args=(module, name), default_timeout=60)
+            page.run()
+            if page.exception:
+                raise RuntimeError(f"panel {name}: {page.exception[0].message}")
+            report[lesson]["fragments"][name] = _timed_runs(page, reruns)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default=DEFAULT_SCRIPT)
+    parser.add_argument("--cold-samples", type=int, default=5)
+    parser.add_argument("--reruns", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print raw JSON instead of a table")
+    parser.add_argument("--child-cold", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    script = os.path.abspath(args.script)
+
+    if args.child_cold:
+        _child_cold_start(script)
+        return
+
+    result = {
+        "script": script,
+        "cold_start": cold_start(script, args.cold_samples),
+        "rerun": rerun_times(script, args.reruns),
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    cold = result["cold_start"]
+    print(f"Script: {script}")
+    print(f"Cold start: median {cold['median_s'] * 1000:.0f} ms, "
+          f"min {cold['min_s'] * 1000:.0f} ms, {cold['modules_imported']} modules imported")
+    print(f"{'Lesson':<34} {'median ms':>10} {'p95 ms':>10}")
+    for lesson, row in result["rerun"].items():
+        print(f"{lesson:<34} {row['median_ms']:>10.2f} {row['p95_ms']:>10.2f}")
+        for name, fragment in row["fragments"].items():
+            print(f"  ⚡ {name:<30} {fragment['median_ms']:>10.2f} {fragment['p95_ms']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
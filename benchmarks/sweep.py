@@ -0,0 +1,261 @@
+"""Replay slider sweeps against every lesson and record per-rerun cost.
+
+Each scenario opens a lesson with Streamlit's headless AppTest runner, applies
+its setup widgets, then steps one or more widgets through their domain (the
+cartesian product when several are swept together). For every rerun it
+records latency, the peak Python heap allocated during the rerun (via
+tracemalloc, in a second untimed pass so tracing does not skew latency) and
+the number of elements the app emitted.
+
+Results are written as JSON so two commits can be compared::
+
+    python benchmarks/sweep.py --out before.json
+    # ... change the app ...
+    python benchmarks/sweep.py --out after.json
+    python benchmarks/sweep.py --compare before.json after.json
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from startup import DEFAULT_SCRIPT, ROOT, share_script_cache
+
+
+def _frange(start, stop, step, digits=2):
+    count = int(round((stop - start) / step)) + 1
+    return [round(start + i * step, digits) for i in range(count)]
+
+
+def _phase_steps(step, count):
+    return [-math.pi + i * step for i in range(count)]
+
+
+class Scenario:
+    """A lesson, the widgets to set first, and the widgets to sweep.
+
+    Widgets are ``(kind, label, value)`` for setup and ``(kind, label, values)``
+    for the sweep, where ``kind`` is an AppTest accessor such as ``"slider"``.
+    A ``"button"`` sweep clicks the button once per value.
+    """
+
+    def __init__(self, name, lesson, sweep, setup=()):
+        self.name = name
+        self.lesson = lesson
+        self.sweep = sweep
+        self.setup = setup
+
+    def steps(self):
+        return list(itertools.product(*(values for _, _, values in self.sweep)))
+
+
+DEFINITIONS = "📏 What ARE Sine & Cosine?"
+UNIT_CIRCLE = "🌀 Unit Circle Explorer"
+FUNCTIONS = "📊 Sine & Cosine as Functions"
+APPLICATIONS = "🌍 Real-World Applications"
+
+SCENARIOS = [
+    Scenario("triangle_angle", DEFINITIONS,
+             [("slider", "Choose angle θ (degrees):", list(range(10, 81, 5)))],
+             setup=[("radio", "Choose how you want to learn the definitions:", "📐 Right Triangle Approach (SOH-CAH-TOA)")]),
+    Scenario("circle_radius_x_angle", DEFINITIONS,
+             [("slider", "Circle radius:", list(range(1, 11))),
+              ("slider", "Angle θ (degrees):", list(range(0, 361, 15)))],
+             setup=[("radio", "Choose how you want to learn the definitions:", "🌀 Circle Coordinate Approach"),
+                    ("toggle", "✋ Drag the point instead of using a slider", False)]),
+    Scenario("unit_circle_degrees", UNIT_CIRCLE,
+             [("slider", "Angle (degrees):", list(range(0, 361, 15)))],
+             setup=[("radio", "Diagram:", "🎚️ Special-angle slider")]),
+    Scenario("unit_circle_radians", UNIT_CIRCLE,
+             [("select_slider", "Angle (radians):", list(range(17)))],
+             setup=[("radio", "Diagram:", "🎚️ Special-angle slider"), ("radio", "Angle measurement:", "Radians")]),
+    Scenario("unit_circle_animated", UNIT_CIRCLE,
+             [("slider", "Angle (degrees):", list(range(0, 361, 15)))],
+             setup=[("radio", "Diagram:", "🎬 Animated")]),
+    Scenario("function_amplitude", FUNCTIONS, [("slider", "Amplitude (A):", _frange(0.5, 3.0, 0.1))]),
+    Scenario("function_frequency", FUNCTIONS, [("slider", "Frequency (B):", _frange(0.5, 3.0, 0.1))]),
+    Scenario("function_phase", FUNCTIONS, [("slider", "Phase shift (C):", _phase_steps(0.1, 63))]),
+    Scenario("function_vertical", FUNCTIONS, [("slider", "Vertical shift (D):", _frange(-2.0, 2.0, 0.1))]),
+    Scenario("limit_zoom_level", "🔢 The Famous Limit",
+             [("selectbox", "Choose how close to 0:", ["±1 radian", "±0.5 radians", "±0.1 radians", "±0.01 radians"])]),
+    Scenario("conversion_new_problem", "🎯 Practice Problems",
+             [("button", "Generate New Problem", list(range(10)))],
+             setup=[("selectbox", "Choose problem type:", "Degree ↔ Radian Conversion")]),
+    Scenario("unit_circle_new_challenge", "🎯 Practice Problems",
+             [("button", "New Challenge", list(range(10)))],
+             setup=[("selectbox", "Choose problem type:", "Unit Circle Values")]),
+    Scenario("pyramid_base_x_slope", APPLICATIONS,
+             [("slider", "Base length (meters):", list(range(50, 301, 25))),
+              ("slider", "Slope angle (degrees):", list(range(45, 66, 2)))],
+             setup=[("selectbox", "Explore an application:", "🏛️ Ancient Architecture")]),
+    Scenario("wave_height", APPLICATIONS, [("slider", "Wave height (A):", _frange(0.5, 5.0, 0.1))],
+             setup=[("selectbox", "Explore an application:", "🌊 Ocean Waves")]),
+    Scenario("wave_length", APPLICATIONS, [("slider", "Wavelength (λ):", list(range(5, 51)))],
+             setup=[("selectbox", "Explore an application:", "🌊 Ocean Waves")]),
+    Scenario("wave_period", APPLICATIONS, [("slider", "Period (T) seconds:", list(range(2, 21)))],
+             setup=[("selectbox", "Explore an application:", "🌊 Ocean Waves")]),
+    Scenario("wave_phase", APPLICATIONS, [("slider", "Phase shift (φ):", _phase_steps(math.pi / 12, 25))],
+             setup=[("selectbox", "Explore an application:", "🌊 Ocean Waves")]),
+    Scenario("sound_note_x_duration", APPLICATIONS,
+             [("selectbox", "Choose a musical note:", ["C4", "D4", "E4", "F4", "G4", "A4", "B4", "C5"]),
+              ("slider", "Duration (seconds):", [0.1, 0.5, 1.0, 2.0, 5.0])],
+             setup=[("selectbox", "Explore an application:", "🎵 Sound & Music")]),
+]
+
+
+def _widget(at, kind, label):
+    for widget in getattr(at, kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f"No {kind} labelled {label!r} on this page")
+
+
+def _apply(at, kind, label, value):
+    widget = _widget(at, kind, label)
+    if kind == "button":
+        widget.click()
+    elif kind == "selectbox":
+        widget.select(value)
+    else:
+        widget.set_value(value)
+
+
+def _element_count(at):
+    return sum(1 for _ in at.main) + sum(1 for _ in at.sidebar)
+
+
+def _open(script, scenario):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(script, default_timeout=120)
+    at.run()
+    at.sidebar.selectbox[0].select(scenario.lesson).run()
+    for kind, label, value in scenario.setup:
+        _apply(at, kind, label, value)
+        at.run()
+    if at.exception:
+        raise RuntimeError(f"{scenario.name}: {at.exception[0].message}")
+    return at
+
+
+def _sweep(at, scenario, step, traced):
+    for (kind, label, _), value in zip(scenario.sweep, step):
+        _apply(at, kind, label, value)
+    if traced:
+        tracemalloc.reset_peak()
+        start_size = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{scenario.name} {step}: {at.exception[0].message}")
+    peak = tracemalloc.get_traced_memory()[1] - start_size if traced else None
+    return elapsed, peak
+
+
+def run_scenario(script, scenario):
+    steps = scenario.steps()
+
+    at = _open(script, scenario)
+    latencies = [_sweep(at, scenario, step, traced=False)[0] * 1000 for step in steps]
+
+    at = _open(script, scenario)
+    tracemalloc.start()
+    try:
+        peaks, elements = [], []
+        for step in steps:
+            peaks.append(_sweep(at, scenario, step, traced=True)[1])
+            elements.append(_element_count(at))
+    finally:
+        tracemalloc.stop()
+
+    ordered = sorted(latencies)
+    return {
+        "lesson": scenario.lesson,
+        "reruns": len(steps),
+        "latency_ms": {
+            "median": statistics.median(latencies),
+            "p95": ordered[int(0.95 * (len(ordered) - 1))],
+            "max": ordered[-1],
+            "first": latencies[0],
+        },
+        "peak_kb": {"median": statistics.median(peaks) / 1024, "max": max(peaks) / 1024},
+        "elements": {"median": statistics.median(elements), "max": max(elements)},
+    }
+
+
+def _metadata(script):
+    import streamlit
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "script": script,
+        "commit": commit,
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare(before_path, after_path):
+    with open(before_path, encoding="utf-8") as f:
+        before = json.load(f)
+    with open(after_path, encoding="utf-8") as f:
+        after = json.load(f)
+    print(f"{'scenario':<28} {'median ms':>21} {'p95 ms':>21} {'peak KB':>21} {'elements':>11}")
+    for name, new in after["scenarios"].items():
+        old = before["scenarios"].get(name)
+        if old is None:
+            print(f"{name:<28} (new)")
+            continue
+        cells = []
+        for a, b in ((old["latency_ms"]["median"], new["latency_ms"]["median"]),
+                     (old["latency_ms"]["p95"], new["latency_ms"]["p95"]),
+                     (old["peak_kb"]["max"], new["peak_kb"]["max"])):
+            change = (b - a) / a * 100 if a else 0.0
+            cells.append(f"{a:>7.1f} → {b:>7.1f} {change:+4.0f}%")
+        cells.append(f"{old['elements']['max']:>4} → {new['elements']['max']:<4}")
+        print(f"{name:<28} " + " ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default=DEFAULT_SCRIPT)
+    parser.add_argument("--out", default=os.path.join(ROOT, "bench_sweep.json"))
+    parser.add_argument("--only", nargs="*", help="scenario names to run (default: all)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    script = os.path.abspath(args.script)
+    share_script_cache()
+    selected = [s for s in SCENARIOS if not args.only or s.name in args.only]
+    results = {"meta": _metadata(script), "scenarios": {}}
+    for scenario in selected:
+        row = run_scenario(script, scenario)
+        results["scenarios"][scenario.name] = row
+        print(f"{scenario.name:<28} {row['reruns']:>4} reruns  "
+              f"median {row['latency_ms']['median']:7.2f} ms  p95 {row['latency_ms']['p95']:7.2f} ms  "
+              f"peak {row['peak_kb']['max']:8.1f} KB  elements {row['elements']['max']}", file=sys.stderr)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"Wrote {args.out}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
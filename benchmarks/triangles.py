@@ -0,0 +1,94 @@
+"""Throughput of the vectorized triangle solver on random worksheets.
+
+For each configuration, draws ``--triangles`` random given sets (sides in
+[1, 10], angles that leave room for a triangle, SSA angles anywhere in
+(0°, 180°) so all three SSA outcomes occur) and solves them with one
+``triangles.solve`` call, reporting triangles/s and how many given sets
+had 0, 1 or 2 solutions. With ``--check`` every solution is re-solved as
+SSS and its angles compared, as an answer key would be::
+
+    python benchmarks/triangles.py --triangles 100000 1000000 --check
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mathcraft import triangles  # noqa: E402
+
+
+def worksheet(case, count, seed=0):
+    rng = np.random.default_rng(seed)
+
+    def side():
+        return rng.uniform(1, 10, count)
+
+    first = rng.uniform(5, 120, count)
+    second = rng.uniform(5, 170 - first)  # leaves at least 5° for the third angle
+    return {
+        "SSS": lambda: (side(), side(), side()),
+        "SAS": lambda: (side(), side(), rng.uniform(1, 179, count)),
+        "ASA": lambda: (first, side(), second),
+        "AAS": lambda: (first, second, side()),
+        "SSA": lambda: (side(), side(), rng.uniform(1, 179, count)),
+    }[case]()
+
+
+def check(solved):
+    # Every valid solution, re-solved from its three sides, must give back its angles.
+    # SSA angles near 90° come from arcsin close to 1, which is ill-conditioned in
+    # the given data itself, so agreement is to 1e-4° rather than to rounding error.
+    valid = solved.valid
+    again = triangles.solve("SSS", solved.a[valid], solved.b[valid], solved.c[valid])
+    error = max(np.max(np.abs(again.A[0] - solved.A[valid]), initial=0),
+                np.max(np.abs(again.B[0] - solved.B[valid]), initial=0))
+    if not np.all(again.valid[0]) or error > 1e-4:
+        raise AssertionError(f"re-solved angles differ by up to {error:.2e}°")
+    return error
+
+
+def run(case, count, repeat, verify):
+    given = worksheet(case, count)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        solved = triangles.solve(case, *given)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        "case": case, "triangles": count, "best_ms": best * 1000, "median_ms": statistics.median(times) * 1000,
+        "per_s": count / best, "solutions": np.bincount(solved.count, minlength=3).tolist(),
+        "max_angle_error": check(solved) if verify else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--triangles", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="verify solutions by re-solving them as SSS")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'case':<5} {'triangles':>10} {'best ms':>9} {'triangles/s':>13}  0/1/2 solutions")
+    for count in args.triangles:
+        for case in triangles.CASES:
+            row = run(case, count, args.repeat, args.check)
+            rows.append(row)
+            print(f"{case:<5} {count:>10,} {row['best_ms']:>9.1f} {row['per_s']:>13,.0f}  "
+                  + "/".join(f"{n:,}" for n in row["solutions"]), flush=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
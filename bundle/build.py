@@ -0,0 +1,277 @@
+"""Prerender every discrete widget state into a static MathCraft bundle.
+
+Most lesson panels are driven by widgets with a small finite domain (a
+slider with a step, a radio, a select box). This enumerates those domains,
+renders each state's figure and computed values once, spread over a
+process pool, and writes a directory any static file server can host:
+
+* ``index.html`` - the page; it switches between states in the browser;
+* ``plotly.min.js`` - the Plotly build matching the installed package;
+* ``data/<panel>.json`` - every state of one panel, fetched on first view;
+* ``audio/*.wav`` - the note clips.
+
+No Python runs when students use it, so it keeps working when the
+Streamlit server cannot keep up (exam weeks)::
+
+    python bundle/build.py --out dist --workers 8
+    python -m http.server --directory dist
+
+Figures go through the same builders and downsampling as the app.
+Free-form inputs (the triangle solver, the function explorer's four
+sliders, practice problems, file conversion) stay server-only.
+"""
+import argparse
+import concurrent.futures
+import inspect
+import itertools
+import json
+import math
+import os
+import shutil
+import sys
+import time
+
+import plotly
+import plotly.graph_objects as go
+import plotly.io as pio
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from lessons import applications, charts, definitions, limit, unit_circle  # noqa: E402
+from mathcraft import angles  # noqa: E402
+from mathcraft.audio import NOTES  # noqa: E402
+
+TEMPLATE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "index.html")
+PLOTLY_JS = os.path.join(os.path.dirname(plotly.__file__), "package_data", "plotly.min.js")
+
+NOTE_DURATIONS = (0.5, 1.0, 2.0, 5.0)
+SOUND_WINDOWS_MS = (5, 10, 20, 50, 100, 500, 1000)
+
+
+class Control:
+    """A widget: its label and the finite list of values it can take."""
+
+    def __init__(self, label, values, default, labels=None):
+        self.label = label
+        self.values = list(values)
+        self.default = default
+        self.labels = [str(v) for v in self.values] if labels is None else list(labels)
+
+    def manifest(self):
+        return {"label": self.label, "values": [str(v) for v in self.values], "labels": self.labels,
+                "default": self.values.index(self.default)}
+
+
+class Panel:
+    """A lesson panel, its controls and ``render(*values)`` for one state.
+
+    ``render`` returns a dict with any of ``figure`` (a figure or figspec),
+    ``method`` (how to downsample it), ``values`` (label -> text),
+    ``table`` (column -> cells) and ``audio`` (a file under the bundle).
+    ``files`` maps bundle paths to ``(builder, args)`` for assets the
+    states share, such as audio clips.
+    """
+
+    def __init__(self, name, lesson, title, controls, render, files=None):
+        self.name = name
+        self.lesson = lesson
+        self.title = title
+        self.controls = controls
+        self.render = render
+        self.files = files or {}
+
+    def states(self):
+        return list(itertools.product(*(control.values for control in self.controls)))
+
+    def manifest(self):
+        return {"name": self.name, "lesson": self.lesson, "title": self.title,
+                "controls": [control.manifest() for control in self.controls]}
+
+
+def _builder(func):
+    # Skip the profiling and mathcraft.caching.cached wrappers: each state is built once anyway.
+    return inspect.unwrap(func)
+
+
+def _right_triangle(angle_deg, hypotenuse=10):
+    opposite = hypotenuse * math.sin(math.radians(angle_deg))
+    adjacent = hypotenuse * math.cos(math.radians(angle_deg))
+    return {
+        "figure": _builder(definitions.triangle_figure)(angle_deg, hypotenuse),
+        "values": {
+            "Opposite side": f"{opposite:.2f}",
+            "Adjacent side": f"{adjacent:.2f}",
+            "Hypotenuse": f"{hypotenuse:.2f}",
+            f"sin({angle_deg}°)": f"{opposite:.2f} ÷ {hypotenuse:.2f} = {opposite / hypotenuse:.3f}",
+            f"cos({angle_deg}°)": f"{adjacent:.2f} ÷ {hypotenuse:.2f} = {adjacent / hypotenuse:.3f}",
+            f"tan({angle_deg}°)": f"{opposite:.2f} ÷ {adjacent:.2f} = {opposite / adjacent:.3f}",
+        },
+    }
+
+
+def _circle(radius, angle_deg):
+    x = radius * math.cos(math.radians(angle_deg))
+    y = radius * math.sin(math.radians(angle_deg))
+    return {
+        "figure": _builder(definitions.circle_figure)(radius, angle_deg),
+        "values": {
+            "Point coordinates": f"({x:.2f}, {y:.2f})",
+            f"cos({angle_deg}°)": f"{x:.2f} ÷ {radius} = {x / radius:.3f}",
+            f"sin({angle_deg}°)": f"{y:.2f} ÷ {radius} = {y / radius:.3f}",
+        },
+    }
+
+
+def _unit_circle(angle_mode, angle):
+    entry, angle_display = unit_circle.angle_state(angle_mode, angle)
+    return {
+        "figure": _builder(unit_circle.unit_circle_figure)(angle_mode, angle),
+        "values": {
+            "Angle": angle_display,
+            "cos θ (x-coordinate)": f"{entry.cos:.4f}",
+            "sin θ (y-coordinate)": f"{entry.sin:.4f}",
+            "tan θ (slope)": "undefined" if entry.tan is None else f"{entry.tan:.4f}",
+        },
+    }
+
+
+LIMIT_PLOTS = ["sin(x)/x", "sin(x)/x and sin(x°)/x", "1 − sin(x)/x (how far from 1)"]
+
+
+def _limit(zoom_level, plot):
+    zoom = limit.ZOOMS[zoom_level]
+    if plot == LIMIT_PLOTS[2]:
+        figure = _builder(limit.gap_figure)(zoom, zoom_level)
+    else:
+        figure = _builder(limit.limit_figure)(zoom, zoom_level, plot == LIMIT_PLOTS[1])
+    return {"figure": figure, "table": limit._table_rows(zoom) if zoom <= 0.1 else None}
+
+
+def _pyramid(base_length, slope_angle):
+    height = (base_length / 2) * math.tan(math.radians(slope_angle))
+    return {"values": {"Height": f"{height:.1f} meters",
+                       "Volume": f"{base_length ** 2 * height / 3:,.0f} cubic meters"}}
+
+
+def _clip_path(note, duration):
+    return f"audio/{note}_{duration}s.wav"
+
+
+def _note_wav(note, duration):
+    wav_bytes, _ = applications.note_clip((note,), duration)
+    return wav_bytes
+
+
+def _sound(note, duration, window_ms):
+    frequency = NOTES[note]
+    return {
+        "figure": _builder(applications.sound_figure)((note,), duration, window_ms),
+        "method": "minmax",
+        "values": {f"Frequency ({note})": f"{frequency} Hz", f"Period ({note})": f"{1 / frequency:.4f} seconds"},
+        "audio": _clip_path(note, duration),
+    }
+
+
+PANELS = [
+    Panel("right_triangle", "📏 What ARE Sine & Cosine?", "📐 Right Triangle (SOH-CAH-TOA)",
+          [Control("Choose angle θ (degrees):", range(10, 81, 5), 30)], _right_triangle),
+    Panel("circle_definition", "📏 What ARE Sine & Cosine?", "🌀 Circle Coordinates",
+          [Control("Circle radius:", range(1, 11), 5), Control("Angle θ (degrees):", range(0, 361, 15), 45)],
+          _circle),
+    Panel("unit_circle_degrees", "🌀 Unit Circle Explorer", "🌀 Unit Circle (degrees)",
+          [Control("Angle (degrees):", range(0, 361, 15), unit_circle.DEFAULT_ANGLE["Degrees"])],
+          lambda angle: _unit_circle("Degrees", angle)),
+    Panel("unit_circle_radians", "🌀 Unit Circle Explorer", "🌀 Unit Circle (radians)",
+          [Control("Angle (radians):", range(len(angles.UNIT_CIRCLE)), unit_circle.DEFAULT_ANGLE["Radians"],
+                   labels=unit_circle.ANGLE_LABELS)],
+          lambda angle: _unit_circle("Radians", angle)),
+    Panel("limit_zoom", "🔢 The Famous Limit", "🔍 Explore the Limit",
+          [Control("Choose how close to 0:", list(limit.ZOOMS), next(iter(limit.ZOOMS))),
+           Control("Plot:", LIMIT_PLOTS, LIMIT_PLOTS[1])], _limit),
+    Panel("pyramid", "🌍 Real-World Applications", "🏛️ Build Your Own Pyramid",
+          [Control("Base length (meters):", range(50, 301), 230), Control("Slope angle (degrees):", range(45, 66), 52)],
+          _pyramid),
+    Panel("sound", "🌍 Real-World Applications", "🎵 Musical Notes as Sine Waves",
+          [Control("Choose a musical note:", list(NOTES), "C4"),
+           Control("Duration (seconds):", NOTE_DURATIONS, NOTE_DURATIONS[0]),
+           Control("Plot window (milliseconds):", SOUND_WINDOWS_MS, 20)],
+          _sound, files={_clip_path(note, duration): (_note_wav, (note, duration))
+                         for note in NOTES for duration in NOTE_DURATIONS}),
+]
+BY_NAME = {panel.name: panel for panel in PANELS}
+
+
+def state_key(values):
+    """The key the page looks a state up by: the control values joined with ``|``."""
+    return "|".join(str(value) for value in values)
+
+
+def render_state(name, values):
+    """``(key, JSON text)`` for one state of panel ``name``; runs in a worker process."""
+    rendered = BY_NAME[name].render(*values)
+    payload = {key: rendered[key] for key in ("values", "table", "audio") if rendered.get(key) is not None}
+    if rendered.get("figure") is not None:
+        figure, _ = charts.downsample_figure(rendered["figure"], method=rendered.get("method", "lttb"))
+        if isinstance(figure, dict):
+            figure = go.Figure(figure, _validate=False)
+        payload["figure"] = json.loads(pio.to_json(figure, validate=False))
+    return state_key(values), json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+
+def render_file(name, path):
+    builder, args = BY_NAME[name].files[path]
+    return path, builder(*args)
+
+
+def _write(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def build(out, panels, workers, chunksize=16):
+    """Write the bundle for ``panels`` into ``out``; returns one stats row per panel."""
+    os.makedirs(out, exist_ok=True)
+    rows = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        for panel in panels:
+            start = time.perf_counter()
+            states = panel.states()
+            rendered = pool.map(render_state, itertools.repeat(panel.name), states, chunksize=chunksize)
+            body = ",".join(f"{json.dumps(key)}:{payload}" for key, payload in rendered)
+            size = _write(os.path.join(out, "data", f"{panel.name}.json"), f"{{{body}}}".encode())
+            for path, data in pool.map(render_file, itertools.repeat(panel.name), list(panel.files)):
+                size += _write(os.path.join(out, path), data)
+            rows.append({"panel": panel.name, "states": len(states), "files": len(panel.files),
+                         "bytes": size, "seconds": time.perf_counter() - start})
+
+    shutil.copyfile(PLOTLY_JS, os.path.join(out, "plotly.min.js"))
+    with open(TEMPLATE, encoding="utf-8") as f:
+        page = f.read()
+    manifest = json.dumps([panel.manifest() for panel in panels], ensure_ascii=False)
+    _write(os.path.join(out, "index.html"), page.replace("__MANIFEST__", manifest).encode())
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--out", default="dist", help="directory to write the bundle into")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--panels", nargs="+", choices=list(BY_NAME), default=list(BY_NAME),
+                        help="build only these panels")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = build(args.out, [BY_NAME[name] for name in args.panels], args.workers)
+    print(f"{'panel':<22} {'states':>7} {'files':>6} {'size':>10} {'seconds':>8}")
+    for row in rows:
+        print(f"{row['panel']:<22} {row['states']:>7,} {row['files']:>6} {row['bytes'] / 1e6:>8.2f} MB "
+              f"{row['seconds']:>8.1f}")
+    total = sum(row["states"] for row in rows)
+    print(f"{total:,} states in {time.perf_counter() - start:.1f} s with {args.workers} workers -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""Lesson pages for the MathCraft app.
+
+Each lesson lives in its own module exposing ``render()``. ``app.py`` imports a
+lesson module the first time a student visits it, so a rerun only pays for the
+page that is actually on screen.
+"""
+import importlib
+
+LESSONS = {
+    "🏠 Home & History": "home",
+    "📐 Angles: Degrees vs Radians": "angles",
+    "📏 What ARE Sine & Cosine?": "definitions",
+    "🌀 Unit Circle Explorer": "unit_circle",
+    "📊 Sine & Cosine as Functions": "functions",
+    "🔢 The Famous Limit": "limit",
+    "🎯 Practice Problems": "practice",
+    "🌍 Real-World Applications": "applications",
+    "🧮 Quick Reference Guide": "reference",
+}
+# Position of each lesson, used as its bit in StudentProgress.lessons_mask.
+LESSON_INDEX = {title: i for i, title in enumerate(LESSONS)}
+
+
+def load(lesson_choice):
+    """Import (once per process) and return the module for a lesson title."""
+    return importlib.import_module(f"{__name__}.{LESSONS[lesson_choice]}")
@@ -0,0 +1,83 @@
+"""Hidden admin tools, shown in the sidebar when the URL has ``?admin=1``."""
+import streamlit as st
+
+from lessons import warmup
+from mathcraft import caching, memprofile, profiling
+
+
+def admin_mode():
+    return st.query_params.get("admin") == "1"
+
+
+def profiling_requested():
+    """Whether this rerun should be recorded (env var or the admin checkbox)."""
+    return profiling.env_enabled() or st.session_state.get("profile_enabled", False)
+
+
+def render_caches():
+    with st.sidebar.expander("🗄️ Caches (admin)"):
+        status = warmup.status()
+        if not warmup.enabled():
+            st.caption(f"Warm-up is off ({warmup.ENV_FLAG}=0).")
+        elif status is None or not status.total:
+            st.caption("Warm-up starts once a lesson with figures is shown.")
+        elif status.done < status.total:
+            st.caption(f"Warming up: {status.done:,} of {status.total:,} states built.")
+        else:
+            st.caption(f"Warm-up built {status.total:,} states in {status.seconds:.1f} s of worker time"
+                       + (f" ({status.failed} failed)." if status.failed else "."))
+        stats = caching.stats()
+        st.dataframe(stats, hide_index=True)
+        st.caption(f"{sum(row['MB'] for row in stats):.1f} MB held in {len(stats)} caches.")
+        if st.button("Clear all caches", key="admin_clear_caches"):
+            caching.clear_all()
+
+
+def _toggle_tracing():
+    if st.session_state.memprofile_enabled:
+        memprofile.start()
+    else:
+        memprofile.stop()
+
+
+def render_memory():
+    with st.sidebar.expander("🧠 Memory (admin)"):
+        st.checkbox("Trace sampled reruns (whole server)", value=memprofile.enabled(), key="memprofile_enabled",
+                    on_change=_toggle_tracing, disabled=memprofile.env_enabled() or not memprofile.EVERY,
+                    help=f"Always on while {memprofile.ENV_FLAG}=1 is set. One rerun in {memprofile.EVERY} "
+                         "is traced with tracemalloc; the others run at full speed."
+                         if memprofile.EVERY else "Off: MATHCRAFT_MEMPROFILE_EVERY is 0.")
+        records = profiling.read_log(memprofile.LOG_PATH)
+        if not records:
+            st.caption(f"No reruns logged yet in {memprofile.LOG_PATH}.")
+            return
+        st.caption(f"Last {len(records):,} sampled reruns from {memprofile.LOG_PATH}")
+        st.dataframe(memprofile.summarize(records), hide_index=True)
+        lessons = sorted({record["lesson"] for record in records})
+        lesson = st.selectbox("Top allocation sites of:", lessons, key="memprofile_lesson")
+        sites = memprofile.top_sites(records, lesson)
+        if sites:
+            st.dataframe(sites, hide_index=True)
+        else:
+            st.caption("No allocations retained by this lesson's sampled reruns.")
+        st.download_button("⬇️ Download the allocation report", memprofile.report(records),
+                           file_name="mathcraft_memory_report.txt", mime="text/plain", key="memprofile_download")
+
+
+def render_sidebar():
+    st.sidebar.markdown("---")
+    render_caches()
+    render_memory()
+    with st.sidebar.expander("⏱️ Performance (admin)"):
+        st.checkbox("Record reruns for this session", key="profile_enabled",
+                    disabled=profiling.env_enabled(),
+                    help=f"Always on while {profiling.ENV_FLAG}=1 is set.")
+        records = profiling.read_log()
+        if not records:
+            st.caption(f"No reruns logged yet in {profiling.LOG_PATH}.")
+            return
+        st.caption(f"Last {len(records):,} reruns from {profiling.LOG_PATH}")
+        st.dataframe(profiling.summarize(records), hide_index=True)
+        last = records[-1]
+        st.caption("Most recent rerun")
+        st.json({k: last[k] for k in ("lesson", "total_ms", "spans_ms", "figures", "charts")}, expanded=False)
@@ -0,0 +1,128 @@
+"""📐 Angles: Degrees vs Radians"""
+import streamlit as st
+import math
+import os
+from pathlib import Path
+
+from lessons.panels import panel
+from mathcraft import bulk
+from mathcraft.angles import BY_DEGREES
+
+
+def _discard_bulk_result():
+    result = st.session_state.pop("bulk_result", None)
+    if result is not None and os.path.exists(result["path"]):
+        os.remove(result["path"])
+
+
+@panel("bulk_converter")
+def _bulk_panel():
+    uploaded = st.file_uploader("Upload a CSV or text file of angles:", type=["csv", "txt"], key="bulk_file")
+    if uploaded is None:
+        st.caption("One angle per line, or a column of a CSV file. Every row gets degrees, radians, "
+                   "the π-fraction, sin, cos and tan. Radians may also be written like 3π/4 or 0.75pi.")
+        return
+
+    unit = st.radio("The angles are in:", bulk.UNITS, horizontal=True, key="bulk_unit")
+    has_header, names = bulk.sniff(uploaded)
+    if not names:
+        st.info("This file has no rows to convert.")
+        return
+    column = 0
+    if len(names) > 1:
+        column = st.selectbox("Column with the angles:", range(len(names)), format_func=lambda i: names[i],
+                              key="bulk_column")
+    source = (uploaded.file_id, unit, column)
+
+    if st.button("🔄 Convert file", key="bulk_convert"):
+        _discard_bulk_result()
+        bar = st.progress(0.0, text="Converting…")
+        # Chunks go straight to disk, so a large file never sits in memory as a table.
+        fd, path = bulk.new_output()
+        progress = bulk.Progress(0, 0, 0, 0.0)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as out:
+                for progress in bulk.convert_file(uploaded, out, unit, column, has_header):
+                    bar.progress(min(progress.bytes_read / max(uploaded.size, 1), 1.0),
+                                 text=f"{progress.rows:,} rows converted")
+        except ValueError as error:
+            os.remove(path)
+            st.error(f"Couldn't read this file as CSV or text: {error}")
+            return
+        finally:
+            uploaded.seek(0)
+            bar.empty()
+        st.session_state.bulk_result = {"source": source, "path": path, **progress._asdict()}
+
+    result = st.session_state.get("bulk_result")
+    if result is None or result["source"] != source:
+        return
+    if not os.path.exists(result["path"]):
+        st.session_state.pop("bulk_result")
+        st.caption("The converted file has expired; convert it again to download it.")
+        return
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Rows", f"{result['rows']:,}")
+    col2.metric("Throughput", f"{result['rows'] / max(result['seconds'], 1e-9):,.0f} rows/s")
+    col3.metric("Unreadable rows", f"{result['invalid']:,}")
+    # A callable is only read when the button is clicked, so reruns don't load the file.
+    st.download_button("⬇️ Download the conversions (CSV)", Path(result["path"]).read_bytes, key="bulk_download",
+                       file_name=f"{os.path.splitext(uploaded.name)[0]}_converted.csv", mime="text/csv")
+
+
+def render():
+    st.header("📐 Understanding Angles: Two Ways to Measure")
+
+    st.markdown("""
+    ### 🤔 Why Do We Need Two Systems?
+    Think of it like measuring distance in **miles** vs **kilometers**—both work, but each has its best uses!
+    """)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("""
+        #### 🌟 **Degrees** (Familiar Friend)
+        - **Full circle**: 360°
+        - **Half circle**: 180°  
+        - **Right angle**: 90°
+        - **Best for**: Everyday measurements, construction, navigation
+
+        **Why 360?** Ancient Babylonians loved the number 60 (it divides evenly many ways), and 360 = 6 × 60!
+        """)
+
+    with col2:
+        st.markdown("""
+        #### 🎯 **Radians** (Mathematical Natural)
+        - **Full circle**: 2π ≈ 6.28
+        - **Half circle**: π ≈ 3.14
+        - **Right angle**: π/2 ≈ 1.57  
+        - **Best for**: Calculus, physics, advanced math
+
+        **What's a radian?** The angle when the arc length equals the radius!
+        """)
+
+    st.markdown("### 🔄 Interactive Converter")
+    converter_mode = st.radio("Convert:", ["Degrees → Radians", "Radians → Degrees", "📦 A whole file (CSV or text)"])
+
+    if converter_mode == "📦 A whole file (CSV or text)":
+        _bulk_panel()
+    elif converter_mode == "Degrees → Radians":
+        degrees_input = st.number_input("Enter degrees:", value=90.0, step=1.0)
+        radians_result = degrees_input * math.pi / 180
+        st.success(f"{degrees_input}° = {radians_result:.4f} radians = {radians_result/math.pi:.2f}π radians")
+    else:
+        radians_input = st.number_input("Enter radians:", value=1.57, step=0.1)
+        degrees_result = radians_input * 180 / math.pi
+        st.success(f"{radians_input} radians = {degrees_result:.2f}°")
+
+    # Visual comparison
+    st.markdown("### 📊 Common Angles Comparison")
+    compared = [BY_DEGREES[d] for d in (90, 180, 360, 30, 45, 60)]
+    angle_df = {
+        "Angle Description": ["Right angle", "Straight angle", "Full rotation", "30°", "45°", "60°"],
+        "Degrees": [f"{entry.degrees}°" for entry in compared],
+        "Radians (Decimal)": [f"{entry.radians:.2f}" for entry in compared],
+        "Radians (π form)": [entry.label for entry in compared]
+    }
+    st.table(angle_df)
@@ -0,0 +1,342 @@
+"""🌍 Real-World Applications"""
+import streamlit as st
+import numpy as np
+import pandas as pd
+import math
+
+from lessons import charts
+from lessons.panels import panel
+from mathcraft import figspec, harmonics, profiling
+from mathcraft.audio import NOTES, SAMPLE_RATE, render_wav, waveform_view
+from mathcraft.caching import cached
+
+# Ocean wave animation grid: distance samples, frames per period of the
+# slowest train, and the longest loop (in those periods) and most frames.
+WAVE_X = np.linspace(0, 100, 500)
+WAVE_FRAMES = 40
+WAVE_MAX_LOOP = 4
+WAVE_MAX_FRAMES = 80
+
+HARMONIC_PRESETS = {"🟦 Square": "square", "📐 Sawtooth": "sawtooth", "🔺 Triangle": "triangle", "〰️ Sine": "sine"}
+# Samples across the harmonic plot window; harmonics faster than it can show are left out.
+HARMONIC_PLOT_SAMPLES = 2048
+
+
+def wave_loop(periods):
+    """``(loop, periods)``: a loop length every train repeats within, and the periods to draw.
+
+    Whole-second periods loop over their least common multiple when it is at
+    most ``WAVE_MAX_LOOP`` times the slowest one (8 s and 6 s loop over 24 s).
+    Otherwise the loop is that long and each period is snapped to the
+    nearest whole fraction of it, so the last frame still runs into the first.
+    """
+    slowest = max(periods)
+    if all(float(period).is_integer() for period in periods):
+        loop = math.lcm(*(int(period) for period in periods))
+        if loop <= WAVE_MAX_LOOP * slowest:
+            return float(loop), tuple(float(period) for period in periods)
+    loop = WAVE_MAX_LOOP * slowest
+    return float(loop), tuple(loop / max(round(loop / period), 1) for period in periods)
+
+
+@cached(max_entries=32)
+def wave_grid(trains):
+    """Evaluate h(x, t) = A sin(kx − ωt + φ) for every wave train at once.
+
+    ``trains`` is a tuple of (A, λ, T, φ). Returns the time axis and a
+    read-only array of shape (trains, frames, len(WAVE_X)); the clip covers
+    one ``wave_loop``, so it repeats seamlessly.
+    """
+    params = np.array(trains, dtype=float)
+    loop, periods = wave_loop(tuple(params[:, 2]))
+    n_frames = min(WAVE_FRAMES * round(loop / params[:, 2].max()), WAVE_MAX_FRAMES)
+    amplitude, wavelength, _, phase = (params[:, i, None, None] for i in range(4))
+    period = np.array(periods)[:, None, None]
+    t = np.linspace(0, loop, n_frames, endpoint=False)
+    h = amplitude * np.sin(2 * math.pi / wavelength * WAVE_X - 2 * math.pi / period * t[:, None] + phase)
+    h.flags.writeable = False
+    return t, h
+
+
+def _wave_traces(h, frame):
+    traces = []
+    if len(h) > 1:
+        for i, train in enumerate(h):
+            traces.append(figspec.wave(WAVE_X, train[frame], name=f'Wave {i + 1}', mode='lines', width=1,
+                                       dash='dash'))
+    traces.append(figspec.wave(WAVE_X, h[:, frame].sum(axis=0), name='Ocean Wave', mode='lines', color='blue'))
+    return traces
+
+
+def _wave_frame_traces(h, frame):
+    # Frames only carry the heights, as float32; x and styling come from the
+    # first frame's traces, which keeps the payload small.
+    heights = list(h[:, frame]) if len(h) > 1 else []
+    heights.append(h[:, frame].sum(axis=0))
+    return [{"type": "scatter", "y": y.astype(np.float32)} for y in heights]
+
+
+@profiling.timed_figure("ocean_wave")
+@cached(max_entries=32)
+def ocean_wave_animation(trains):
+    t, h = wave_grid(trains)
+    frames = [{"data": _wave_frame_traces(h, i), "name": f"{t_i:.2f}"} for i, t_i in enumerate(t)]
+
+    y_max = sum(train[0] for train in trains) * 1.1
+    still = dict(mode="immediate", frame=dict(duration=0, redraw=False), transition=dict(duration=0))
+    layout = figspec.layout(
+        title="Ocean Wave Pattern",
+        xaxis_title="Distance",
+        yaxis_title="Wave Height",
+        xaxis=dict(range=[WAVE_X[0], WAVE_X[-1]]),
+        yaxis=dict(range=[-y_max, y_max]),
+        height=400,
+        sliders=[dict(
+            currentvalue=dict(prefix="t = ", suffix=" s"), pad=dict(t=40),
+            steps=[dict(label=f["name"], method="animate", args=[[f["name"]], still]) for f in frames]
+        )],
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0, y=-0.15, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="▶ Play", method="animate",
+                     args=[None, dict(frame=dict(duration=1000 * (t[1] - t[0]), redraw=False),
+                                      transition=dict(duration=0), fromcurrent=True)]),
+                dict(label="⏸ Pause", method="animate", args=[[None], still]),
+            ]
+        )]
+    )
+    return figspec.figure(_wave_traces(h, 0), layout, shapes=[figspec.hline(0)], frames=frames)
+
+
+@cached(max_entries=16)
+def note_clip(notes, duration):
+    return render_wav([NOTES[note] for note in notes], duration)
+
+
+@profiling.timed_figure("sound_wave")
+@cached(max_entries=32)
+def sound_figure(notes, duration, window_ms):
+    _, samples = note_clip(notes, duration)
+    t, y = waveform_view(samples, min(window_ms / 1000, duration))
+    label = " + ".join(notes)
+    return figspec.figure(
+        [figspec.wave(t, y, name=label, mode='lines', color='purple', width=2)],
+        figspec.layout(title=f"Sound Wave: {label} (first {window_ms} ms at {SAMPLE_RATE:,} samples/s)",
+                       xaxis_title="Time (seconds)", yaxis_title="Amplitude", height=300),
+    )
+
+
+# The sines behind the harmonic builder depend only on the notes, the preset's
+# harmonic numbers and the time grid, never on the coefficients: editing a
+# coefficient or the number of terms reuses them (fewer terms is a slice).
+@cached(max_entries=8)
+def harmonic_basis(notes, step, window_ms):
+    t = np.linspace(0, window_ms / 1000, HARMONIC_PLOT_SAMPLES)
+    n = harmonics.harmonic_numbers(step, harmonics.MAX_TERMS)
+    return t, harmonics.basis(np.multiply.outer([NOTES[note] for note in notes], n), t)
+
+
+@cached(max_entries=2)
+def harmonic_cycle(step):
+    return harmonics.cycle_basis(harmonics.harmonic_numbers(step, harmonics.MAX_TERMS))
+
+
+def _term_frequencies(notes, step, terms):
+    return np.multiply.outer([NOTES[note] for note in notes], harmonics.harmonic_numbers(step, terms))
+
+
+@cached(max_entries=16)
+def harmonic_clip(notes, step, coefficients, duration):
+    terms = len(coefficients)
+    tables = harmonics.wavetables(coefficients, harmonic_cycle(step)[:terms],
+                                  _term_frequencies(notes, step, terms))
+    return render_wav([NOTES[note] for note in notes], duration, table=tables)
+
+
+@profiling.timed_figure("harmonic_wave")
+@cached(max_entries=32)
+def harmonic_figure(notes, step, coefficients, window_ms):
+    terms = len(coefficients)
+    t, basis = harmonic_basis(notes, step, window_ms)
+    nyquist = HARMONIC_PLOT_SAMPLES / 2 / (window_ms / 1000)
+    shown = harmonics.band_limited(coefficients, _term_frequencies(notes, step, terms), nyquist)
+    y = harmonics.evaluate(shown, basis[:, :terms]) / len(notes)
+    label = " + ".join(notes)
+    return figspec.figure(
+        [figspec.wave(t * 1000, y, name=label, color="purple", width=2)],
+        figspec.layout(title=f"{label}: {terms} harmonic{'s' if terms > 1 else ''} per note",
+                       xaxis_title="Time (milliseconds)", yaxis_title="Amplitude", height=300),
+        shapes=[figspec.hline(0)],
+    )
+
+
+@profiling.timed_figure("harmonic_spectrum")
+@cached(max_entries=16)
+def spectrum_figure(notes, step, coefficients, duration):
+    _, samples = harmonic_clip(notes, step, coefficients, duration)
+    frequencies, amplitudes = harmonics.spectrum(samples)
+    top = _term_frequencies(notes, step, len(coefficients)).max()
+    shown = frequencies <= min(SAMPLE_RATE / 2, 1.1 * top + 100)
+    return figspec.figure(
+        [figspec.wave(frequencies[shown], amplitudes[shown], name="spectrum", color="darkorange", width=2)],
+        figspec.layout(title=f"Spectrum (FFT of the first {min(len(samples), harmonics.SPECTRUM_SAMPLES):,} samples)",
+                       xaxis_title="Frequency (Hz)", yaxis_title="Amplitude", height=300),
+    )
+
+
+@panel("pyramid")
+def _pyramid_panel():
+    # Interactive pyramid calculator
+    st.markdown("#### 🧮 Build Your Own Pyramid")
+    base_length = st.slider("Base length (meters):", 50, 300, 230)
+    slope_angle = st.slider("Slope angle (degrees):", 45, 65, 52)
+
+    # Calculate height
+    height = (base_length / 2) * math.tan(math.radians(slope_angle))
+    volume = (base_length ** 2 * height) / 3
+
+    st.metric("Height", f"{height:.1f} meters")
+    st.metric("Volume", f"{volume:,.0f} cubic meters")
+
+
+@panel("ocean_wave")
+def _wave_panel():
+    # Wave controls
+    wave_amplitude = st.slider("Wave height (A):", 0.5, 5.0, 2.0, 0.1)
+    wavelength = st.slider("Wavelength (λ):", 5, 50, 20, 1)
+    period = st.slider("Period (T) seconds:", 2, 20, 8, 1)
+    phase = st.slider("Phase shift (φ):", -math.pi, math.pi, 0.0, math.pi/12, format="%.2f")
+    trains = [(wave_amplitude, wavelength, period, phase)]
+
+    if st.checkbox("➕ Add a second wave train (interference)"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            amplitude_2 = st.slider("Second height (A₂):", 0.5, 5.0, 1.0, 0.1)
+        with col2:
+            wavelength_2 = st.slider("Second wavelength (λ₂):", 5, 50, 15, 1)
+        with col3:
+            period_2 = st.slider("Second period (T₂):", 2, 20, 6, 1)
+        trains.append((amplitude_2, wavelength_2, period_2, 0.0))
+
+    # Calculate derived values
+    k = 2 * math.pi / wavelength  # wave number
+    omega = 2 * math.pi / period  # angular frequency
+
+    st.markdown(f"**k** = 2π/λ = {k:.3f} rad/m, **ω** = 2π/T = {omega:.3f} rad/s, "
+                f"wave speed = λ/T = {wavelength / period:.2f} m/s")
+
+    # Press play to watch the wave travel; frames run in the browser.
+    fig = ocean_wave_animation(tuple(trains))
+    charts.plotly_chart(fig)
+
+
+@panel("sound")
+def _sound_panel():
+    sound_mode = st.radio("Play:", ["Single note", "Chord", "Build from harmonics"], horizontal=True)
+    if sound_mode == "Build from harmonics":
+        _harmonic_controls()
+        return
+    if sound_mode == "Single note":
+        selected_notes = [st.selectbox("Choose a musical note:", list(NOTES.keys()))]
+    else:
+        selected_notes = st.multiselect("Choose the notes of your chord:", list(NOTES.keys()), ["C4", "E4", "G4"])
+        if not selected_notes:
+            st.info("Pick at least one note to hear the chord.")
+            return
+    duration = st.slider("Duration (seconds):", 0.1, 30.0, 0.5, 0.1)
+
+    for note in selected_notes:
+        frequency = NOTES[note]
+        col1, col2 = st.columns(2)
+        col1.metric(f"Frequency ({note})", f"{frequency} Hz")
+        col2.metric(f"Period ({note})", f"{1/frequency:.4f} seconds")
+
+    # Generate the sound itself: 44.1 kHz PCM, one cached clip per chord and duration
+    notes = tuple(sorted(selected_notes, key=list(NOTES).index))
+    wav_bytes, _ = note_clip(notes, duration)
+    st.audio(wav_bytes, format="audio/wav")
+
+    window_ms = st.select_slider("Plot window (milliseconds):", [5, 10, 20, 50, 100, 500, 1000], 20)
+    fig = sound_figure(notes, duration, window_ms)
+    charts.plotly_chart(fig, method="minmax")
+
+
+def _harmonic_controls():
+    st.markdown("""
+    #### f(t) = b₁ sin(2π·f₀·t) + b₂ sin(2π·2f₀·t) + b₃ sin(2π·3f₀·t) + ...
+    Real instruments add **harmonics**, sines at whole multiples of the note's frequency f₀.
+    Enough of the right ones make a square, sawtooth or triangle wave.
+    """)
+    col1, col2 = st.columns(2)
+    with col1:
+        preset = HARMONIC_PRESETS[st.selectbox("Wave shape:", list(HARMONIC_PRESETS), key="harmonic_preset")]
+        terms = st.slider("Number of terms:", 1, harmonics.MAX_TERMS, 10, key="harmonic_terms")
+    with col2:
+        selected_notes = st.multiselect("Notes:", list(NOTES.keys()), ["C4"], key="harmonic_notes")
+        duration = st.slider("Duration (seconds):", 0.1, 10.0, 1.0, 0.1, key="harmonic_duration")
+    if not selected_notes:
+        st.info("Pick at least one note to build the wave on.")
+        return
+
+    n, coefficients = harmonics.series(preset, terms)
+    step = harmonics.PRESETS[preset][0]
+    with st.expander("✏️ Edit the coefficients"):
+        edited = st.data_editor(pd.DataFrame({"harmonic": n, "coefficient": coefficients}),
+                                disabled=["harmonic"], hide_index=True, key=f"harmonic_table_{preset}_{terms}")
+        coefficients = edited["coefficient"].fillna(0).to_numpy(dtype=float)
+    if not np.any(coefficients):
+        st.info("Every coefficient is 0, so there is nothing to hear.")
+        return
+
+    notes = tuple(sorted(selected_notes, key=list(NOTES).index))
+    coefficients = tuple(coefficients.tolist())
+    wav_bytes, _ = harmonic_clip(notes, step, coefficients, duration)
+    st.audio(wav_bytes, format="audio/wav")
+
+    window_ms = st.select_slider("Plot window (milliseconds):", [5, 10, 20, 50, 100], 10, key="harmonic_window")
+    charts.plotly_chart(harmonic_figure(notes, step, coefficients, window_ms))
+    charts.plotly_chart(spectrum_figure(notes, step, coefficients, duration), method="minmax")
+    st.caption("Each spike in the spectrum is one harmonic: its position is the frequency, its height how loud that harmonic is.")
+
+
+def render():
+    st.header("🌍 Trigonometry in the Real World")
+
+    st.markdown("""
+    ### 🏗️ Where Ancient Mathematics Meets Modern Life
+
+    From the pyramids of ancient Egypt to modern skyscrapers, trigonometry shapes our world!
+    """)
+
+    app_choice = st.selectbox("Explore an application:", 
+                             ["🏛️ Ancient Architecture", "🌊 Ocean Waves", "🎵 Sound & Music"])
+
+    if app_choice == "🏛️ Ancient Architecture":
+        st.subheader("🏛️ Building Like the Ancients")
+
+        _pyramid_panel()
+
+    elif app_choice == "🌊 Ocean Waves":
+        st.subheader("🌊 The Mathematics of Ocean Waves")
+
+        st.markdown("""
+        #### Wave Equation: h(x,t) = A sin(kx - ωt + φ)
+
+        Where:
+        - **A**: Amplitude (wave height)
+        - **k**: Wave number (2π/wavelength)
+        - **ω**: Angular frequency (2π/period)
+        - **φ**: Phase shift
+        """)
+
+        _wave_panel()
+
+    else:  # Sound & Music
+        st.subheader("🎵 The Trigonometry of Sound")
+
+        st.markdown("""
+        #### Musical Notes as Sine Waves
+        Every musical note is a sine wave with a specific frequency!
+        """)
+
+        _sound_panel()
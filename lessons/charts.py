@@ -0,0 +1,93 @@
+"""Single entry point for drawing Plotly charts in the lessons.
+
+Every chart goes through ``plotly_chart`` so long line traces are reduced to
+roughly one point per horizontal pixel before they are serialized and sent to
+the browser. Set ``MATHCRAFT_CHART_STATS=1`` to print the original and emitted
+point counts under each chart.
+
+Charts may be ``go.Figure`` objects or plain-dict specs from
+``mathcraft.figspec``; specs are wrapped without running Plotly's validators.
+"""
+import os
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+
+from mathcraft import profiling
+from mathcraft.downsample import downsample_indices
+
+# Widest plot area a lesson column gets in the wide layout, in pixels.
+CHART_WIDTH = 700
+SHOW_STATS = os.environ.get("MATHCRAFT_CHART_STATS") == "1"
+
+
+def _get(obj, name):
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def _points(trace):
+    y = _get(trace, "y")
+    return 0 if y is None else len(y)
+
+
+def _reducible(trace, width):
+    x, y, mode = _get(trace, "x"), _get(trace, "y"), _get(trace, "mode") or ""
+    if (_get(trace, "type") or "scatter") != "scatter" or x is None or y is None or len(y) <= width:
+        return False
+    if "markers" in mode or "text" in mode:
+        return False
+    return bool(np.all(np.diff(np.asarray(x, dtype=float)) >= 0))
+
+
+def _downsample_spec(spec, targets, width, method):
+    data = list(spec["data"])
+    for i in targets:
+        trace = data[i]
+        keep = downsample_indices(trace["x"], trace["y"], width, method)
+        data[i] = dict(trace, x=np.asarray(trace["x"])[keep], y=np.asarray(trace["y"])[keep])
+    return dict(spec, data=data)
+
+
+def downsample_figure(fig, width=CHART_WIDTH, method="lttb"):
+    """Return ``(figure, report)`` with long line traces downsampled.
+
+    The input figure or spec is never modified (it may be shared through a
+    cache); a copy is made only when at least one trace needs reducing. Animation frames
+    are left alone because their traces reuse the base trace's x values.
+    ``report`` holds the ``original`` and ``emitted`` point counts.
+    """
+    data, frames = _get(fig, "data"), _get(fig, "frames") or ()
+    frame_points = sum(_points(trace) for frame in frames for trace in _get(frame, "data") or ())
+    original = sum(_points(trace) for trace in data) + frame_points
+    targets = [i for i, trace in enumerate(data) if _reducible(trace, width)]
+
+    if targets and isinstance(fig, dict):
+        fig = _downsample_spec(fig, targets, width, method)
+    elif targets:
+        fig = go.Figure(fig)
+        for i in targets:
+            trace = fig.data[i]
+            keep = downsample_indices(trace.x, trace.y, width, method)
+            trace.update(x=np.asarray(trace.x)[keep], y=np.asarray(trace.y)[keep])
+
+    emitted = sum(_points(trace) for trace in _get(fig, "data")) + frame_points
+    return fig, {"original": original, "emitted": emitted}
+
+
+def plotly_chart(fig, width=CHART_WIDTH, method="lttb", **kwargs):
+    """Downsample ``fig`` and draw it with ``st.plotly_chart``; returns the report."""
+    fig, report = downsample_figure(fig, width, method)
+    if isinstance(fig, dict):
+        # figspec output is already valid; st.plotly_chart would re-validate a dict.
+        fig = go.Figure(fig, _validate=False)
+    kwargs.setdefault("use_container_width", True)
+    st.plotly_chart(fig, **kwargs)
+    if profiling.current() is not None:
+        # Same serialization st.plotly_chart sends, so only paid while profiling.
+        payload = len(pio.to_json(fig, validate=False).encode())
+        profiling.record_chart(fig.layout.title.text, payload, report["original"], report["emitted"])
+    if SHOW_STATS:
+        st.caption(f"Chart points: {report['original']:,} computed → {report['emitted']:,} sent")
+    return report
@@ -0,0 +1,38 @@
+"""Drag-to-rotate circle diagram, drawn in the browser.
+
+A bundled custom component (``circle_dial_frontend/index.html``: plain SVG
+and JavaScript, no build step, nothing loaded from the network). The circle,
+the radius ray and the cos/sin projections follow the pointer at any angle
+without a server round trip. The angle comes back to Python when the point
+is released, or at most ``live_rate`` times a second while dragging, so a
+whole drag costs one rerun of the calling panel instead of one per slider
+step, and that rerun only has the values around the diagram to update.
+"""
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "circle_dial_frontend")
+_component = components.declare_component("circle_dial", path=_FRONTEND)
+
+# Updates per second while dragging, for callers that want live values.
+LIVE_RATE = 4
+
+
+def circle_dial(key, default=45, radius=1, extent=None, snap=0, live_rate=0, decimals=3,
+                unit="degrees", size=500):
+    """Draw a circle whose point can be dragged; return its angle in degrees.
+
+    Dragged angles are rounded to 0.1°, or to multiples of ``snap`` degrees.
+    Whole-degree angles come back as ints, so ``angles.at_degrees`` finds the
+    special ones in its table. ``extent`` is the axis range each way (default
+    1.3 × radius), ``decimals`` the precision of the coordinate labels,
+    ``unit`` ("degrees" or "radians") how the title shows θ, and ``size`` the
+    widest the diagram gets, in pixels.
+    """
+    angle = st.session_state.get(key, default)
+    value = _component(angle=angle, radius=radius, extent=extent or 1.3 * radius, snap=snap,
+                       live_rate=live_rate, decimals=decimals, unit=unit, size=size,
+                       key=key, default=angle)
+    return int(value) if float(value).is_integer() else value
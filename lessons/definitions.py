@@ -0,0 +1,296 @@
+"""📏 What ARE Sine & Cosine?"""
+import streamlit as st
+import math
+
+from lessons import charts
+from lessons.circle_dial import circle_dial
+from lessons.panels import panel
+from mathcraft import figspec, profiling, triangles
+from mathcraft.caching import cached
+
+
+# 15 slider positions; shared by every session.
+@profiling.timed_figure("right_triangle")
+@cached(max_entries=16)
+def triangle_figure(angle_deg, hypotenuse=10):
+    opposite = hypotenuse * math.sin(math.radians(angle_deg))
+    adjacent = hypotenuse * math.cos(math.radians(angle_deg))
+
+    return figspec.figure(
+        [
+            # Triangle, the angle θ and the right angle marker
+            figspec.right_triangle(adjacent, opposite, name='Triangle', showlegend=False),
+            figspec.angle_arc(angle_deg, name='θ', showlegend=False),
+            figspec.right_angle_marker(adjacent, showlegend=False),
+        ],
+        figspec.layout(
+            title=f"Right Triangle: θ = {angle_deg}°",
+            xaxis=dict(range=[-1, max(adjacent+2, 12)], scaleanchor="y", scaleratio=1),
+            yaxis=dict(range=[-2, max(opposite+2, 8)]),
+            height=400, showlegend=False,
+        ),
+        annotations=[
+            # Label sides
+            figspec.annotation(adjacent/2, -0.5, f"Adjacent = {adjacent:.1f}", color='green'),
+            figspec.annotation(adjacent+0.5, opposite/2, f"Opposite = {opposite:.1f}", color='red', textangle=90),
+            figspec.annotation(adjacent/2-1, opposite/2+0.5, f"Hypotenuse = {hypotenuse:.1f}",
+                               color='blue', textangle=angle_deg),
+            figspec.annotation(1.5, 0.3, f"θ = {angle_deg}°", size=14, color='purple'),
+        ],
+    )
+
+
+# 10 radii × 25 angles.
+@profiling.timed_figure("circle_definition")
+@cached(max_entries=256)
+def circle_figure(circle_radius, circle_angle):
+    angle_rad = math.radians(circle_angle)
+    x_coord = circle_radius * math.cos(angle_rad)
+    y_coord = circle_radius * math.sin(angle_rad)
+    axis_range = circle_radius + 1
+
+    return figspec.figure(
+        [
+            figspec.circle(circle_radius, name='Circle', showlegend=False),
+            figspec.axes(axis_range, showlegend=False),
+            # Radius line to the point on the circle
+            figspec.ray(x_coord, y_coord, marker_size=10, name='Radius', showlegend=False),
+            figspec.point(x_coord, y_coord, f'({x_coord:.1f}, {y_coord:.1f})', showlegend=False),
+            # Coordinate lines
+            figspec.projections(x_coord, y_coord, names=('y-coordinate', 'x-coordinate'), showlegend=False),
+        ],
+        figspec.layout(
+            title=f"Circle Definition: r = {circle_radius}, θ = {circle_angle}°",
+            xaxis=dict(scaleanchor="y", scaleratio=1, range=[-axis_range, axis_range]),
+            yaxis=dict(range=[-axis_range, axis_range]),
+            height=400,
+        ),
+        annotations=[
+            figspec.annotation(x_coord/2, -0.3, f"x = {x_coord:.1f}", color='blue'),
+            figspec.annotation(-0.3, y_coord/2, f"y = {y_coord:.1f}", color='green'),
+            figspec.annotation(1, 0.5, f"θ = {circle_angle}°", color='purple'),
+        ],
+    )
+
+
+# Given parts per configuration: (label, default) in triangles.GIVEN order.
+SOLVER_INPUTS = {
+    "SSS": (("Side a", 5.0), ("Side b", 6.0), ("Side c", 7.0)),
+    "SAS": (("Side a", 5.0), ("Side b", 7.0), ("Angle C between them (°)", 49.0)),
+    "ASA": (("Angle A (°)", 40.0), ("Side c between them", 10.0), ("Angle B (°)", 60.0)),
+    "AAS": (("Angle A (°)", 40.0), ("Angle B (°)", 60.0), ("Side a, opposite A", 7.0)),
+    "SSA": (("Side a", 6.0), ("Side b", 8.0), ("Angle A, opposite a (°)", 40.0)),
+}
+SOLUTION_STYLES = (("blue", None), ("orange", "dash"))
+
+
+@profiling.timed_figure("triangle_solver")
+@cached(max_entries=64)
+def solver_figure(case, given):
+    solved = triangles.solve(case, *given)
+    traces, annotations = [], []
+    for k in range(solved.count):
+        a, b, c, A = (float(part[k]) for part in (solved.a, solved.b, solved.c, solved.A))
+        corners = triangles.vertices(a, b, c, A)
+        color, dash = SOLUTION_STYLES[k]
+        closed = corners[[0, 1, 2, 0]]
+        traces.append(figspec.trace(closed[:, 0], closed[:, 1], mode="lines+markers", color=color, width=3,
+                                    dash=dash, marker_size=8, name=f"Triangle {k + 1}"))
+        for (x, y), label in zip(corners, "ABC"):
+            annotations.append(figspec.annotation(x, y + 0.4, label if k == 0 else f"{label}₂",
+                                                  size=14, color=color))
+        for (start, end), side in zip(((1, 2), (0, 2), (0, 1)), (a, b, c)):
+            x, y = (corners[start] + corners[end]) / 2
+            annotations.append(figspec.annotation(x, y - 0.4, f"{side:.2f}", color=color))
+    return figspec.figure(
+        traces,
+        figspec.layout(
+            title=f"{case}: {solved.count} triangle{'' if solved.count == 1 else 's'}",
+            xaxis=dict(scaleanchor="y", scaleratio=1, zeroline=False), yaxis=dict(zeroline=False),
+            height=400, showlegend=solved.count > 1,
+        ),
+        annotations=annotations,
+    )
+
+
+@panel("triangle_solver")
+def _solver_panel():
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("""
+        #### 🔺 Any triangle, from any three parts
+
+        **Law of Sines**: a / sin A = b / sin B = c / sin C
+
+        **Law of Cosines**: c² = a² + b² − 2ab·cos C
+
+        With SSA (two sides and an angle that is *not* between them) there can be
+        **zero, one or two** triangles: the ambiguous case!
+        """)
+        case = st.selectbox("What do you know?", triangles.CASES, key="solver_case",
+                            format_func=lambda c: f"{c} ({', '.join(triangles.GIVEN[c])})")
+        given = tuple(st.number_input(label, min_value=0.01, value=default, step=1.0, key=f"solver_{case}_{i}")
+                      for i, (label, default) in enumerate(SOLVER_INPUTS[case]))
+
+        solved = triangles.solve(case, *given)
+        if solved.count == 0:
+            st.error("These parts do not make a triangle. Check that the angles add up to less than 180° "
+                     "and that each side is shorter than the other two together.")
+        else:
+            table = {"": ["a", "b", "c", "A (°)", "B (°)", "C (°)", "Area", "Perimeter"]}
+            for k in range(solved.count):
+                table[f"Triangle {k + 1}"] = [f"{float(getattr(solved, part)[k]):.3f}" for part in
+                                              ("a", "b", "c", "A", "B", "C", "area", "perimeter")]
+            st.table(table)
+
+    with col2:
+        charts.plotly_chart(solver_figure(case, given))
+
+
+@panel("right_triangle")
+def _triangle_panel():
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("""
+        #### 📏 In a Right Triangle:
+
+        **SINE** = **Opposite** ÷ **Hypotenuse**
+
+        **COSINE** = **Adjacent** ÷ **Hypotenuse**
+
+        **TANGENT** = **Opposite** ÷ **Adjacent**
+
+        #### 🎯 Memory Device: SOH-CAH-TOA
+        - **S**ine = **O**pposite / **H**ypotenuse
+        - **C**osine = **A**djacent / **H**ypotenuse  
+        - **T**angent = **O**pposite / **A**djacent
+        """)
+
+        # Interactive triangle
+        angle_deg = st.slider("Choose angle θ (degrees):", 10, 80, 30, 5, key="triangle_angle")
+
+        # Calculate triangle sides (using hypotenuse = 10 for simplicity)
+        hypotenuse = 10
+        opposite = hypotenuse * math.sin(math.radians(angle_deg))
+        adjacent = hypotenuse * math.cos(math.radians(angle_deg))
+
+        # Calculate ratios
+        sine_ratio = opposite / hypotenuse
+        cosine_ratio = adjacent / hypotenuse
+        tangent_ratio = opposite / adjacent
+
+        st.markdown(f"""
+        #### 📊 For θ = {angle_deg}°:
+        - **Opposite side**: {opposite:.2f}
+        - **Adjacent side**: {adjacent:.2f}  
+        - **Hypotenuse**: {hypotenuse:.2f}
+
+        #### 🧮 The Ratios:
+        - **sin({angle_deg}°)** = {opposite:.2f} ÷ {hypotenuse:.2f} = **{sine_ratio:.3f}**
+        - **cos({angle_deg}°)** = {adjacent:.2f} ÷ {hypotenuse:.2f} = **{cosine_ratio:.3f}**
+        - **tan({angle_deg}°)** = {opposite:.2f} ÷ {adjacent:.2f} = **{tangent_ratio:.3f}**
+        """)
+
+    with col2:
+        fig_triangle = triangle_figure(angle_deg, hypotenuse)
+        charts.plotly_chart(fig_triangle)
+
+
+@panel("circle_definition")
+def _circle_panel():
+    col1, col2 = st.columns([1, 1])
+
+    with col1:
+        st.markdown("""
+        #### 🎯 On ANY Circle (not just unit circle):
+
+        When you have a circle and draw a line from the center at angle θ:
+
+        **COSINE** = **x-coordinate** ÷ **radius**
+
+        **SINE** = **y-coordinate** ÷ **radius**
+
+        #### 🌟 Special Case: Unit Circle (radius = 1)
+
+        **COSINE** = **x-coordinate** (exactly!)
+
+        **SINE** = **y-coordinate** (exactly!)
+
+        This is why the unit circle is so powerful—no division needed!
+        """)
+
+        # Interactive circle
+        circle_radius = st.slider("Circle radius:", 1, 10, 5, 1, key="circle_radius")
+        dragging = st.toggle("✋ Drag the point instead of using a slider", value=True, key="circle_drag")
+        if dragging:
+            # The dial sits in the right column; its angle drives the text here.
+            with col2:
+                circle_angle = circle_dial("circle_dial", default=45, radius=circle_radius,
+                                           extent=circle_radius + 1, decimals=1, size=400)
+        else:
+            circle_angle = st.slider("Angle θ (degrees):", 0, 360, 45, 15, key="circle_angle")
+
+        # Calculate coordinates
+        angle_rad = math.radians(circle_angle)
+        x_coord = circle_radius * math.cos(angle_rad)
+        y_coord = circle_radius * math.sin(angle_rad)
+
+        # Calculate the ratios
+        cosine_from_circle = x_coord / circle_radius
+        sine_from_circle = y_coord / circle_radius
+
+        st.markdown(f"""
+        #### 📊 For radius = {circle_radius}, θ = {circle_angle}°:
+        - **Point coordinates**: ({x_coord:.2f}, {y_coord:.2f})
+        - **Radius**: {circle_radius}
+
+        #### 🧮 The Definitions:
+        - **cos({circle_angle}°)** = {x_coord:.2f} ÷ {circle_radius} = **{cosine_from_circle:.3f}**
+        - **sin({circle_angle}°)** = {y_coord:.2f} ÷ {circle_radius} = **{sine_from_circle:.3f}**
+        """)
+
+        if circle_radius == 1:
+            st.success("🌟 With radius = 1, cos and sin ARE the coordinates!")
+
+    if not dragging:
+        with col2:
+            fig_circle = circle_figure(circle_radius, circle_angle)
+            charts.plotly_chart(fig_circle)
+
+
+def render():
+    st.header("📏 What ARE Sine and Cosine? (The Definitions)")
+
+    st.markdown("""
+    ### 🤔 Before we get to fancy functions...
+    **Let's answer the most important question: WHAT exactly are sine and cosine?**
+
+    Sine and cosine are NOT mysterious magic—they're just **ratios** and **coordinates**!
+    """)
+
+    # Definition approach selector
+    definition_approach = st.radio(
+        "Choose how you want to learn the definitions:",
+        ["📐 Right Triangle Approach (SOH-CAH-TOA)", "🌀 Circle Coordinate Approach", "🔄 Both Together",
+         "🔺 Any Triangle (Laws of Sines & Cosines)"]
+    )
+
+    if definition_approach in ["📐 Right Triangle Approach (SOH-CAH-TOA)", "🔄 Both Together"]:
+        st.markdown("---")
+        st.subheader("📐 Method 1: Right Triangle Definitions")
+
+        _triangle_panel()
+
+    if definition_approach in ["🌀 Circle Coordinate Approach", "🔄 Both Together"]:
+        st.markdown("---")
+        st.subheader("🌀 Method 2: Circle Coordinate Definitions")
+
+        _circle_panel()
+
+    if definition_approach == "🔺 Any Triangle (Laws of Sines & Cosines)":
+        st.markdown("---")
+        st.subheader("🔺 Beyond Right Triangles: Solving Any Triangle")
+
+        _solver_panel()
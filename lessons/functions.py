@@ -0,0 +1,112 @@
+"""📊 Sine & Cosine as Functions"""
+import streamlit as st
+import math
+
+from lessons import charts
+from lessons.panels import panel
+from mathcraft import curves, figspec, profiling
+from mathcraft.caching import cached
+
+
+FUNCTION_COLORS = {"sin": "red", "cos": "blue", "tan": "green", "sec": "purple", "csc": "orange", "cot": "brown"}
+PLOT_HEIGHT = 400
+
+
+# One entry per curve and parameter tuple, so toggling a function re-samples nothing.
+@cached(max_entries=256)
+def function_curve(name, amplitude, frequency, phase, vertical):
+    return curves.sample(name, amplitude, frequency, phase, vertical,
+                         width_px=charts.CHART_WIDTH, height_px=PLOT_HEIGHT)
+
+
+# Students drag back and forth over the same slider positions; keep the recent ones.
+@profiling.timed_figure("function_explorer")
+@cached(max_entries=64)
+def function_figure(amplitude, frequency, phase, vertical, functions=("sin", "cos")):
+    waves = []
+    for name in functions:
+        x, y = function_curve(name, amplitude, frequency, phase, vertical)
+        waves.append(figspec.wave(x, y, name=f'y = {amplitude}{name}({frequency}x + {phase:.2f}) + {vertical}',
+                                  color=FUNCTION_COLORS[name]))
+
+    y_range = curves.y_range(functions, amplitude, vertical)
+    return figspec.figure(
+        waves,
+        figspec.layout(title="Trigonometric Functions", xaxis_title="x (radians)", yaxis_title="y",
+                       height=PLOT_HEIGHT, yaxis=None if y_range is None else dict(range=y_range)),
+        # Reference lines
+        shapes=[figspec.hline(0), figspec.vline(0)],
+    )
+
+
+@panel("function_explorer")
+def _explorer_panel():
+    # Interactive function explorer
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.markdown("### 🎛️ Function Controls")
+        amplitude = st.slider("Amplitude (A):", 0.5, 3.0, 1.0, 0.1)
+        frequency = st.slider("Frequency (B):", 0.5, 3.0, 1.0, 0.1)
+        phase = st.slider("Phase shift (C):", -math.pi, math.pi, 0.0, 0.1)
+        vertical = st.slider("Vertical shift (D):", -2.0, 2.0, 0.0, 0.1)
+
+        functions = st.multiselect("Functions to plot:", list(FUNCTION_COLORS), ["sin", "cos"],
+                                   help="tan, sec, csc and cot break at their vertical asymptotes.")
+        shown = functions[0] if functions else "sin"
+
+        st.markdown(f"""
+        ### 📝 Current Function:
+        **f(x) = {amplitude} {shown}({frequency}x + {phase:.2f}) + {vertical}**
+
+        - **A = {amplitude}**: Amplitude (height)
+        - **B = {frequency}**: Frequency (how fast it oscillates)  
+        - **C = {phase:.2f}**: Phase shift (left/right)
+        - **D = {vertical}**: Vertical shift (up/down)
+        """)
+
+    with col2:
+        # Plot in a fixed order so the same set of functions shares a cache entry.
+        ordered = tuple(name for name in FUNCTION_COLORS if name in functions)
+        fig = function_figure(amplitude, frequency, phase, vertical, ordered)
+        charts.plotly_chart(fig)
+
+
+def render():
+    st.header("📊 Sine & Cosine: From Definitions to Functions")
+
+    st.markdown("""
+    ### 🌊 From Points to Waves: The Function Story
+    Now that you know sine and cosine are **ratios** and **coordinates**, let's see what happens when we **connect all the dots**!
+
+    **The big idea**: As the angle changes continuously, sine and cosine create beautiful wave patterns!
+    """)
+
+    _explorer_panel()
+
+    # Key properties
+    st.markdown("### 🔑 Key Properties to Remember")
+
+    prop_col1, prop_col2 = st.columns(2)
+
+    with prop_col1:
+        st.markdown("""
+        #### 📈 **Sine Function**
+        - **Domain**: All real numbers
+        - **Range**: [-1, 1] (for basic function)
+        - **Period**: 2π
+        - **Starts at**: (0, 0)
+        - **Maximum**: π/2, 5π/2, ...
+        - **Minimum**: 3π/2, 7π/2, ...
+        """)
+
+    with prop_col2:
+        st.markdown("""
+        #### 📉 **Cosine Function**
+        - **Domain**: All real numbers  
+        - **Range**: [-1, 1] (for basic function)
+        - **Period**: 2π
+        - **Starts at**: (0, 1)
+        - **Maximum**: 0, 2π, 4π, ...
+        - **Minimum**: π, 3π, 5π, ...
+        """)
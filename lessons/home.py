@@ -0,0 +1,54 @@
+"""🏠 Home & History"""
+import streamlit as st
+
+
+def render():
+    st.header("🏺 The Ancient Roots of Trigonometry")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        ### 🌍 Before the Greeks: African and Arab Mathematical Legacy
+
+        **Did you know?** Trigonometry didn't start with the Greeks! Long before European scholars, brilliant minds in Africa and the Arab world were masters of angles, astronomy, and mathematical relationships.
+
+        #### 🏛️ Physical Evidence:
+        - **Great Pyramid of Giza** (Egypt, ~2580 BCE): Built with precise angles using sine and cosine relationships
+        - **Nubian Pyramids** (Sudan, ~700 BCE): Complex astronomical alignments requiring trigonometric calculations
+        - **Temple of Abu Simbel** (Egypt, ~1264 BCE): Designed so sunlight hits specific statues only on certain days
+
+        #### 📜 Written Records:
+        - **Babylonian tablets** (1800-1600 BCE): Contained trigonometric tables and astronomical calculations
+        - **Islamic Golden Age** (8th-13th centuries): Al-Battani, Al-Biruni, and others refined sine, cosine, and tangent
+        - **African scholars in Timbuktu**: Advanced mathematical texts predating European "discoveries"
+
+        The Greeks learned from these civilizations—they didn't invent trigonometry, they inherited and built upon it!
+        """)
+
+    with col2:
+        st.info("""
+        **Fun Fact! 🤯**
+
+        The word "sine" comes from the Arabic word "jayb" (meaning pocket or bay), which was mistranslated into Latin as "sinus"!
+
+        **Today's Mission:**
+        Master the tools that ancient African and Arab mathematicians used to:
+        - Build monuments
+        - Predict eclipses  
+        - Navigate by stars
+        - Create calendars
+        """)
+
+    st.markdown("---")
+    st.subheader("🎯 What You'll Learn Today")
+
+    progress_cols = st.columns(4)
+    with progress_cols[0]:
+        st.markdown("✅ **Angles**\nDegrees vs Radians")
+    with progress_cols[1]:
+        st.markdown("📐 **Unit Circle**\nThe Foundation")
+    with progress_cols[2]:
+        st.markdown("📈 **Functions**\nSine & Cosine")
+    with progress_cols[3]:
+        st.markdown("🔬 **Advanced**\nLimits & Calculus Prep")
@@ -0,0 +1,192 @@
+"""🔢 The Famous Limit"""
+import streamlit as st
+import numpy as np
+import math
+
+from lessons import charts
+from lessons.panels import panel
+from mathcraft import figspec, limits, profiling
+from mathcraft.caching import cached
+from mathcraft.sampling import adaptive, mirrored
+
+_SUPERSCRIPTS = str.maketrans("-0123456789", "⁻⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+# Half-widths of the plotted window, down to where float64 runs out of digits.
+ZOOMS = {"±1 radian": 1, "±0.5 radians": 0.5, "±0.1 radians": 0.1, "±0.01 radians": 0.01}
+ZOOMS.update({f"±10{str(-k).translate(_SUPERSCRIPTS)} radians": 10.0 ** -k for k in range(3, 16)})
+
+VIEWS = ["sin(x)/x", "1 − sin(x)/x (how far from 1)"]
+
+
+def _even_curve(func, zoom):
+    # Both curves are even: sample [0, zoom] adaptively and mirror it.
+    return mirrored(*adaptive(func, 0.0, zoom))
+
+
+def _limit_line(y, text, color, dash, yref="y"):
+    note = figspec.annotation(1, y, text, color=color)
+    note.update(xref="x domain", xanchor="right", yanchor="bottom", yref=yref)
+    line = figspec.hline(y, color=color, dash=dash)
+    line["yref"] = yref
+    return line, note
+
+
+@profiling.timed_figure("limit_explorer")
+@cached(max_entries=64)
+def limit_figure(zoom, zoom_level, degrees=True):
+    """sin(x)/x on ±zoom; with ``degrees``, sin(x°)/x against a right-hand axis."""
+    x_rad, y_rad = _even_curve(limits.sinc, zoom)
+    traces = [figspec.wave(x_rad, y_rad, name='sin(x)/x (x in radians)', color='red')]
+    line, note = _limit_line(1, "y = 1 (the limit!)", 'green', 'dash')
+    shapes, annotations = [line], [note]
+    layout = figspec.layout(
+        title=f"The Limit sin(x)/x as x approaches 0 (zoom: {zoom_level})",
+        xaxis_title="x", yaxis_title="sin(x)/x", height=400,
+        xaxis=dict(exponentformat="power"),
+        legend=dict(orientation="h", y=-0.25),
+    )
+    if degrees:
+        # Its limit is π/180, far below 1: its own axis keeps both curves readable.
+        x_deg, y_deg = _even_curve(limits.degree_sinc, zoom)
+        traces.append(figspec.wave(x_deg, y_deg, name='sin(x°)/x (x in degrees)', color='blue', yaxis="y2"))
+        line, note = _limit_line(limits.DEGREE, "π/180 ≈ 0.01745 (degrees)", 'blue', 'dot', yref="y2")
+        shapes.append(line)
+        note["yanchor"] = "top"
+        annotations.append(note)
+        layout["yaxis2"] = dict(title=dict(text="sin(x°)/x", font=dict(color="blue")), overlaying="y",
+                                side="right", tickfont=dict(color="blue"), showgrid=False)
+    return figspec.figure(traces, layout, annotations=annotations, shapes=shapes)
+
+
+@profiling.timed_figure("limit_gap")
+@cached(max_entries=32)
+def gap_figure(zoom, zoom_level):
+    """1 - sin(x)/x on ±zoom: the series (accurate) against plain float64."""
+    x_exact, y_exact = _even_curve(limits.sinc_gap, zoom)
+    x_naive, y_naive = _even_curve(limits.naive_sinc_gap, zoom)
+    return figspec.figure(
+        [
+            figspec.wave(x_exact, y_exact, name='Taylor series x²/6 − x⁴/120 + …', color='green'),
+            figspec.wave(x_naive, y_naive, name='1 − sin(x)/x in float64', color='red', width=2, dash='dot'),
+        ],
+        figspec.layout(
+            title=f"How far sin(x)/x is from 1 (zoom: {zoom_level})",
+            xaxis_title="x", yaxis_title="1 − sin(x)/x", height=400,
+            xaxis=dict(exponentformat="power"), yaxis=dict(exponentformat="power"),
+            legend=dict(orientation="h", y=-0.25),
+        ),
+    )
+
+
+def _table_rows(zoom):
+    # The window edge and three decades inside it.
+    columns = limits.limit_table(zoom * 10.0 ** -np.arange(4))
+    return {
+        "x": [f"{x:.0e}" for x in columns["x"]],
+        "sin(x)/x": [f"{r:.15f}" for r in columns["ratio"]],
+        "1 − sin(x)/x (float64)": [f"{g:.4e}" for g in columns["naive_gap"]],
+        "1 − sin(x)/x (series)": [f"{g:.4e}" for g in columns["gap"]],
+        "correct digits": [f"{d:.0f}" for d in columns["digits"]],
+        "sin(x°)/x": [f"{r:.8f}" for r in columns["degree_ratio"]],
+    }
+
+
+@panel("limit_zoom")
+def _zoom_panel():
+    # Interactive limit explorer
+    st.markdown("### 🔍 Explore the Limit")
+
+    zoom_level = st.selectbox("Choose how close to 0:", list(ZOOMS))
+    zoom = ZOOMS[zoom_level]
+    view = st.radio("Plot:", VIEWS, horizontal=True, key="limit_view")
+
+    if view == VIEWS[0]:
+        degrees = st.checkbox("Compare with x in degrees", value=True, key="limit_degrees")
+        fig = limit_figure(zoom, zoom_level, degrees)
+    else:
+        fig = gap_figure(zoom, zoom_level)
+        st.caption("Below x ≈ 10⁻⁷ the float64 subtraction cancels almost every digit: the red curve "
+                   "turns into steps of 2⁻⁵³ ≈ 1.1 × 10⁻¹⁶, then flat 0, while the series stays exact.")
+    charts.plotly_chart(fig)
+    points = sum(len(trace["x"]) for trace in fig["data"])
+    st.caption(f"{points:,} points, placed where the curve bends (a fixed grid would use 1,000 per curve).")
+
+    # Show numerical values
+    if zoom <= 0.1:
+        st.markdown("### 📊 Getting Closer to 1:")
+        st.table(_table_rows(zoom))
+
+
+def render():
+    st.header("🔢 The Most Important Limit in Trigonometry")
+
+    st.markdown("""
+    ### 🎯 The Fundamental Limit
+    This limit is the foundation of calculus and explains why radians are "natural":
+    """)
+
+    st.latex(r"\lim_{x \to 0} \frac{\sin x}{x} = 1")
+
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.markdown("""
+        ### 📚 Mathematical Vocabulary Breakdown
+
+        Let's decode this expression symbol by symbol:
+
+        - **lim** = "limit" (the value we approach)
+        - **x → 0** = "as x approaches 0" (getting closer and closer to 0)
+        - **sin x** = sine of x (the trigonometric function)
+        - **x** = the angle (in radians!)
+        - **= 1** = equals exactly 1
+
+        ### 🤔 What Does This Mean?
+
+        As angles get smaller and smaller (approaching 0), the ratio of **sin(angle)** to the **angle itself** approaches exactly 1.
+
+        **BUT**: This only works when the angle is measured in **radians**!
+        """)
+
+        _zoom_panel()
+
+    with col2:
+        st.markdown("""
+        ### 💡 Why This Matters
+
+        **For Calculus:**
+        - This limit helps us find the derivative of sin(x)
+        - It's why d/dx[sin(x)] = cos(x)
+
+        **For Physics:**
+        - Small angle approximations
+        - Harmonic motion
+        - Wave mechanics
+
+        **For Engineering:**
+        - Signal processing
+        - Control systems
+        - Oscillations
+        """)
+
+        st.info("""
+        **🎯 Key Insight:**
+
+        Radians make trigonometric functions "natural" because:
+
+        sin(x) ≈ x when x is small (in radians)
+
+        This is NOT true for degrees!
+        """)
+
+        st.markdown("### 🧮 Quick Check")
+        test_angle = st.number_input("Test a small angle (radians):", value=0.1, min_value=0.001, max_value=1.0, step=0.01)
+        sin_val = math.sin(test_angle)
+        ratio = sin_val / test_angle
+        st.write(f"sin({test_angle}) = {sin_val:.4f}")
+        st.write(f"sin({test_angle})/{test_angle} = {ratio:.4f}")
+
+        if abs(ratio - 1) < 0.1:
+            st.success("See how close to 1 it is! 🎉")
+        else:
+            st.info("Try a smaller angle to see it approach 1!")
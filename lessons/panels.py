@@ -0,0 +1,47 @@
+"""Interactive panels that rerun on their own.
+
+A lesson's interactive panel (its widgets plus the chart they drive) is an
+``st.fragment``: moving one of its widgets reruns that function only, not
+app.py, the rest of the lesson, the footer or the sidebar.
+
+Decorate panels with ``panel`` rather than ``st.fragment`` so the opt-in
+profiling still sees those partial reruns. They never pass through
+``start_rerun``/``finish_rerun`` in app.py, so the panel records itself,
+logged with ``lesson`` set to ``"⚡ <panel name>"``. Inside a full rerun the
+panel is just a span of the lesson. The allocation profiler
+(``mathcraft.memprofile``) logs fragment reruns under the same name.
+
+``PANELS`` maps each name to its fragment, for tools that time panels
+(``benchmarks/startup.py``).
+"""
+import functools
+
+import streamlit as st
+
+from lessons import admin
+from mathcraft import memprofile, profiling
+
+FRAGMENT_PREFIX = "⚡ "
+
+# Panel name -> fragment, filled as the lesson modules are imported.
+PANELS = {}
+
+
+def panel(name):
+    def decorator(func):
+        @st.fragment
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            with memprofile.rerun(FRAGMENT_PREFIX + name, st.session_state, st.session_state.get("session_id")):
+                if profiling.current() is not None:
+                    with profiling.span(name):
+                        return func(*args, **kwargs)
+                # A fragment rerun (or profiling is off, and this costs nothing).
+                profiling.start_rerun(admin.profiling_requested(), session=st.session_state.get("session_id"))
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    profiling.finish_rerun(FRAGMENT_PREFIX + name)
+        PANELS[name] = run
+        return run
+    return decorator
@@ -0,0 +1,188 @@
+"""🎯 Practice Problems"""
+import math
+
+import streamlit as st
+
+from lessons import tracking
+from lessons.problem_sets import session_problems
+from mathcraft import grading
+from mathcraft.angles import BY_DEGREES
+from mathcraft.problems import CHALLENGE_ANGLES, DefinitionProblem, FunctionProblem
+
+SPECIAL_ANGLES = {f"{degrees}°": BY_DEGREES[degrees] for degrees in CHALLENGE_ANGLES}
+
+# The first problem of each kind a session sees; later ones come from the generator.
+DEFAULT_FUNCTION = FunctionProblem("f(x) = 2sin(3x + π/4) - 1", 2, 2*math.pi/3, -math.pi/12, -1)
+DEFAULT_DEFINITIONS = (
+    DefinitionProblem(
+        "In a right triangle, if the opposite side is 6 and the hypotenuse is 10, what is sin(θ)?",
+        ["A) 6/10 = 0.6", "B) 8/10 = 0.8", "C) 6/8 = 0.75", "D) 10/6 = 1.67"],
+        "A",
+        "sin(θ) = opposite ÷ hypotenuse = 6 ÷ 10 = 0.6",
+    ),
+    DefinitionProblem(
+        "On a circle with radius 5, if a point is at (3, 4), what is cos(θ)?",
+        ["A) 4/5 = 0.8", "B) 3/5 = 0.6", "C) 3/4 = 0.75", "D) 4/3 = 1.33"],
+        "B",
+        "cos(θ) = x-coordinate ÷ radius = 3 ÷ 5 = 0.6",
+    ),
+)
+
+
+def _record_conversion(key, angle):
+    answer = st.session_state[key]
+    verdict = grading.grade(answer, angle)
+    # Unreadable answers are logged but not counted as attempts.
+    correct = None if verdict == grading.UNPARSED else verdict != grading.WRONG
+    tracking.record_answer("conversion", f"{angle}°", answer, correct)
+
+
+def render():
+    st.header("🎯 Practice Problems & Quizzes")
+    problems = session_problems()
+    st.caption(f"Problem set #{problems.seed} — add ?seed={problems.seed} to the URL to replay it.")
+
+    # Problem selector
+    problem_type = st.selectbox("Choose problem type:", 
+                               ["Degree ↔ Radian Conversion", "Unit Circle Values", "Function Properties", "Definition Practice"])
+
+    if problem_type == "Degree ↔ Radian Conversion":
+        st.subheader("🔄 Conversion Practice")
+
+        # Generate random problem
+        if st.button("Generate New Problem"):
+            st.session_state.problem_angles = problems.next("conversion")
+            st.session_state.conversion_set = st.session_state.get("conversion_set", 0) + 1
+
+        if 'problem_angles' not in st.session_state:
+            st.session_state.problem_angles = (45, 90, 180)
+        problem_set = st.session_state.get("conversion_set", 0)
+
+        for i, angle in enumerate(st.session_state.problem_angles):
+            st.write(f"**Problem {i+1}:** Convert {angle}° to radians")
+            key = f"conv_{problem_set}_{i}"
+            user_answer = st.text_input(f"Answer {i+1} (in terms of π):", key=key,
+                                        on_change=_record_conversion, args=(key, angle))
+
+            if user_answer:
+                entry = BY_DEGREES[angle]
+                verdict = grading.grade(user_answer, angle)
+                if verdict == grading.EXACT:
+                    st.success(f"✅ Exactly right: {entry.label} = {entry.radians:.4f} radians")
+                elif verdict == grading.APPROX:
+                    st.success(f"✅ Close enough! The exact answer is {entry.label} = {entry.radians:.4f} radians")
+                elif verdict == grading.WRONG:
+                    st.error(f"❌ Not quite. Correct answer: {entry.label} = {entry.radians:.4f} radians")
+                else:
+                    st.warning("Couldn't read that answer. Try something like 3π/4, 0.75pi or 2.356.")
+
+    elif problem_type == "Unit Circle Values":
+        st.subheader("🌀 Unit Circle Memory Challenge")
+
+        if st.button("New Challenge"):
+            st.session_state.challenge_angle = problems.next("challenge")
+
+        if 'challenge_angle' not in st.session_state:
+            st.session_state.challenge_angle = "45°"
+
+        challenge_angle = st.session_state.challenge_angle
+        entry = SPECIAL_ANGLES[challenge_angle]
+        correct_cos, correct_sin = entry.cos, entry.sin
+
+        st.write(f"**What are the coordinates of {challenge_angle} on the unit circle?**")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            cos_answer = st.number_input("cos value:", step=0.1, format="%.3f")
+        with col2:
+            sin_answer = st.number_input("sin value:", step=0.1, format="%.3f")
+
+        if st.button("Check Answer"):
+            correct = abs(cos_answer - correct_cos) < 0.01 and abs(sin_answer - correct_sin) < 0.01
+            tracking.record_answer("unit_circle", challenge_angle, f"({cos_answer:.3f}, {sin_answer:.3f})", correct)
+            if correct:
+                st.success("🎉 Correct! Great job!")
+            else:
+                st.error(f"Not quite. The correct answer is cos({challenge_angle}) = {entry.cos_exact} ≈ {correct_cos:.3f}, "
+                         f"sin({challenge_angle}) = {entry.sin_exact} ≈ {correct_sin:.3f}")
+
+    elif problem_type == "Function Properties":
+        st.subheader("📊 Function Analysis")
+
+        if st.button("New Function"):
+            st.session_state.function_problem = problems.next("function")
+
+        if 'function_problem' not in st.session_state:
+            st.session_state.function_problem = DEFAULT_FUNCTION
+
+        problem = st.session_state.function_problem
+        st.markdown(f"""
+        **Analyze this function:** {problem.function}
+
+        Fill in the properties:
+        """)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            amplitude_answer = st.number_input("Amplitude:", step=0.1)
+            period_answer = st.number_input("Period:", step=0.1)
+        with col2:
+            phase_answer = st.number_input("Phase shift:", step=0.1)
+            vertical_answer = st.number_input("Vertical shift:", step=0.1)
+
+        if st.button("Check Function Analysis"):
+            correct_amp = problem.amplitude
+            correct_period = problem.period
+            correct_phase = problem.phase  # -C ÷ B
+            correct_vertical = problem.vertical
+
+            results = []
+            if abs(amplitude_answer - correct_amp) < 0.01:
+                results.append("✅ Amplitude correct!")
+            else:
+                results.append(f"❌ Amplitude: {correct_amp}")
+
+            if abs(period_answer - correct_period) < 0.01:
+                results.append("✅ Period correct!")
+            else:
+                results.append(f"❌ Period: {correct_period:.3f}")
+
+            if abs(phase_answer - correct_phase) < 0.01:
+                results.append("✅ Phase shift correct!")
+            else:
+                results.append(f"❌ Phase shift: {correct_phase:.3f}")
+
+            if abs(vertical_answer - correct_vertical) < 0.01:
+                results.append("✅ Vertical shift correct!")
+            else:
+                results.append(f"❌ Vertical shift: {correct_vertical}")
+
+            answer = f"A={amplitude_answer}, T={period_answer}, C={phase_answer}, D={vertical_answer}"
+            correct = all(result.startswith("✅") for result in results)
+            tracking.record_answer("function_analysis", problem.function, answer, correct)
+
+            for result in results:
+                st.write(result)
+
+    else:  # Definition Practice
+        st.subheader("📏 Definition Practice")
+
+        if st.button("New Questions"):
+            st.session_state.definition_problems = (problems.next("definition"), problems.next("definition"))
+            st.session_state.definition_set = st.session_state.get("definition_set", 0) + 1
+
+        if 'definition_problems' not in st.session_state:
+            st.session_state.definition_problems = DEFAULT_DEFINITIONS
+        question_set = st.session_state.get("definition_set", 0)
+
+        for i, problem in enumerate(st.session_state.definition_problems):
+            st.write(f"**Problem {i+1}:** {problem.question}")
+            user_choice = st.radio(f"Choose your answer:", problem.options, key=f"def_prob_{question_set}_{i}")
+
+            if st.button(f"Check Answer {i+1}", key=f"def_check_{question_set}_{i}"):
+                correct = user_choice.startswith(problem.correct)
+                tracking.record_answer("definition", problem.question, user_choice, correct)
+                if correct:
+                    st.success(f"✅ Correct! {problem.explanation}")
+                else:
+                    st.error(f"❌ Not quite. {problem.explanation}")
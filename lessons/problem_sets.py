@@ -0,0 +1,23 @@
+"""Per-session problem generator.
+
+Every session draws from its own seeded ``SessionProblems`` instead of the
+process-wide ``random`` module. ``?seed=<n>`` in the URL replays the same
+sequence of problems, e.g. to reproduce what a student saw.
+"""
+import secrets
+
+import streamlit as st
+
+from mathcraft.problems import SessionProblems
+
+
+def session_seed():
+    seed = st.query_params.get("seed", "")
+    return int(seed) if seed.isdigit() else secrets.randbits(32)
+
+
+def session_problems():
+    """This session's ``SessionProblems``, created on first use."""
+    if not isinstance(st.session_state.get("problems"), SessionProblems):
+        st.session_state.problems = SessionProblems(session_seed())
+    return st.session_state.problems
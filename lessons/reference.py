@@ -0,0 +1,107 @@
+"""🧮 Quick Reference Guide"""
+import streamlit as st
+
+from mathcraft.angles import BY_DEGREES
+
+COMMON_ANGLE_ROWS = "\n".join(
+    f"            | {BY_DEGREES[d].degrees}° | {BY_DEGREES[d].radians:.3f} | {BY_DEGREES[d].label} |"
+    for d in (0, 30, 45, 60, 90, 180, 270, 360)
+)
+SPECIAL_VALUE_LINES = "\n".join(
+    f"        - **{e.degrees}°/{e.label}**: cos = {e.cos_exact}, sin = {e.sin_exact}"
+    for e in (BY_DEGREES[d] for d in (0, 30, 45, 60, 90, 180, 270))
+)
+
+
+def render():
+    st.header("🧮 Quick Reference Guide")
+
+    st.markdown("""
+    ### 📋 Your Trigonometry Cheat Sheet
+    Everything you need to remember in one place!
+    """)
+
+    # Create tabs for different reference sections
+    ref_tabs = st.tabs(["🔄 Conversions", "🌀 Unit Circle", "📊 Functions", "🧮 Formulas"])
+
+    with ref_tabs[0]:  # Conversions
+        st.subheader("🔄 Degree ↔ Radian Conversions")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown(f"""
+            #### 📐 Common Angles
+            | Degrees | Radians | π Form |
+            |---------|---------|---------|
+{COMMON_ANGLE_ROWS}
+            """)
+
+        with col2:
+            st.markdown("""
+            #### 🧮 Conversion Formulas
+
+            **Degrees to Radians:**
+            ```
+            radians = degrees × π/180
+            ```
+
+            **Radians to Degrees:**
+            ```
+            degrees = radians × 180/π
+            ```
+
+            #### 💡 Memory Tricks
+            - **π radians = 180°** (half circle)
+            - **2π radians = 360°** (full circle)
+            - **1 radian ≈ 57.3°**
+            """)
+
+    with ref_tabs[1]:  # Unit Circle
+        st.subheader("🌀 Unit Circle Values")
+
+        st.markdown(f"""
+        #### 📊 Special Angle Values
+{SPECIAL_VALUE_LINES}
+        """)
+
+    with ref_tabs[2]:  # Functions
+        st.subheader("📊 Trigonometric Functions")
+
+        st.markdown("""
+        #### 📈 Basic Function Properties
+
+        | Function | Domain | Range | Period | Starts at (0,?) |
+        |----------|--------|-------|--------|-----------------|
+        | sin(x) | All reals | [-1, 1] | 2π | 0 |
+        | cos(x) | All reals | [-1, 1] | 2π | 1 |
+        | tan(x) | x ≠ π/2 + nπ | All reals | π | 0 |
+
+        #### 🔄 Function Transformations
+        **General form**: f(x) = A sin(Bx + C) + D
+
+        - **A**: Amplitude (vertical stretch)
+        - **B**: Frequency (horizontal compression if B > 1)
+        - **C**: Phase shift (horizontal shift = -C/B)
+        - **D**: Vertical shift
+        - **Period**: 2π/|B|
+        """)
+
+    with ref_tabs[3]:  # Formulas
+        st.subheader("🧮 Essential Formulas")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("""
+            #### 🔢 Basic Identities
+            """)
+            st.latex(r"\sin^2(x) + \cos^2(x) = 1")
+            st.latex(r"\tan(x) = \frac{\sin(x)}{\cos(x)}")
+
+        with col2:
+            st.markdown("""
+            #### 🎯 The Famous Limit
+            """)
+            st.latex(r"\lim_{x \to 0} \frac{\sin x}{x} = 1")
+            st.markdown("**(Only when x is in radians!)**")
@@ -0,0 +1,49 @@
+"""Per-session progress tracking backed by the shared SQLite store.
+
+A student is identified by ``?student=<id>`` in the URL, which is added on the
+first visit; reloading or reconnecting with the same URL restores progress.
+"""
+import os
+import uuid
+
+import streamlit as st
+
+from mathcraft.progress import StudentProgress
+from mathcraft.store import ProgressStore
+
+DB_PATH = os.environ.get("MATHCRAFT_DB", "mathcraft_progress.db")
+
+
+@st.cache_resource(show_spinner=False)
+def get_store():
+    return ProgressStore(DB_PATH)
+
+
+def student_id():
+    if "student" not in st.query_params:
+        st.query_params["student"] = uuid.uuid4().hex
+    return st.query_params["student"]
+
+
+def progress():
+    """This session's ``StudentProgress``, restored from the store on first use."""
+    if not isinstance(st.session_state.get("student_progress"), StudentProgress):
+        st.session_state.student_progress = get_store().load(student_id()) or StudentProgress()
+    return st.session_state.student_progress
+
+
+def visit(lesson_index):
+    """Mark a lesson visited; only a change of lesson is written to the store."""
+    record = progress()
+    record.visit(lesson_index)
+    if st.session_state.get("last_lesson") != lesson_index:
+        st.session_state.last_lesson = lesson_index
+        get_store().record_visit(student_id(), lesson_index, record)
+
+
+def record_answer(quiz, question, answer, correct):
+    """Count a graded answer and queue it for the store."""
+    record = progress()
+    if correct is not None:
+        record.record_answer(correct)
+    get_store().record_answer(student_id(), quiz, question, answer, correct, record)
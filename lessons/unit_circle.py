@@ -0,0 +1,202 @@
+"""🌀 Unit Circle Explorer"""
+import streamlit as st
+import numpy as np
+import math
+
+from lessons import charts
+from lessons.circle_dial import LIVE_RATE, circle_dial
+from lessons.panels import panel
+from mathcraft import figspec, profiling
+from mathcraft.angles import UNIT_CIRCLE, at_degrees
+from mathcraft.caching import cached
+
+
+# Radians mode steps through these special angles; degrees mode is 0..360 step 15.
+ANGLE_OPTIONS = [entry.radians for entry in UNIT_CIRCLE]
+ANGLE_LABELS = [entry.label for entry in UNIT_CIRCLE]
+
+# Initial slider value per mode: 45° and π/4.
+DEFAULT_ANGLE = {"Degrees": 45, "Radians": 2}
+
+DIAGRAMS = ["✋ Drag the point", "🎚️ Special-angle slider", "🎬 Animated"]
+
+# The circle outline never changes, so sample it once per process.
+_THETA = np.linspace(0, 2*math.pi, 100)
+CIRCLE_X = np.cos(_THETA)
+CIRCLE_Y = np.sin(_THETA)
+
+
+def angle_state(angle_mode, angle):
+    """Return (special-angle table entry, display label) for a slider value.
+
+    ``angle`` is the degree value in "Degrees" mode and the index into
+    ``ANGLE_OPTIONS`` in "Radians" mode.
+    """
+    if angle_mode == "Degrees":
+        return at_degrees(angle), f"{angle}°"
+    return UNIT_CIRCLE[angle], ANGLE_LABELS[angle]
+
+
+def _static_traces():
+    return [
+        figspec.trace(CIRCLE_X, CIRCLE_Y, name='Unit Circle', color='lightblue', width=3),
+        *figspec.axes(1.2, names=('X-axis', 'Y-axis')),
+    ]
+
+
+# Indices of the traces returned by _moving_traces() inside the full figure.
+MOVING_TRACES = [3, 4, 5, 6]
+
+
+def _moving_traces(x, y):
+    return [
+        figspec.ray(x, y, name='Angle Ray'),
+        figspec.point(x, y, f'({x:.3f}, {y:.3f})', name='Point'),
+        # Coordinate lines
+        *figspec.projections(x, y, names=('sin θ', 'cos θ')),
+    ]
+
+
+def _layout(title, height=500):
+    return figspec.layout(
+        title=title,
+        xaxis=dict(scaleanchor="y", scaleratio=1, range=[-1.3, 1.3], zeroline=True),
+        yaxis=dict(range=[-1.3, 1.3], zeroline=True),
+        width=500, height=height,
+        showlegend=False
+    )
+
+
+# 25 degree positions + 17 radian positions; shared by every session.
+@profiling.timed_figure("unit_circle")
+@cached(max_entries=64)
+def unit_circle_figure(angle_mode, angle):
+    entry, angle_display = angle_state(angle_mode, angle)
+    return figspec.figure(_static_traces() + _moving_traces(entry.cos, entry.sin),
+                          _layout(f"Unit Circle: θ = {angle_display}"))
+
+
+def animation_angles(angle_mode, step=15):
+    """Slider values covered by the animated figure, in frame order."""
+    if angle_mode == "Degrees":
+        return list(range(0, 361, step))
+    return list(range(len(ANGLE_OPTIONS)))
+
+
+def _frame_title(angle_display, entry):
+    tan_text = "undefined" if entry.tan is None else f"{entry.tan:.3f}"
+    return f"θ = {angle_display}: cos θ = {entry.cos:.3f}, sin θ = {entry.sin:.3f}, tan θ = {tan_text}"
+
+
+@profiling.timed_figure("unit_circle_animation")
+@cached(max_entries=8)
+def unit_circle_animation(angle_mode, step=15):
+    """Unit circle with every angle state shipped once as Plotly frames.
+
+    Scrubbing the built-in slider or pressing play swaps frames in the browser,
+    so no Streamlit rerun happens until a widget outside the chart changes.
+    The figure does not depend on the Streamlit slider, so reruns re-send an
+    identical spec that the frontend already holds.
+    """
+    angles = animation_angles(angle_mode, step)
+    frames = []
+    for angle in angles:
+        entry, angle_display = angle_state(angle_mode, angle)
+        frames.append(dict(
+            name=angle_display, data=_moving_traces(entry.cos, entry.sin), traces=MOVING_TRACES,
+            layout=dict(title=dict(text=_frame_title(angle_display, entry)))
+        ))
+
+    active = angles.index(DEFAULT_ANGLE[angle_mode])
+    layout = _layout(frames[active]["layout"]["title"]["text"], height=620)
+
+    still = dict(mode="immediate", frame=dict(duration=0, redraw=False), transition=dict(duration=0))
+    layout.update(
+        sliders=[dict(
+            active=active, currentvalue=dict(prefix="θ = "), pad=dict(t=40),
+            steps=[dict(label=f["name"], method="animate", args=[[f["name"]], still]) for f in frames]
+        )],
+        updatemenus=[dict(
+            type="buttons", direction="left", x=0, y=-0.08, xanchor="left", yanchor="top",
+            buttons=[
+                dict(label="▶ Play", method="animate",
+                     args=[None, dict(frame=dict(duration=60 if step == 1 else 250, redraw=False),
+                                      transition=dict(duration=0), fromcurrent=True)]),
+                dict(label="⏸ Pause", method="animate", args=[[None], still]),
+            ]
+        )]
+    )
+    return figspec.figure(_static_traces() + frames[active]["data"], layout, frames=frames)
+
+
+@panel("unit_circle")
+def _explorer_panel():
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        # Interactive unit circle
+        angle_mode = st.radio("Angle measurement:", ["Degrees", "Radians"], horizontal=True)
+        diagram = st.radio("Diagram:", DIAGRAMS, horizontal=True, key="unit_circle_diagram",
+                           help="Dragging runs in your browser and reports the angle when you let go. "
+                                "The animated chart ships every angle once; scrubbing its own slider "
+                                "does not talk to the server, and the values follow the slider below.")
+
+        if diagram == DIAGRAMS[0]:
+            options = st.columns(2)
+            snap = options[0].checkbox("Snap to 15°", key="unit_circle_snap")
+            live = options[1].checkbox("Update values while dragging", key="unit_circle_live")
+            degrees = circle_dial("unit_circle_dial", default=DEFAULT_ANGLE["Degrees"], snap=15 if snap else 0,
+                                  live_rate=LIVE_RATE if live else 0,
+                                  unit="degrees" if angle_mode == "Degrees" else "radians")
+            entry = at_degrees(degrees)
+            angle_display = f"{degrees}°" if angle_mode == "Degrees" else entry.label
+        else:
+            if angle_mode == "Degrees":
+                angle = st.slider("Angle (degrees):", 0, 360, DEFAULT_ANGLE["Degrees"], step=15)
+            else:
+                angle = st.select_slider("Angle (radians):", options=range(len(ANGLE_OPTIONS)), format_func=lambda x: ANGLE_LABELS[x], value=DEFAULT_ANGLE["Radians"])
+
+            entry, angle_display = angle_state(angle_mode, angle)
+
+            if diagram == DIAGRAMS[2]:
+                step = 15
+                if angle_mode == "Degrees":
+                    resolution = st.radio("Animation resolution:", ["15°", "1°"], horizontal=True)
+                    step = 1 if resolution == "1°" else 15
+                fig = unit_circle_animation(angle_mode, step)
+            else:
+                fig = unit_circle_figure(angle_mode, angle)
+
+            charts.plotly_chart(fig)
+
+        # Coordinates come straight from the special-angle table
+        x, y = entry.cos, entry.sin
+
+    with col2:
+        st.markdown("### 📊 Current Values")
+        st.metric("**Angle**", angle_display)
+        st.metric("**cos θ** (x-coordinate)", f"{x:.4f}")
+        st.metric("**sin θ** (y-coordinate)", f"{y:.4f}")
+        st.metric("**tan θ** (slope)", "undefined" if entry.tan is None else f"{entry.tan:.4f}")
+
+        st.markdown("---")
+        st.markdown("### 🧠 Key Insights")
+        st.markdown(f"""
+        - **cos θ = {x:.3f}** (horizontal distance)
+        - **sin θ = {y:.3f}** (vertical distance)  
+        - **Point coordinates**: ({x:.3f}, {y:.3f})
+        - **Distance from origin**: {math.sqrt(x**2 + y**2):.3f} (always = 1!)
+        """)
+
+
+def render():
+    st.header("🌀 The Unit Circle: Your Trig Command Center")
+
+    st.markdown("""
+    ### 🎯 What's the Unit Circle?
+    A circle with **radius = 1** centered at the origin. It's the **key** to understanding all trigonometry!
+
+    **Magic fact**: Any point on this circle has coordinates **(cos θ, sin θ)** where θ is the angle!
+    """)
+
+    _explorer_panel()
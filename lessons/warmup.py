@@ -0,0 +1,151 @@
+"""Fill a lesson's caches in the background the first time it is shown.
+
+Without this, the first students of each class pay every cache miss: the
+first to drag the unit circle builds all its figures, the first to play a
+note renders its clip, and so on. ``warm`` (called by app.py after every
+lesson render, acting only on each lesson's first) hands the builders the
+states most students reach next to a thread pool: the default slider
+positions, the special angles, every note.
+
+The lesson module has already been imported by the request that showed
+it, so the pool only runs builders and never imports anything: imported
+on a pool thread, a half-initialized pandas would be visible to plotly,
+which probes ``sys.modules`` for it while a request thread draws a chart.
+It also means the first request of the process imports nothing extra.
+
+The results land in the ``mathcraft.caching`` caches the lessons read, so
+they obey the same entry, byte and TTL limits. Set ``MATHCRAFT_WARMUP=0``
+to skip it (for example when measuring cold starts).
+"""
+import concurrent.futures
+import os
+import sys
+import threading
+import time
+
+from mathcraft import caching
+
+ENV_FLAG = "MATHCRAFT_WARMUP"
+WORKERS = int(os.environ.get("MATHCRAFT_WARMUP_WORKERS", "2"))
+
+
+def _definitions_states(definitions):
+    tasks = [(definitions.triangle_figure, (angle, 10)) for angle in range(10, 81, 5)]
+    tasks += [(definitions.circle_figure, (5, angle)) for angle in range(0, 361, 15)]
+    tasks += [(definitions.solver_figure, (case, tuple(default for _, default in inputs)))
+              for case, inputs in definitions.SOLVER_INPUTS.items()]
+    return tasks
+
+
+def _unit_circle_states(unit_circle):
+    tasks = [(unit_circle.unit_circle_figure, ("Degrees", angle)) for angle in range(0, 361, 15)]
+    tasks += [(unit_circle.unit_circle_figure, ("Radians", i)) for i in range(len(unit_circle.ANGLE_OPTIONS))]
+    tasks += [(unit_circle.unit_circle_animation, (mode, 15)) for mode in ("Degrees", "Radians")]
+    return tasks
+
+
+def _functions_states(functions):
+    return [(functions.function_figure, (1.0, 1.0, 0.0, 0.0, ("sin", "cos")))]
+
+
+def _limit_states(limit):
+    return [(limit.limit_figure, (zoom, level, True)) for level, zoom in limit.ZOOMS.items()]
+
+
+def _applications_states(applications):
+    from mathcraft.audio import NOTES
+
+    tasks = [(applications.ocean_wave_animation, (((2.0, 20, 8, 0.0),),))]
+    tasks += [(applications.sound_figure, ((note,), 0.5, 20)) for note in NOTES]
+    return tasks
+
+
+# Lesson module name -> states most students see there, as ``(builder, args)``.
+COMMON_STATES = {
+    "definitions": _definitions_states,
+    "unit_circle": _unit_circle_states,
+    "functions": _functions_states,
+    "limit": _limit_states,
+    "applications": _applications_states,
+}
+
+
+def common_states(lesson):
+    """``(builder, args)`` for the states most students see in an imported lesson module."""
+    states = COMMON_STATES.get(lesson)
+    return states(sys.modules[f"lessons.{lesson}"]) if states else []
+
+
+class Status:
+    """Progress of the warm-up, read by the admin view."""
+
+    def __init__(self):
+        self.lessons = []
+        self.total = 0
+        self.done = 0
+        self.failed = 0
+        self.seconds = 0.0  # worker time spent building
+        self._lock = threading.Lock()
+
+    def queued(self, lesson, count):
+        with self._lock:
+            self.lessons.append(lesson)
+            self.total += count
+
+    def finished(self, future):
+        with self._lock:
+            self.done += 1
+            self.failed += future.exception() is not None
+            if future.exception() is None:
+                self.seconds += future.result()
+
+    def as_dict(self):
+        return {"lessons": len(self.lessons), "states": self.total, "done": self.done,
+                "failed": self.failed, "seconds": self.seconds}
+
+
+_status = None
+_pool = None
+_seen = set()
+_lock = threading.Lock()
+
+
+def _warm(builder, args):
+    started = time.perf_counter()
+    with caching.warming():
+        builder(*args)
+    return time.perf_counter() - started
+
+
+def enabled():
+    return os.environ.get(ENV_FLAG, "1") != "0"
+
+
+def warm(lesson, workers=WORKERS):
+    """Queue the common states of an imported lesson, once per process; returns the ``Status``.
+
+    Returns None when the warm-up is disabled. The pool starts with the
+    first lesson that has states; its threads then wait for the next one.
+    """
+    global _status, _pool
+    if not enabled():
+        return None
+    with _lock:
+        if _status is None:
+            _status = Status()
+        if lesson in _seen:
+            return _status
+        _seen.add(lesson)
+        tasks = common_states(lesson)
+        if not tasks:
+            return _status
+        _status.queued(lesson, len(tasks))
+        if _pool is None:
+            _pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mathcraft-warmup")
+        for builder, args in tasks:
+            _pool.submit(_warm, builder, args).add_done_callback(_status.finished)
+        return _status
+
+
+def status():
+    return _status
@@ -0,0 +1,5 @@
+"""Computation engines shared by the MathCraft lesson pages.
+
+Modules in this package do not import Streamlit, so they can be reused by
+benchmarks and offline tools; caching is applied by the lesson pages.
+"""
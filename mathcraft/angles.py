@@ -0,0 +1,116 @@
+"""Process-wide table of the special angles: every multiple of 15° (π/12).
+
+Built once at import and shared read-only by every session. Each entry has
+float values, exact forms such as ``√3/2`` and ``-(√6-√2)/4``, the π-fraction
+label and the quadrant. Look entries up in O(1) with ``BY_DEGREES``,
+``BY_LABEL`` or ``by_radians``.
+"""
+import math
+from collections import namedtuple
+from fractions import Fraction
+from types import MappingProxyType
+
+SpecialAngle = namedtuple("SpecialAngle", [
+    "degrees", "radians", "label", "quadrant",
+    "cos", "sin", "tan", "cos_exact", "sin_exact", "tan_exact",
+])
+SpecialAngle.__doc__ = """One special angle; ``quadrant`` is 1-4, or None on an axis.
+
+``tan`` is None and ``tan_exact`` is "undefined" at 90° and 270°.
+"""
+
+STEP_DEGREES = 15
+STEP_RADIANS = math.pi / 12
+
+_SQRT2, _SQRT3, _SQRT6 = math.sqrt(2), math.sqrt(3), math.sqrt(6)
+
+# Values for reference angles 0°..90°: (float, exact form).
+_COS_REF = {
+    0: (1.0, "1"),
+    15: ((_SQRT6 + _SQRT2) / 4, "(√6+√2)/4"),
+    30: (_SQRT3 / 2, "√3/2"),
+    45: (_SQRT2 / 2, "√2/2"),
+    60: (0.5, "1/2"),
+    75: ((_SQRT6 - _SQRT2) / 4, "(√6-√2)/4"),
+    90: (0.0, "0"),
+}
+_TAN_REF = {
+    0: (0.0, "0"),
+    15: (2 - _SQRT3, "2-√3"),
+    30: (_SQRT3 / 3, "√3/3"),
+    45: (1.0, "1"),
+    60: (_SQRT3, "√3"),
+    75: (2 + _SQRT3, "2+√3"),
+}
+
+
+def pi_label(degrees):
+    """π-fraction label for an angle in degrees, e.g. 135 -> "3π/4"."""
+    turns = Fraction(degrees, 180)
+    if turns == 0:
+        return "0"
+    numerator = {1: "π", -1: "-π"}.get(turns.numerator, f"{turns.numerator}π")
+    return numerator if turns.denominator == 1 else f"{numerator}/{turns.denominator}"
+
+
+def _signed(sign, value):
+    if value[1] == "0":
+        return value
+    if sign > 0:
+        return value
+    return -value[0], f"-{value[1]}"
+
+
+def _quadrant(degrees):
+    turn = degrees % 360
+    return None if turn % 90 == 0 else int(turn // 90) + 1
+
+
+def _entry(degrees):
+    reference = degrees % 180
+    if reference > 90:
+        reference = 180 - reference
+    turn = degrees % 360
+    cos_sign = -1 if 90 < turn < 270 else 1
+    sin_sign = -1 if turn > 180 else 1
+    cos, cos_exact = _signed(cos_sign, _COS_REF[reference])
+    sin, sin_exact = _signed(sin_sign, _COS_REF[90 - reference])
+    if reference == 90:
+        tan, tan_exact = None, "undefined"
+    else:
+        tan, tan_exact = _signed(cos_sign * sin_sign, _TAN_REF[reference])
+    return SpecialAngle(degrees, math.radians(degrees), pi_label(degrees), _quadrant(degrees),
+                        cos, sin, tan, cos_exact, sin_exact, tan_exact)
+
+
+TABLE = tuple(_entry(degrees) for degrees in range(0, 361, STEP_DEGREES))
+BY_DEGREES = MappingProxyType({entry.degrees: entry for entry in TABLE})
+BY_LABEL = MappingProxyType({entry.label: entry for entry in TABLE})
+
+# The classic unit-circle stops: multiples of 30° and 45°, 0 to 2π inclusive.
+UNIT_CIRCLE = tuple(entry for entry in TABLE if entry.degrees % 30 == 0 or entry.degrees % 45 == 0)
+
+
+def at_degrees(degrees):
+    """Table entry for an angle in degrees, computed when it is not special.
+
+    Computed entries have float values only; their exact forms are None.
+    Fractional degrees (e.g. 37.5 from a dragged dial) get a label from
+    their decimal digits: 37.5 -> "5π/24".
+    """
+    entry = BY_DEGREES.get(degrees)
+    if entry is not None:
+        return entry
+    radians = math.radians(degrees)
+    cos, sin = math.cos(radians), math.sin(radians)
+    label = pi_label(degrees if isinstance(degrees, int) else Fraction(str(degrees)))
+    return SpecialAngle(degrees, radians, label, _quadrant(degrees),
+                        cos, sin, sin / cos, None, None, None)
+
+
+def by_radians(radians, tolerance=1e-9):
+    """Entry for an angle in radians; raises KeyError if it is not special."""
+    step = round(radians / STEP_RADIANS)
+    if 0 <= step < len(TABLE) and abs(step * STEP_RADIANS - radians) <= tolerance:
+        return TABLE[step]
+    raise KeyError(radians)
@@ -0,0 +1,85 @@
+"""Wavetable synthesis of notes and chords into in-memory WAV files."""
+import io
+import math
+import wave
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+CHUNK_SIZE = 8192
+FADE_SECONDS = 0.01
+PEAK = 0.8
+
+# Musical note frequencies (in Hz)
+NOTES = {
+    "C4": 261.63, "D4": 293.66, "E4": 329.63, "F4": 349.23,
+    "G4": 392.00, "A4": 440.00, "B4": 493.88, "C5": 523.25
+}
+
+# One cycle of sine plus a guard sample so interpolation never wraps.
+TABLE_SIZE = 4096
+WAVETABLE = np.sin(2 * math.pi * np.arange(TABLE_SIZE + 1) / TABLE_SIZE)
+
+
+def synthesize(frequencies, duration, sample_rate=SAMPLE_RATE, chunk_size=CHUNK_SIZE, table=WAVETABLE):
+    """Yield float32 chunks of the sum of ``frequencies`` lasting ``duration`` s.
+
+    Each chunk reads the wavetable with linear interpolation, so the cost
+    per sample is independent of the number of sine evaluations. ``table``
+    is one cycle (``TABLE_SIZE + 1`` samples, the last repeating the first)
+    shared by every frequency, or one such row per frequency. The mix is
+    normalised to ``PEAK`` and faded in and out to avoid clicks.
+    """
+    n_total = int(round(duration * sample_rate))
+    increments = np.asarray(frequencies, dtype=float)[:, None] * TABLE_SIZE / sample_rate
+    tables = np.atleast_2d(table)
+    rows = np.arange(len(tables))[:, None] if len(tables) > 1 else 0
+    fade = max(1, min(int(FADE_SECONDS * sample_rate), n_total // 2))
+    gain = PEAK / len(increments)
+
+    for start in range(0, n_total, chunk_size):
+        n = np.arange(start, min(start + chunk_size, n_total))
+        position = (n * increments) % TABLE_SIZE
+        index = position.astype(np.intp)
+        frac = position - index
+        here = tables[rows, index]
+        chunk = (here + frac * (tables[rows, index + 1] - here)).sum(axis=0) * gain
+
+        if start < fade:
+            head = n < fade
+            chunk[head] *= n[head] / fade
+        if n[-1] >= n_total - fade:
+            tail = n >= n_total - fade
+            chunk[tail] *= (n_total - 1 - n[tail]) / fade
+        yield chunk.astype(np.float32)
+
+
+def render_wav(frequencies, duration, sample_rate=SAMPLE_RATE, table=WAVETABLE):
+    """Return ``(wav_bytes, samples)`` for a note or chord (see ``synthesize`` for ``table``).
+
+    ``wav_bytes`` is a 16-bit mono PCM WAV file ready for ``st.audio`` and
+    ``samples`` is the same signal as a float32 array for plotting.
+    """
+    samples = np.empty(int(round(duration * sample_rate)), dtype=np.float32)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        offset = 0
+        for chunk in synthesize(frequencies, duration, sample_rate, table=table):
+            samples[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+            wav.writeframes((chunk * 32767).astype("<i2").tobytes())
+    samples.flags.writeable = False
+    return buffer.getvalue(), samples
+
+
+def waveform_view(samples, window, sample_rate=SAMPLE_RATE):
+    """Return ``(t, y)`` covering the first ``window`` seconds of ``samples``.
+
+    ``y`` is a view into the rendered buffer, so the plot shows exactly what
+    ``st.audio`` plays; reducing it for display is left to the chart helper.
+    """
+    y = samples[:max(1, int(window * sample_rate))]
+    return np.arange(len(y)) / sample_rate, y
@@ -0,0 +1,219 @@
+"""Bulk angle conversion: a column of angles in, a CSV of conversions out.
+
+A file is read ``chunk_rows`` rows at a time with pandas' C parser, and each
+chunk is converted with NumPy array operations and appended to the output,
+so memory use depends on the chunk size, not on the file size. Each output
+row holds the input text, degrees, radians, the π-fraction, sin, cos and tan.
+
+Angles in radians may be numbers (``2.356``) or π expressions (``3π/4``,
+``0.75pi``); those go through ``grading.parse_answer``, once per distinct
+string. Rows that cannot be read keep their input and leave the other
+columns empty, as does tan at ±90°. Blank lines are skipped; a file with
+no rows converts to just the header.
+
+Converted files go to ``OUTPUT_DIR``. ``new_output`` sweeps it first:
+files older than ``MATHCRAFT_BULK_TTL`` seconds (default an hour) go, then
+the oldest until the rest fit in ``MATHCRAFT_BULK_MB`` (default 1024), so
+results of sessions that ended are not left behind.
+"""
+import csv
+import os
+import tempfile
+import time
+from collections import namedtuple
+from fractions import Fraction
+
+import numpy as np
+import pandas as pd
+
+from mathcraft import grading
+from mathcraft.angles import pi_label
+
+UNITS = ("degrees", "radians")
+CHUNK_ROWS = 100_000
+COLUMNS = ["input", "degrees", "radians", "pi_fraction", "sin", "cos", "tan"]
+
+# Angles whose degrees × 140 are whole (every 0.1°, 1/7°, ...) get an exact
+# π-fraction; others get a decimal multiple of π such as "0.318π".
+_DENOMINATOR = 25200  # turns of π are k / 25200 for such angles
+_SNIFF_BYTES = 64 * 1024
+
+OUTPUT_DIR = os.path.join(tempfile.gettempdir(), "mathcraft_bulk")
+OUTPUT_TTL = float(os.environ.get("MATHCRAFT_BULK_TTL", "3600"))
+OUTPUT_MAX_BYTES = int(float(os.environ.get("MATHCRAFT_BULK_MB", "1024")) * 1024 * 1024)
+
+Progress = namedtuple("Progress", ["rows", "invalid", "bytes_read", "seconds"])
+Progress.__doc__ = """Running totals after a chunk; ``bytes_read`` is the input position."""
+
+
+def sniff(source):
+    """``(has_header, column names)`` from the first non-blank line of a CSV or text file.
+
+    That line is a header when its first field reads as an angle in neither
+    unit, so a ``3π/4`` in a degrees file is still a row. Without a header
+    the columns are named by position: "column 1", "column 2", ... A file
+    with no rows has no columns. ``source`` is a binary file object;
+    it is rewound afterwards.
+    """
+    start = source.tell()
+    lines = source.read(_SNIFF_BYTES).decode("utf-8", errors="replace").splitlines()
+    source.seek(start)
+    first = [line for line in lines if line.strip()][:1]
+    if not first:
+        return False, []
+    fields = next(csv.reader(first), [""])
+    first_field = pd.Series(fields[:1], dtype=object)
+    has_header = all(np.isnan(to_degrees(first_field, unit)[0]) for unit in UNITS)
+    names = fields if has_header else [f"column {i + 1}" for i in range(len(fields))]
+    return bool(has_header), names
+
+
+def to_degrees(texts, unit):
+    """Float array of degrees for a Series of input strings; NaN where unreadable."""
+    if unit == "degrees":
+        degrees = pd.to_numeric(texts.str.removesuffix("°"), errors="coerce").to_numpy(dtype=float, copy=True)
+    else:
+        values = pd.to_numeric(texts, errors="coerce").to_numpy(dtype=float)
+        degrees = np.degrees(values)
+        missing = np.isnan(values) & texts.notna().to_numpy()
+        if missing.any():
+            # π expressions: parse each distinct string once; exact ones stay exact.
+            codes, distinct = pd.factorize(texts[missing])
+            parsed = np.array([_expression_degrees(text) for text in distinct], dtype=float)
+            degrees[missing] = parsed[codes]
+    degrees[~np.isfinite(degrees)] = np.nan  # "inf", 1e400
+    return degrees
+
+
+def _expression_degrees(text):
+    parsed = grading.parse_answer(text)
+    if parsed is None:
+        return np.nan
+    if parsed.pi_power:
+        return float(parsed.coefficient * 180)
+    return float(np.degrees(float(parsed.coefficient)))
+
+
+def pi_fractions(degrees):
+    """π-fraction labels ("3π/4", "-π/6", "0.318π") for an array of degrees."""
+    turns = degrees / 180
+    with np.errstate(invalid="ignore"):
+        scaled = turns * _DENOMINATOR
+        whole = np.rint(scaled)
+        exact = (np.abs(scaled - whole) < 1e-6) & (np.abs(whole) < 2**53)
+    # One label per distinct value, formatted in Python; rows index into them.
+    labels = np.full(len(degrees), "", dtype=object)
+    exact_keys, exact_codes = np.unique(whole[exact], return_inverse=True)
+    labels[exact] = np.array([pi_label(Fraction(int(k) * 180, _DENOMINATOR)) for k in exact_keys],
+                             dtype=object)[exact_codes]
+    approximate = ~exact & np.isfinite(turns)
+    rounded = np.round(turns[approximate], 6)
+    approx_keys, approx_codes = np.unique(rounded, return_inverse=True)
+    labels[approximate] = np.array([f"{k:g}π" for k in approx_keys], dtype=object)[approx_codes]
+    return labels
+
+
+def _columns(degrees):
+    """The output columns after ``input`` for an array of degrees."""
+    turn = np.mod(degrees, 360)
+    sin = np.sin(np.radians(turn))
+    cos = np.cos(np.radians(turn))
+    # Exact zeros on the axes, so tan is 0 or undefined rather than ±1e16.
+    sin[np.mod(turn, 180) == 0] = 0.0
+    cos[np.mod(turn - 90, 180) == 0] = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tan = np.where(cos == 0, np.nan, sin / cos) + 0.0  # no "-0"
+    return {"degrees": degrees, "radians": np.radians(degrees), "pi_fraction": pi_fractions(degrees),
+            "sin": sin, "cos": cos, "tan": tan}
+
+
+def convert_chunk(texts, unit):
+    """DataFrame of ``COLUMNS`` for a Series of input strings."""
+    return pd.DataFrame({"input": texts.to_numpy(dtype=object), **_columns(to_degrees(texts, unit))},
+                        columns=COLUMNS)
+
+
+def _formatted(values):
+    cells = np.full(len(values), "", dtype=object)
+    finite = np.isfinite(values)
+    cells[finite] = [f"{value:.10g}" for value in values[finite].tolist()]
+    return cells
+
+
+def csv_lines(texts, degrees):
+    """CSV lines (no header) for input strings and their ``to_degrees`` values.
+
+    Every output column is a function of the angle, so each distinct angle is
+    converted and formatted once; files of whole degrees repeat a few hundred
+    values. Formatting floats is most of the cost of writing CSV.
+    """
+    if not len(texts):
+        return ""
+    distinct, inverse = np.unique(degrees, return_inverse=True)
+    columns = _columns(distinct)
+    lines = columns["pi_fraction"]
+    for name in ("sin", "cos", "tan"):
+        lines = lines + "," + _formatted(columns[name])
+    lines = _formatted(columns["degrees"]) + "," + _formatted(columns["radians"]) + "," + lines
+    inputs = texts.to_numpy(dtype=object).copy()
+    quoted = texts.str.contains(r'[",\r\n]', regex=True).to_numpy(dtype=bool)
+    inputs[quoted] = ['"' + text.replace('"', '""') + '"' for text in inputs[quoted]]
+    return "\n".join((inputs + "," + lines[inverse.ravel()]).tolist()) + "\n"
+
+
+def convert_file(source, out, unit, column=0, has_header=False, chunk_rows=CHUNK_ROWS):
+    """Convert one column of ``source`` into CSV text written to ``out``.
+
+    ``source`` is a binary file object, ``out`` a text one, and ``column``
+    a position. Yields a ``Progress`` after every chunk, so callers can
+    report it. A file that cannot be parsed raises ``ValueError`` (pandas'
+    ``ParserError``).
+    """
+    out.write(",".join(COLUMNS) + "\n")
+    try:
+        reader = pd.read_csv(source, header=0 if has_header else None, usecols=[column], dtype=str,
+                             chunksize=chunk_rows, skip_blank_lines=True, keep_default_na=False,
+                             encoding_errors="replace")
+    except pd.errors.EmptyDataError:
+        return  # no rows
+    start = time.perf_counter()
+    rows = invalid = 0
+    for chunk in reader:
+        texts = chunk.iloc[:, 0].str.strip()
+        degrees = to_degrees(texts, unit)
+        out.write(csv_lines(texts, degrees))
+        rows += len(texts)
+        invalid += int(np.isnan(degrees).sum())
+        yield Progress(rows, invalid, source.tell(), time.perf_counter() - start)
+
+
+def sweep_outputs(ttl=OUTPUT_TTL, max_bytes=OUTPUT_MAX_BYTES):
+    """Delete converted files older than ``ttl`` seconds, then the oldest beyond ``max_bytes``."""
+    try:
+        entries = [entry for entry in os.scandir(OUTPUT_DIR) if entry.is_file()]
+    except FileNotFoundError:
+        return
+    now = time.time()
+    files = []
+    for entry in entries:
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:  # swept by another session
+            continue
+        files.append((stat.st_mtime, stat.st_size, entry.path))
+    files.sort(reverse=True)  # newest first
+    kept = 0
+    for mtime, size, path in files:
+        kept += size
+        if now - mtime > ttl or kept > max_bytes:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def new_output():
+    """``(fd, path)`` of a new file in ``OUTPUT_DIR`` for a conversion, after sweeping it."""
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    sweep_outputs()
+    return tempfile.mkstemp(prefix="converted_", suffix=".csv", dir=OUTPUT_DIR)
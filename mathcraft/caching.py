@@ -0,0 +1,176 @@
+"""Process-wide memo caches for the lesson builders, with limits and counters.
+
+``cached`` stands in for ``st.cache_resource`` on the figure and curve
+builders. Every session shares one cache per function, which keeps up to
+``max_entries`` results and ``max_bytes`` of them, evicting the least
+recently used entry first. Entries older than ``ttl`` seconds are
+dropped when next looked up, or on any insert. Each cache counts hits,
+misses and evictions by reason; ``stats`` reports them for the admin view.
+Lookups inside ``with warming():`` (the startup warm-up) count as
+``warmed`` instead, so the hit rate is what students actually got.
+
+Arguments must be hashable (the lessons pass tuples, not lists). Results
+are shared, as with ``st.cache_resource``: callers must not modify them.
+Defaults come from ``MATHCRAFT_CACHE_MB`` (bytes per cache, in megabytes)
+and ``MATHCRAFT_CACHE_TTL`` (seconds; unset or 0 for no expiry).
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = int(float(os.environ.get("MATHCRAFT_CACHE_MB", "64")) * 1024 * 1024)
+DEFAULT_TTL = float(os.environ.get("MATHCRAFT_CACHE_TTL", "0")) or None
+
+_registry = {}
+_registry_lock = threading.Lock()
+_local = threading.local()
+
+
+@contextmanager
+def warming():
+    """Count this thread's cache lookups as warm-up rather than hits and misses."""
+    _local.warming = True
+    try:
+        yield
+    finally:
+        _local.warming = False
+
+
+def sizeof(value):
+    """Approximate bytes held by ``value``: buffers by size, containers recursively."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(sizeof(k) + sizeof(v) for k, v in value.items()) + 64
+    if isinstance(value, (list, tuple)):
+        return sum(sizeof(v) for v in value) + 8 * len(value)
+    if hasattr(value, "to_plotly_json"):  # go.Figure and its traces
+        return sizeof(value.to_plotly_json())
+    return sys.getsizeof(value)
+
+
+class Cache:
+    """An LRU map with entry, byte and age limits; thread-safe."""
+
+    def __init__(self, name, max_entries=128, max_bytes=None, ttl=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = DEFAULT_MAX_BYTES if max_bytes is None else max_bytes
+        self.ttl = DEFAULT_TTL if ttl is None else ttl
+        self._entries = OrderedDict()  # key -> (value, bytes, stored at)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = self.misses = self.warmed = 0
+        self.evictions = {"lru": 0, "bytes": 0, "ttl": 0}
+
+    def _expired(self, stored, now):
+        return self.ttl is not None and now - stored > self.ttl
+
+    def _drop(self, key, reason):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+        self.evictions[reason] += 1
+
+    def get(self, key):
+        """``(True, value)`` for a live entry (now the most recent), else ``(False, None)``."""
+        warming = getattr(_local, "warming", False)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry[2], time.monotonic()):
+                self._drop(key, "ttl")
+                entry = None
+            if entry is None:
+                if warming:
+                    self.warmed += 1
+                else:
+                    self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += not warming
+            return True, entry[0]
+
+    def put(self, key, value):
+        size = sizeof(value)
+        if size > self.max_bytes:
+            return  # would evict everything else and still not fit
+        now = time.monotonic()
+        with self._lock:
+            if key in self._entries:
+                _, old, _ = self._entries.pop(key)
+                self.bytes -= old
+            for stale in [k for k, (_, _, stored) in self._entries.items() if self._expired(stored, now)]:
+                self._drop(stale, "ttl")
+            self._entries[key] = (value, size, now)
+            self.bytes += size
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)), "lru")
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)), "bytes")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self):
+        looked_up = self.hits + self.misses
+        return {
+            "cache": self.name, "entries": len(self), "max entries": self.max_entries,
+            "MB": round(self.bytes / 2**20, 2), "max MB": round(self.max_bytes / 2**20, 1),
+            "warmed": self.warmed, "hits": self.hits, "misses": self.misses,
+            "hit rate": round(self.hits / looked_up, 3) if looked_up else None,
+            **{f"evicted ({reason})": count for reason, count in self.evictions.items()},
+        }
+
+
+def cached(max_entries=128, max_bytes=None, ttl=None, name=None):
+    """Decorator memoizing a function in a registered ``Cache``.
+
+    The wrapper exposes the cache as ``.cache`` and ``.clear()``. Two
+    sessions missing on the same key at once may both compute it; the
+    second result replaces the first.
+    """
+    def decorator(func):
+        cache = Cache(name or f"{func.__module__}.{func.__name__}", max_entries, max_bytes, ttl)
+        with _registry_lock:
+            _registry[cache.name] = cache
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            found, value = cache.get(key)
+            if not found:
+                value = func(*args, **kwargs)
+                cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.clear = cache.clear
+        return wrapper
+    return decorator
+
+
+def caches():
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def stats():
+    """One row per registered cache, by name, for ``st.dataframe``."""
+    return [cache.stats() for cache in sorted(caches(), key=lambda c: c.name)]
+
+
+def clear_all():
+    for cache in caches():
+        cache.clear()
@@ -0,0 +1,108 @@
+"""Plot samples of ``y = A·f(Bx + C) + D`` for the six trig functions.
+
+``sample`` sizes the starting grid from the period (``POINTS_PER_PERIOD``
+points per period, however high the frequency), then lets
+``sampling.refine`` add points only where the curve bends more than a
+pixel budget allows. A fixed 1,000-point grid draws too few points per
+period at high frequency and too many at low frequency.
+
+tan, sec, csc and cot are split at their vertical asymptotes. Each branch
+is sampled up to where it leaves the plot (``CLIP`` amplitudes from the
+midline, plus a margin) and the branches are separated by a NaN point,
+which Plotly draws as a gap rather than a near-vertical line.
+"""
+import math
+
+import numpy as np
+
+from mathcraft.sampling import refine
+
+FUNCTIONS = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "sec": lambda t: 1 / np.cos(t),
+    "csc": lambda t: 1 / np.sin(t),
+    "cot": lambda t: np.cos(t) / np.sin(t),
+}
+# Asymptotes sit where Bx + C = offset + kπ.
+POLE_OFFSETS = {"tan": math.pi / 2, "sec": math.pi / 2, "csc": 0.0, "cot": 0.0}
+
+POINTS_PER_PERIOD = 16
+CLIP = 4.0  # tan/sec/csc/cot are shown within D ± CLIP·|A|
+_OVERSHOOT = 1.1  # and sampled a little past it, so branches leave the plot
+
+
+def period(name, frequency):
+    return (math.pi if name in ("tan", "cot") else 2 * math.pi) / abs(frequency)
+
+
+def y_range(names, amplitude, vertical):
+    """Fixed y-axis range when an unbounded function is shown, else None (autoscale)."""
+    if not any(name in POLE_OFFSETS for name in names):
+        return None
+    reach = CLIP * abs(amplitude)
+    return [vertical - reach, vertical + reach]
+
+
+def poles(name, frequency, phase, a, b):
+    """Sorted x of the vertical asymptotes of ``name(Bx + C)`` in ``[a, b]``."""
+    if name not in POLE_OFFSETS:
+        return np.empty(0)
+    offset = POLE_OFFSETS[name]
+    t = sorted((frequency * a + phase, frequency * b + phase))
+    k = np.arange(math.ceil((t[0] - offset) / math.pi), math.floor((t[1] - offset) / math.pi) + 1)
+    return np.sort((offset + k * math.pi - phase) / frequency)
+
+
+def _clearance(name):
+    # Distance in Bx + C from an asymptote at which |f| reaches CLIP × _OVERSHOOT.
+    reach = CLIP * _OVERSHOOT
+    return math.atan(1 / reach) if name in ("tan", "cot") else math.asin(1 / reach)
+
+
+def _grid(lo, hi, step):
+    return np.linspace(lo, hi, max(3, math.ceil((hi - lo) / step) + 1))
+
+
+def sample(name, amplitude, frequency, phase, vertical, a=-2 * math.pi, b=2 * math.pi,
+           width_px=700, height_px=400, error_px=0.5, max_points=4000):
+    """``(x, y)`` arrays for the curve on ``[a, b]``; NaN in y marks an asymptote.
+
+    ``error_px`` is how far, in pixels of a ``width_px`` × ``height_px``
+    plot, a straight segment may stray from the curve; no interval is split
+    below one pixel's width.
+    """
+    f = FUNCTIONS[name]
+
+    def func(x):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return amplitude * f(frequency * x + phase) + vertical
+
+    height = 2 * abs(amplitude) * (CLIP if name in POLE_OFFSETS else 1) or 1.0
+    error = error_px * height / height_px
+    step = period(name, frequency) / POINTS_PER_PERIOD
+
+    if name not in POLE_OFFSETS:
+        x = _grid(a, b, step)
+        y = func(x)
+    else:
+        # Branches between neighbouring asymptotes (including ones just outside
+        # [a, b]), trimmed to where they leave the plot, joined by NaN points.
+        margin = period(name, frequency)
+        edges = poles(name, frequency, phase, a - margin, b + margin)
+        gap = _clearance(name) / abs(frequency)
+        pieces_x, pieces_y = [], []
+        for left, right in zip(edges[:-1], edges[1:]):
+            lo, hi = max(a, left + gap), min(b, right - gap)
+            if lo >= hi:
+                continue
+            if pieces_x:
+                pieces_x.append([left])
+                pieces_y.append([np.nan])
+            branch = _grid(lo, hi, step)
+            pieces_x.append(branch)
+            pieces_y.append(func(branch))
+        x, y = np.concatenate(pieces_x), np.concatenate(pieces_y)
+
+    return refine(func, x, y, error, min_dx=(b - a) / width_px, max_points=max_points)
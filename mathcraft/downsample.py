@@ -0,0 +1,69 @@
+"""Shape-preserving downsampling of line traces.
+
+Both algorithms return sorted indices into the original arrays so callers can
+apply the same selection to any per-point data (text, colors, ...).
+"""
+import numpy as np
+
+
+def minmax_indices(y, n_out):
+    """Keep the lowest and highest point of each of ``n_out // 2`` buckets.
+
+    Best for dense signals (audio, many samples per pixel): the drawn envelope
+    is exactly the one a full-resolution plot would show.
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 4:
+        return np.arange(n)
+
+    size = -(-n // (n_out // 2))
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    padded = padded.reshape(buckets, size)
+    base = np.arange(buckets) * size
+    chosen = np.concatenate([
+        [0, n - 1],
+        base + np.nanargmin(padded, axis=1),
+        base + np.nanargmax(padded, axis=1),
+    ])
+    return np.unique(chosen)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets selection of ``n_out`` points.
+
+    Keeps the first and last point and, from each interior bucket, the point
+    forming the largest triangle with the previous pick and the next bucket's
+    mean. Best for smooth curves with a few points per pixel. ``x`` must be
+    increasing.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    chosen = np.empty(n_out, dtype=np.intp)
+    chosen[0], chosen[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        chosen[i + 1] = a
+    return chosen
+
+
+def downsample_indices(x, y, n_out, method="lttb"):
+    """Indices of at most ``n_out`` points of (x, y) using ``method``."""
+    if method == "minmax":
+        return minmax_indices(y, n_out)
+    if method == "lttb":
+        return lttb_indices(x, y, n_out)
+    raise ValueError(f"Unknown downsampling method: {method!r}")
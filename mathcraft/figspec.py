@@ -0,0 +1,146 @@
+"""Plain-dict Plotly figure specs for the diagrams the lessons draw.
+
+Building ``go.Figure``/``go.Scatter`` objects runs every property through
+Plotly's validator classes, which costs milliseconds per diagram on every
+rerun. These builders return the structure ``fig.to_dict()`` would produce
+(``{"data": [...], "layout": {...}}``) as plain dicts and lists, using only
+property names and values Plotly accepts unchanged, so validation can be
+skipped: ``lessons.charts.plotly_chart`` wraps a spec with
+``go.Figure(spec, _validate=False)``.
+
+Trace builders return one trace dict (or a list for composite shapes);
+``figure`` assembles traces, annotations and shapes into a spec.
+"""
+import numpy as np
+
+CIRCLE_SAMPLES = 100
+
+
+def trace(x, y, mode="lines", name=None, color=None, width=None, dash=None,
+          marker_size=None, marker_color=None, showlegend=None, **props):
+    """A scatter trace; only the properties that are set are emitted.
+
+    ``mode=None`` leaves the mode to plotly.js (lines for long traces).
+    """
+    spec = {"type": "scatter", "x": x, "y": y}
+    if mode is not None:
+        spec["mode"] = mode
+    if name is not None:
+        spec["name"] = name
+    line = {key: value for key, value in (("color", color), ("width", width), ("dash", dash))
+            if value is not None}
+    if line and (mode is None or "lines" in mode):
+        spec["line"] = line
+    marker = {key: value for key, value in (("color", marker_color), ("size", marker_size))
+              if value is not None}
+    if marker:
+        spec["marker"] = marker
+    if showlegend is not None:
+        spec["showlegend"] = showlegend
+    spec.update(props)
+    return spec
+
+
+def circle(radius=1.0, color="lightblue", width=3, name=None, samples=CIRCLE_SAMPLES, **props):
+    theta = np.linspace(0, 2*np.pi, samples)
+    return trace(radius * np.cos(theta), radius * np.sin(theta), name=name, color=color, width=width, **props)
+
+
+def axes(extent, color="gray", width=1, names=(None, None), **props):
+    """Horizontal and vertical axis lines through the origin, ``extent`` each way."""
+    return [
+        trace([-extent, extent], [0, 0], name=names[0], color=color, width=width, **props),
+        trace([0, 0], [-extent, extent], name=names[1], color=color, width=width, **props),
+    ]
+
+
+def ray(x, y, color="red", width=3, marker_size=8, name=None, **props):
+    """Segment from the origin to (x, y) with a marker at each end."""
+    return trace([0, x], [0, y], mode="lines+markers", name=name, color=color, width=width,
+                 marker_size=marker_size, **props)
+
+
+def point(x, y, text, color="red", size=12, name=None, textposition="top center", **props):
+    return trace([x], [y], mode="markers+text", name=name, marker_size=size, marker_color=color,
+                 text=[text], textposition=textposition, **props)
+
+
+def projections(x, y, names=(None, None), colors=("green", "blue"), width=2, **props):
+    """Dashed drop lines from (x, y): vertical to the x-axis, horizontal to the y-axis."""
+    return [
+        trace([x, x], [0, y], name=names[0], color=colors[0], width=width, dash="dash", **props),
+        trace([0, x], [y, y], name=names[1], color=colors[1], width=width, dash="dash", **props),
+    ]
+
+
+def right_triangle(adjacent, opposite, color="blue", width=3, marker_size=8, name=None, **props):
+    """Outline of the right triangle with the right angle at (adjacent, 0)."""
+    return trace([0, adjacent, adjacent, 0], [0, 0, opposite, 0], mode="lines+markers", name=name,
+                 color=color, width=width, marker_size=marker_size, **props)
+
+
+def right_angle_marker(corner_x, size=1, color="gray", width=2, **props):
+    return trace([corner_x - size, corner_x - size, corner_x], [0, size, size],
+                 color=color, width=width, **props)
+
+
+def angle_arc(degrees, radius=1.0, color="purple", width=2, name=None, **props):
+    """Arc of ``radius`` from 0° up to (not including) ``degrees``, one point per degree."""
+    theta = np.radians(np.arange(degrees))
+    return trace(radius * np.cos(theta), radius * np.sin(theta), name=name, color=color, width=width, **props)
+
+
+def wave(x, y, name=None, color=None, width=3, mode=None, **props):
+    return trace(x, y, mode=mode, name=name, color=color, width=width, **props)
+
+
+def annotation(x, y, text, size=12, color=None, textangle=None):
+    font = {"color": color, "size": size} if color is not None else {"size": size}
+    spec = {"font": font, "showarrow": False, "text": text, "x": x, "y": y}
+    if textangle is not None:
+        spec["textangle"] = textangle
+    return spec
+
+
+def hline(y=0, color="gray", dash="dot"):
+    return {"line": {"color": color, "dash": dash}, "type": "line",
+            "x0": 0, "x1": 1, "xref": "x domain", "y0": y, "y1": y, "yref": "y"}
+
+
+def vline(x=0, color="gray", dash="dot"):
+    return {"line": {"color": color, "dash": dash}, "type": "line",
+            "x0": x, "x1": x, "xref": "x", "y0": 0, "y1": 1, "yref": "y domain"}
+
+
+def layout(title=None, height=None, width=None, xaxis=None, yaxis=None, xaxis_title=None,
+           yaxis_title=None, showlegend=None, **props):
+    spec = {}
+    if title is not None:
+        spec["title"] = {"text": title}
+    for axis, settings, axis_title in (("xaxis", xaxis, xaxis_title), ("yaxis", yaxis, yaxis_title)):
+        settings = dict(settings or {})
+        if axis_title is not None:
+            settings["title"] = {"text": axis_title}
+        if settings:
+            spec[axis] = settings
+    for key, value in (("width", width), ("height", height), ("showlegend", showlegend)):
+        if value is not None:
+            spec[key] = value
+    spec.update(props)
+    return spec
+
+
+def figure(data, layout=None, annotations=(), shapes=(), frames=None):
+    """Assemble a figure spec; ``data`` may mix traces and lists of traces."""
+    traces = []
+    for item in data:
+        traces.extend(item if isinstance(item, list) else [item])
+    spec_layout = dict(layout or {})
+    if shapes:
+        spec_layout["shapes"] = list(shapes)
+    if annotations:
+        spec_layout["annotations"] = list(annotations)
+    spec = {"data": traces, "layout": spec_layout}
+    if frames is not None:
+        spec["frames"] = frames
+    return spec
@@ -0,0 +1,206 @@
+"""Parse and grade radian answers such as ``3π/4``, ``0.75pi`` or ``2.356``.
+
+``parse_answer`` turns free text into an exact rational coefficient and a
+power of π (0 for a plain number, 1 for a multiple of π). It is memoized, so
+a classroom where everyone types ``π/4`` parses that string once.
+
+An answer is graded against the expected angle in degrees:
+
+* ``EXACT`` - a multiple of π whose coefficient equals ``degrees/180``
+  exactly (``3π/4``, ``0.75pi``, ``135*pi/180``);
+* ``APPROX`` - any answer whose value in radians is within ``tolerance`` of
+  the expected one (``2.356`` for 135°, ``0.333π`` for 60°);
+* ``WRONG`` - parsed but outside the tolerance;
+* ``UNPARSED`` - not a number or multiple of π.
+
+``grade_batch`` grades whole worksheets: every distinct string is parsed once
+and the comparison runs as NumPy array operations. A missing answer (None or
+NaN, as a blank DataFrame cell reads) is ``WRONG``; a plain number is graded
+as radians.
+"""
+import functools
+import re
+from collections import namedtuple
+from fractions import Fraction
+
+import numpy as np
+
+EXACT, APPROX, WRONG, UNPARSED = 2, 1, 0, -1
+VERDICTS = {EXACT: "exact", APPROX: "approximate", WRONG: "wrong", UNPARSED: "unparsed"}
+DEFAULT_TOLERANCE = 0.005  # radians; accepts 3 decimal places
+
+ParsedAnswer = namedtuple("ParsedAnswer", ["coefficient", "pi_power"])
+ParsedAnswer.__doc__ = """``coefficient × π**pi_power`` with ``pi_power`` 0 or 1."""
+
+_TOKEN = re.compile(r"\s*(?:(\d+\.?\d*|\.\d+)|(π)|([-+*/()]))")
+_UNITS = re.compile(r"\s*(?:radians?|rads?)\s*$")
+_REWRITES = (("pi", "π"), ("×", "*"), ("·", "*"), ("÷", "/"), ("−", "-"))
+
+
+def _tokenize(text):
+    text = text.strip().lower()
+    for old, new in _REWRITES:
+        text = text.replace(old, new)
+    text = _UNITS.sub("", text)
+    tokens, pos = [], 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None:
+            return None
+        number, pi, op = match.groups()
+        if number is not None:
+            tokens.append(("num", Fraction(number)))
+        elif pi is not None:
+            tokens.append(("pi", None))
+        elif op is not None:
+            tokens.append((op, None))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive descent over ``term := unary (('*' | '/' | implicit) unary)*``.
+
+    Values are (coefficient, pi_power) pairs, so ``135*π/180`` stays exact.
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def term(self):
+        coefficient, power = self.unary()
+        while self.peek() in ("*", "/", "num", "pi", "("):
+            op = self.take()[0] if self.peek() in ("*", "/") else "*"
+            rhs, rhs_power = self.unary()
+            if op == "*":
+                coefficient, power = coefficient * rhs, power + rhs_power
+            elif rhs == 0:
+                raise ZeroDivisionError
+            else:
+                coefficient, power = coefficient / rhs, power - rhs_power
+        return coefficient, power
+
+    def unary(self):
+        if self.peek() in ("-", "+"):
+            sign = -1 if self.take()[0] == "-" else 1
+            coefficient, power = self.unary()
+            return sign * coefficient, power
+        return self.atom()
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "num":
+            return value, 0
+        if kind == "pi":
+            return Fraction(1), 1
+        if kind == "(":
+            result = self.term()
+            if self.take()[0] != ")":
+                raise ValueError
+            return result
+        raise ValueError
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_answer(text):
+    """``ParsedAnswer`` for ``text``, or None if it cannot be read."""
+    tokens = _tokenize(text)
+    if not tokens:
+        return None
+    parser = _Parser(tokens)
+    try:
+        coefficient, power = parser.term()
+    except (IndexError, ValueError, ZeroDivisionError):
+        return None
+    if parser.pos != len(tokens) or power not in (0, 1):
+        return None
+    return ParsedAnswer(coefficient, power)
+
+
+def answer_radians(parsed):
+    return float(parsed.coefficient) * (np.pi if parsed.pi_power else 1.0)
+
+
+def _answer_text(value):
+    """``value`` as text to parse, or None for a missing answer (None, NaN)."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float, np.integer, np.floating)) and np.isfinite(value):
+        return repr(float(value))
+    return None
+
+
+def grade(text, expected_degrees, tolerance=DEFAULT_TOLERANCE):
+    """Verdict (``EXACT``, ``APPROX``, ``WRONG`` or ``UNPARSED``) for one answer."""
+    text = _answer_text(text)
+    if text is None:
+        return WRONG
+    parsed = parse_answer(text)
+    if parsed is None:
+        return UNPARSED
+    if parsed.pi_power and parsed.coefficient == Fraction(expected_degrees, 180):
+        return EXACT
+    if abs(answer_radians(parsed) - np.radians(expected_degrees)) <= tolerance:
+        return APPROX
+    return WRONG
+
+
+def _parsed_columns(texts):
+    """Arrays describing each distinct answer: numerator, denominator, π power, radians."""
+    count = len(texts)
+    numerators = np.zeros(count, dtype=np.int64)
+    denominators = np.ones(count, dtype=np.int64)
+    powers = np.full(count, -1, dtype=np.int8)
+    values = np.full(count, np.nan)
+    for i, answer in enumerate(texts):
+        text = _answer_text(answer)
+        if text is None:
+            powers[i] = 0  # missing: never exact, and NaN is never close
+            continue
+        parsed = parse_answer(text)
+        if parsed is None:
+            continue
+        powers[i] = parsed.pi_power
+        values[i] = answer_radians(parsed)
+        coefficient = parsed.coefficient
+        if abs(coefficient.numerator) < 2**40 and coefficient.denominator < 2**40:
+            numerators[i], denominators[i] = coefficient.numerator, coefficient.denominator
+        else:
+            powers[i] = 0  # too large to compare exactly; fall back to the value
+    return numerators, denominators, powers, values
+
+
+def grade_batch(answers, expected_degrees, tolerance=DEFAULT_TOLERANCE):
+    """Grade many answers at once; returns an int8 array of verdicts.
+
+    ``answers`` is any sequence (or NumPy array) of strings and
+    ``expected_degrees`` an integer or an array broadcastable with it, e.g.
+    one row of question angles for a students × questions sheet. The
+    verdicts have the broadcast shape.
+    """
+    answers, expected = np.broadcast_arrays(np.asarray(answers, dtype=object),
+                                            np.asarray(expected_degrees, dtype=np.int64))
+    shape = answers.shape
+    answers, expected = answers.ravel(), expected.ravel()
+
+    distinct = {}
+    index = np.fromiter((distinct.setdefault(a, len(distinct)) for a in answers),
+                        dtype=np.intp, count=len(answers))
+    numerators, denominators, powers, values = (column[index] for column in _parsed_columns(list(distinct)))
+
+    # n/d == e/180  <=>  180·n == e·d, exact in int64 for any reasonable input
+    exact = (powers == 1) & (numerators * 180 == expected * denominators)
+    close = np.abs(values - np.radians(expected)) <= tolerance
+    verdicts = np.where(close, APPROX, WRONG).astype(np.int8)
+    verdicts[exact] = EXACT
+    verdicts[powers < 0] = UNPARSED
+    return verdicts.reshape(shape)
@@ -0,0 +1,103 @@
+"""Waves built from harmonics: Fourier-series presets, chords and spectra.
+
+A wave is a sum of sines ``Σ bₖ sin(2π fₖ t)``. ``basis`` evaluates every
+sine once into a (terms × samples) matrix and ``evaluate`` is one matrix
+product of the coefficients with it, so new coefficients cost a ``@`` and
+no sine at all. Callers cache the basis by frequency and time grid and
+slice its first rows for fewer terms.
+
+``PRESETS`` are the Fourier series of the square, sawtooth and triangle
+waves (and a lone sine), truncated to N nonzero terms: the square and
+triangle waves only have odd harmonics. A chord stacks one basis per note
+along a leading axis. ``wavetables`` renders one cycle per note for
+``audio.synthesize``; ``spectrum`` is the magnitude of the real FFT of the
+rendered signal.
+"""
+import math
+
+import numpy as np
+
+from mathcraft.audio import SAMPLE_RATE, TABLE_SIZE
+
+MAX_TERMS = 200
+SPECTRUM_SAMPLES = 65536
+
+# name -> (step between harmonic numbers, coefficient of harmonic n)
+PRESETS = {
+    "square": (2, lambda n: 4 / (math.pi * n)),
+    "sawtooth": (1, lambda n: 2 / math.pi * (-1.0) ** (n + 1) / n),
+    "triangle": (2, lambda n: 8 / math.pi**2 * (-1.0) ** ((n - 1) // 2) / n**2),
+    "sine": (1, lambda n: (n == 1) * 1.0),
+}
+
+
+def harmonic_numbers(step, terms):
+    """The first ``terms`` harmonic numbers, ``1, 1 + step, 1 + 2·step, ...``."""
+    return 1 + step * np.arange(terms)
+
+
+def series(preset, terms):
+    """Harmonic numbers and Fourier coefficients of the first ``terms`` terms of ``preset``."""
+    step, coefficient = PRESETS[preset]
+    n = harmonic_numbers(step, terms)
+    return n, coefficient(n)
+
+
+def basis(frequencies, t, dtype=np.float32):
+    """``sin(2π f t)`` for every frequency (any shape) and time: shape ``(*frequencies.shape, len(t))``.
+
+    The phases are computed in float64 (f·t reaches millions of radians for
+    high harmonics) and stored as ``dtype``.
+    """
+    return np.sin(2 * math.pi * np.multiply.outer(np.asarray(frequencies, dtype=float), t)).astype(dtype)
+
+
+def band_limited(coefficients, frequencies, limit):
+    """``coefficients`` with the terms whose frequency is ``limit`` or more set to 0.
+
+    A harmonic above the Nyquist frequency of a sample grid would alias to
+    a false lower tone; dropping it is what an ideal band limit does.
+    """
+    return np.where(np.asarray(frequencies) < limit, coefficients, 0.0)
+
+
+def evaluate(coefficients, basis):
+    """``Σ coefficients[k] · basis[k]``: one matrix product (batched over a chord's notes).
+
+    ``basis`` is ``(terms, samples)`` or ``(notes, terms, samples)``;
+    ``coefficients`` is ``(terms,)``, or ``(notes, terms)`` for per-note
+    coefficients. The notes of a chord are summed.
+    """
+    c = np.asarray(coefficients, dtype=basis.dtype)
+    wave = c[..., None, :] @ basis
+    return wave.reshape(-1, basis.shape[-1]).sum(axis=0)
+
+
+def cycle_basis(harmonics):
+    """``basis`` of ``harmonics`` over one period, sampled like ``audio.WAVETABLE``."""
+    return basis(harmonics, np.arange(TABLE_SIZE + 1) / TABLE_SIZE)
+
+
+def wavetables(coefficients, cycle, frequencies, sample_rate=SAMPLE_RATE):
+    """One cycle per note, scaled to a peak of 1, for ``audio.synthesize``.
+
+    ``cycle`` is the ``cycle_basis`` of the terms and ``frequencies`` the
+    ``(notes, terms)`` frequencies they play at; terms at or above the
+    Nyquist frequency are dropped for that note.
+    """
+    c = band_limited(coefficients, frequencies, sample_rate / 2).astype(cycle.dtype)
+    tables = c @ cycle
+    peak = np.abs(tables).max(axis=1, keepdims=True)
+    return tables / np.where(peak > 0, peak, 1)
+
+
+def spectrum(samples, sample_rate=SAMPLE_RATE, max_samples=SPECTRUM_SAMPLES):
+    """``(frequencies, amplitudes)`` of the first ``max_samples`` samples.
+
+    The signal is Hann-windowed before ``numpy.fft.rfft`` and scaled so a
+    sine of amplitude ``a`` shows as a peak of about ``a``.
+    """
+    x = np.asarray(samples[:max_samples], dtype=float)
+    window = np.hanning(len(x)) if len(x) > 1 else np.ones(len(x))
+    amplitudes = 2 * np.abs(np.fft.rfft(x * window)) / window.sum()
+    return np.fft.rfftfreq(len(x), 1 / sample_rate), amplitudes
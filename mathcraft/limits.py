@@ -0,0 +1,71 @@
+"""sin(x)/x near 0, computed two ways.
+
+``sinc`` and ``sinc_gap`` (``1 - sin(x)/x``) switch to their Taylor series
+near 0, so they are accurate down to x = 0 itself. ``naive_sinc_gap`` is
+the textbook ``1 - np.sin(x) / x`` in float64. Once sin(x)/x is within a
+few ulps of 1 (x below about 1e-7) the subtraction cancels almost every
+digit: the result becomes a staircase of multiples of 2⁻⁵³, then exactly 0.
+The lesson plots both so students can see where that starts.
+
+``limit_table`` computes the numerical-test table for many x at once.
+"""
+import math
+
+import numpy as np
+
+# Below these |x| the series are used; their next terms are under 1e-18 there.
+_SINC_SERIES = 1e-4
+_GAP_SERIES = 0.1
+
+DEGREE = math.pi / 180  # the limit of sin(x°)/x
+
+
+def sinc_gap(x):
+    """``1 - sin(x)/x``, accurate for every x (x²/6 - x⁴/120 + ... near 0)."""
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < _GAP_SERIES
+    x2 = x * x
+    series = x2 / 6 * (1 - x2 / 20 * (1 - x2 / 42 * (1 - x2 / 72)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        direct = 1 - np.sin(x) / x
+    return np.where(small, series, direct)
+
+
+def sinc(x):
+    """``sin(x)/x`` with its limit 1 at x = 0."""
+    x = np.asarray(x, dtype=float)
+    small = np.abs(x) < _SINC_SERIES
+    with np.errstate(divide="ignore", invalid="ignore"):
+        direct = np.sin(x) / x
+    return np.where(small, 1 - x * x / 6, direct)
+
+
+def degree_sinc(x):
+    """``sin(x°)/x``: x in degrees on top, a plain number below. Tends to π/180."""
+    return DEGREE * sinc(DEGREE * np.asarray(x, dtype=float))
+
+
+def naive_sinc_gap(x):
+    """``1 - sin(x)/x`` as written, in float64; NaN at 0."""
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 1 - np.sin(x) / x
+
+
+def limit_table(x):
+    """Columns of the numerical table for an array of x values."""
+    x = np.asarray(x, dtype=float)
+    sin = np.sin(x)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = sin / x
+    exact_gap = sinc_gap(x)
+    naive_gap = 1 - ratio
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative_error = np.abs(naive_gap - exact_gap) / exact_gap
+    return {
+        "x": x, "sin_x": sin, "ratio": ratio, "degree_ratio": degree_sinc(x),
+        "naive_gap": naive_gap, "gap": exact_gap,
+        # Correct digits of the float64 1 - sin(x)/x: about 16 when exact, 0 when all lost
+        # (+ 0.0 turns the clipped -0.0 into 0.0).
+        "digits": np.clip(-np.log10(np.maximum(relative_error, 1e-17)), 0, 16) + 0.0,
+    }
@@ -0,0 +1,272 @@
+"""Opt-in allocation profiling of sampled reruns with ``tracemalloc``.
+
+Tracing every allocation all the time slows a rerun down several times
+over. Instead every ``EVERY``-th rerun is traced from its start to its
+end, and the other reruns pay nothing. Tracing starts empty, so the
+snapshot at the end of the rerun is its diff against the start: exactly
+the allocations the rerun made and did not free (``retained``), plus its
+peak. Sites are grouped so growth can be pinned to a line: a figure
+being built (plotly), a ``np.linspace`` grid (numpy), a sine evaluation
+in ``mathcraft``. A site is the innermost frame in the app's own code, so
+a numpy or plotly allocation is charged to the lesson line that asked
+for it, and categorized by the library that made it. The biggest
+session-state values are logged too.
+
+Records go to an append-only JSONL log, like ``profiling``'s.
+``summarize``, ``top_sites`` and ``report`` compare the sampled reruns of
+each lesson for the admin view and a downloadable text report. A site
+that retains memory in every sample is a leak candidate. Only one rerun
+is traced at a time, and tracemalloc is process-wide, so allocations
+other sessions make meanwhile are included.
+
+Streamlit runs every rerun on a new thread, so the traced rerun's thread
+is recorded globally. If that rerun never reaches ``end`` (its thread
+died, or it has been traced for over ``MAX_TRACE_SECONDS``), the next
+``begin`` stops tracing and takes over.
+
+``MATHCRAFT_MEMPROFILE=1`` turns sampling on at startup;
+``MATHCRAFT_MEMPROFILE_EVERY`` (default 10; 0 samples nothing) and
+``MATHCRAFT_MEMPROFILE_FRAMES`` (default 16) trade detail for overhead.
+"""
+import json
+import linecache
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+from mathcraft.caching import sizeof
+
+ENV_FLAG = "MATHCRAFT_MEMPROFILE"
+LOG_PATH = os.environ.get("MATHCRAFT_MEMPROFILE_LOG", "mathcraft_memory.jsonl")
+FRAMES = int(os.environ.get("MATHCRAFT_MEMPROFILE_FRAMES", "16"))
+EVERY = max(int(os.environ.get("MATHCRAFT_MEMPROFILE_EVERY", "10")), 0)  # 0 (or less) turns sampling off
+MAX_TRACE_SECONDS = float(os.environ.get("MATHCRAFT_MEMPROFILE_MAX_SECONDS", "60"))
+TOP = 10
+SESSION_KEYS = 5
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Library path fragment -> category of the allocations made inside it.
+CATEGORIES = (("plotly", "figures"), ("numpy", "numpy"), ("pandas", "pandas"), ("streamlit", "streamlit"))
+_IGNORED = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+            tracemalloc.Filter(False, "<unknown>")]
+
+_local = threading.local()  # nesting depth of this thread's rerun
+_owner_lock = threading.Lock()
+_owner = None  # (thread, perf_counter at start) of the rerun being traced
+_write_lock = threading.Lock()
+_enabled = False
+_reruns = 0
+
+
+def env_enabled():
+    return os.environ.get(ENV_FLAG) == "1"
+
+
+def enabled():
+    return EVERY > 0 and (_enabled or env_enabled())
+
+
+def start():
+    """Start sampling reruns."""
+    global _enabled
+    _enabled = True
+
+
+def stop():
+    global _enabled
+    _enabled = False
+
+
+def _category(filename):
+    for fragment, category in CATEGORIES:
+        if f"{os.sep}{fragment}{os.sep}" in filename or f"_{fragment}_" in filename:
+            return category
+    return "app" if filename.startswith(ROOT) else "other"
+
+
+def _sites(snapshot):
+    """``{site: (bytes, count, category)}``, a site being the innermost app frame."""
+    sites = {}
+    for stat in snapshot.filter_traces(_IGNORED).statistics("traceback"):
+        frames = stat.traceback  # oldest first
+        frame = next((f for f in reversed(frames) if f.filename.startswith(ROOT)), frames[-1])
+        site = f"{os.path.relpath(frame.filename, ROOT) if frame.filename.startswith(ROOT) else frame.filename}" \
+               f":{frame.lineno}"
+        size, count, category = sites.get(site, (0, 0, _category(frames[-1].filename)))
+        sites[site] = (size + stat.size, count + stat.count, category)
+    return sites
+
+
+def _top(sites):
+    rows = [{"site": site, "category": category, "bytes": size, "count": count}
+            for site, (size, count, category) in sites.items()]
+    rows.sort(key=lambda row: row["bytes"], reverse=True)
+    categories = {}
+    for row in rows:
+        categories[row["category"]] = categories.get(row["category"], 0) + row["bytes"]
+    return rows[:TOP], categories
+
+
+def _session_sizes(session_state):
+    sizes = {}
+    for key in list(session_state.keys()):
+        try:
+            sizes[str(key)] = sizeof(session_state[key])
+        except Exception:  # a value that vanished or cannot be walked
+            continue
+    return dict(sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:SESSION_KEYS])
+
+
+def _sample():
+    global _reruns
+    _reruns += 1  # a lost update under a race only shifts which rerun is sampled
+    return _reruns % EVERY == 1 or EVERY == 1
+
+
+def _reclaim(restart):
+    """Stop the trace of a rerun that will never reach ``end``; call with ``_owner_lock`` held."""
+    global _owner
+    if _owner is None:
+        return
+    thread, started = _owner
+    if (not thread.is_alive() or time.perf_counter() - started > MAX_TRACE_SECONDS
+            or (restart and thread is threading.current_thread())):
+        tracemalloc.stop()
+        _owner = None
+
+
+def begin(restart=False):
+    """Mark the start of a rerun on this thread and trace it if it is sampled.
+
+    Nested calls (a panel inside a full rerun) are ignored. ``restart``
+    (the top of app.py) also drops a rerun an exception left open on this
+    thread. A rerun is not traced while another one is, or while something
+    else (``python -X tracemalloc``, a benchmark) owns tracemalloc.
+    """
+    global _owner
+    depth = 0 if restart else getattr(_local, "depth", 0)
+    _local.depth = depth + 1
+    if depth > 0:
+        return
+    with _owner_lock:
+        _reclaim(restart)
+        if _owner is not None or not enabled() or not _sample() or tracemalloc.is_tracing():
+            return
+        tracemalloc.start(FRAMES)
+        _owner = (threading.current_thread(), time.perf_counter())
+
+
+def end(lesson, session_state=None, session=None, path=None):
+    """Close the rerun opened by the matching ``begin``; returns its record (None if it was not traced)."""
+    global _owner
+    _local.depth = depth = max(getattr(_local, "depth", 1) - 1, 0)
+    if depth > 0:
+        return None
+    with _owner_lock:
+        if _owner is None or _owner[0] is not threading.current_thread():
+            return None
+        rerun_ms = (time.perf_counter() - _owner[1]) * 1000
+        _owner = None
+        try:
+            retained, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+    start_time = time.perf_counter()
+    top, categories = _top(_sites(snapshot))
+    record = {"ts": time.time(), "session": session, "lesson": lesson, "rerun_ms": rerun_ms,
+              "retained_bytes": retained, "peak_bytes": peak, "top": top, "categories": categories}
+    if session_state is not None:
+        record["session_state"] = _session_sizes(session_state)
+    record["report_ms"] = (time.perf_counter() - start_time) * 1000
+
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _write_lock, open(path or LOG_PATH, "a", encoding="utf-8") as log:
+        log.write(line)
+    return record
+
+
+@contextmanager
+def rerun(lesson, session_state=None, session=None):
+    """``begin``/``end`` around a block, for fragment reruns."""
+    begin()
+    try:
+        yield
+    finally:
+        end(lesson, session_state, session)
+
+
+def summarize(records):
+    """Per-lesson retained and peak bytes of the sampled reruns, and retention by category, for ``st.dataframe``."""
+    by_lesson = {}
+    for record in records:
+        by_lesson.setdefault(record["lesson"], []).append(record)
+
+    rows = []
+    for lesson, group in sorted(by_lesson.items()):
+        retained = np.array([r["retained_bytes"] for r in group])
+        peak = np.array([r["peak_bytes"] for r in group])
+        row = {"lesson": lesson, "sampled reruns": len(group),
+               "retained KB/rerun": round(float(retained.mean()) / 1024, 1),
+               "retained max KB": round(float(retained.max()) / 1024, 1),
+               "peak p95 KB": round(float(np.percentile(peak, 95)) / 1024, 1),
+               "traced ms": round(float(np.median([r["rerun_ms"] for r in group])), 1)}
+        for category in ("figures", "numpy", "app", "streamlit"):
+            kept = sum(r.get("categories", {}).get(category, 0) for r in group)
+            row[f"{category} KB/rerun"] = round(kept / len(group) / 1024, 1)
+        rows.append(row)
+    return rows
+
+
+def top_sites(records, lesson=None, n=TOP):
+    """Allocation sites by bytes retained over the sampled reruns (of ``lesson``, or every lesson).
+
+    ``reruns`` counts the samples a site retained memory in; one that shows
+    up in every sample of a lesson is the first place to look for a leak.
+    """
+    totals = {}
+    for record in records:
+        if lesson is not None and record["lesson"] != lesson:
+            continue
+        for row in record.get("top", ()):
+            total = totals.setdefault(row["site"], {"site": row["site"], "category": row["category"],
+                                                     "bytes": 0, "count": 0, "reruns": 0})
+            total["bytes"] += row["bytes"]
+            total["reruns"] += 1
+            total["count"] += row["count"]
+    rows = sorted(totals.values(), key=lambda row: row["bytes"], reverse=True)[:n]
+    for row in rows:
+        filename, _, lineno = row["site"].rpartition(":")
+        path = filename if os.path.isabs(filename) else os.path.join(ROOT, filename)
+        row["KB"] = round(row.pop("bytes") / 1024, 1)
+        row["line"] = linecache.getline(path, int(lineno)).strip()
+    return rows
+
+
+def report(records, n=TOP):
+    """Plain-text report: the summary table, then the top sites of each lesson."""
+    lines = [f"MathCraft allocation report, {len(records):,} sampled reruns", ""]
+    for row in summarize(records):
+        lines.append("  ".join(f"{key}: {value}" for key, value in row.items()))
+    for lesson in sorted({record["lesson"] for record in records}):
+        sites = top_sites(records, lesson, n)
+        if not sites:
+            continue
+        lines += ["", f"== {lesson}: top {len(sites)} sites by bytes retained"]
+        for row in sites:
+            lines.append(f"{row['KB']:>10.1f} KB {row['count']:>8,} blocks {row['reruns']:>4} reruns  "
+                         f"{row['category']:<9} {row['site']}")
+            if row["line"]:
+                lines.append(f"{'':>45}{row['line']}")
+        sessions = [r["session_state"] for r in records if r["lesson"] == lesson and "session_state" in r]
+        if sessions:
+            biggest = max(sessions[-1].items(), key=lambda item: item[1], default=None)
+            if biggest is not None:
+                lines.append(f"  largest session-state value at the last sample: {biggest[0]} "
+                             f"({biggest[1] / 1024:.1f} KB)")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,216 @@
+"""Procedural practice problems drawn from per-session random generators.
+
+Each generator makes a whole batch at once from a ``numpy.random.Generator``:
+the random parameters are drawn as arrays and only the final formatting is
+per problem. Problems carry their own answer key.
+
+``ProblemPool`` keeps a queue of ready problems for one kind and tops it up
+on a shared background thread once it runs low, so a "New Problem" click is a
+``popleft``. ``SessionProblems`` gives a session one pool per kind it has
+drawn from, each with its own child generator of the session seed: the same
+seed always produces the same problems in the same order, whatever the
+thread timing. Everything lives in session state, so pools are created on
+first draw and hold small batches.
+"""
+import threading
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from mathcraft.angles import UNIT_CIRCLE, pi_label
+
+# Angles offered in the conversion drill (30° to 360°) and the memory challenge (0° to 330°).
+CONVERSION_ANGLES = tuple(entry.degrees for entry in UNIT_CIRCLE if entry.degrees)
+CHALLENGE_ANGLES = tuple(entry.degrees for entry in UNIT_CIRCLE if entry.degrees < 360)
+
+AMPLITUDES = np.array([0.5, 1, 2, 3, 4])
+FREQUENCIES = np.array([0.5, 1, 2, 3, 4])
+PHASE_STEPS = np.arange(-6, 7)  # C = k·π/12, from -π/2 to π/2
+VERTICAL_SHIFTS = np.arange(-3, 4)
+TRIPLES = np.array([[3, 4, 5], [5, 12, 13], [8, 15, 17], [7, 24, 25], [20, 21, 29]])
+LETTERS = "ABCD"
+
+FunctionProblem = namedtuple("FunctionProblem", ["function", "amplitude", "period", "phase", "vertical"])
+FunctionProblem.__doc__ = """``function`` is the display text; the rest is the answer key."""
+
+DefinitionProblem = namedtuple("DefinitionProblem", ["question", "options", "correct", "explanation"])
+DefinitionProblem.__doc__ = """Multiple choice; ``correct`` is the letter of the right option."""
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="problem-pool")
+
+
+def _number(value):
+    return f"{value:g}"
+
+
+def _function_text(fn, a, b, k, d):
+    amplitude = "" if a == 1 else _number(a)
+    argument = "x" if b == 1 else f"{_number(b)}x"
+    if k:
+        argument += f" {'+' if k > 0 else '-'} {pi_label(abs(k) * 15)}"
+    shift = f" {'+' if d > 0 else '-'} {abs(d)}" if d else ""
+    return f"f(x) = {amplitude}{fn}({argument}){shift}"
+
+
+def conversion_batch(rng, n):
+    """``n`` conversion drills, each a tuple of three angles in degrees."""
+    return [tuple(row) for row in rng.choice(CONVERSION_ANGLES, size=(n, 3)).tolist()]
+
+
+def challenge_batch(rng, n):
+    """``n`` unit-circle challenges, as labels such as ``"135°"``."""
+    return [f"{degrees}°" for degrees in rng.choice(CHALLENGE_ANGLES, size=n).tolist()]
+
+
+def function_batch(rng, n):
+    """``n`` problems about f(x) = A·sin(Bx + C) + D (or cos) with their properties."""
+    a = rng.choice(AMPLITUDES, size=n)
+    b = rng.choice(FREQUENCIES, size=n)
+    k = rng.choice(PHASE_STEPS, size=n)
+    d = rng.choice(VERTICAL_SHIFTS, size=n)
+    fn = np.where(rng.random(n) < 0.5, "sin", "cos")
+    period = 2 * np.pi / b
+    phase = -(k * np.pi / 12) / b
+    texts = [_function_text(*params) for params in zip(fn.tolist(), a.tolist(), b.tolist(), k.tolist(), d.tolist())]
+    return [FunctionProblem(*row) for row in zip(texts, a.tolist(), period.tolist(), phase.tolist(), d.tolist())]
+
+
+def _ratio(numerator, denominator):
+    return f"{numerator}/{denominator} = {numerator / denominator:.3g}"
+
+
+def definition_batch(rng, n):
+    """``n`` multiple-choice questions on the triangle and circle definitions.
+
+    Sides come from scaled Pythagorean triples so every answer is a clean
+    ratio; the distractors are the classic mix-ups (wrong side, inverted).
+    """
+    sides = TRIPLES[rng.integers(len(TRIPLES), size=n)] * rng.integers(1, 4, size=(n, 1))
+    kinds = rng.integers(3, size=n)
+    orders = rng.permuted(np.tile(np.arange(4), (n, 1)), axis=1)
+
+    problems = []
+    for (opp, adj, hyp), kind, order in zip(sides.tolist(), kinds.tolist(), orders.tolist()):
+        if kind == 0:
+            question = (f"In a right triangle, if the opposite side is {opp} and the hypotenuse is {hyp}, "
+                        "what is sin(θ)?")
+            ratios = [(opp, hyp), (adj, hyp), (opp, adj), (hyp, opp)]
+            explanation = f"sin(θ) = opposite ÷ hypotenuse = {opp} ÷ {hyp} = {opp / hyp:.3g}"
+        elif kind == 1:
+            question = (f"In a right triangle, if the adjacent side is {adj} and the hypotenuse is {hyp}, "
+                        "what is cos(θ)?")
+            ratios = [(adj, hyp), (opp, hyp), (adj, opp), (hyp, adj)]
+            explanation = f"cos(θ) = adjacent ÷ hypotenuse = {adj} ÷ {hyp} = {adj / hyp:.3g}"
+        else:
+            question = f"On a circle with radius {hyp}, if a point is at ({adj}, {opp}), what is cos(θ)?"
+            ratios = [(adj, hyp), (opp, hyp), (adj, opp), (opp, adj)]
+            explanation = f"cos(θ) = x-coordinate ÷ radius = {adj} ÷ {hyp} = {adj / hyp:.3g}"
+        options = [f"{LETTERS[slot]}) {_ratio(*ratios[choice])}" for slot, choice in enumerate(order)]
+        problems.append(DefinitionProblem(question, options, LETTERS[order.index(0)], explanation))
+    return problems
+
+
+GENERATORS = {
+    "conversion": conversion_batch,
+    "challenge": challenge_batch,
+    "function": function_batch,
+    "definition": definition_batch,
+}
+
+
+class ProblemPool:
+    """Ready-made problems of one kind, refilled in the background.
+
+    Generation is serialized by ``_refill_lock`` and batches are queued in
+    the order they were drawn, so the sequence ``pop`` returns depends only
+    on the generator's seed.
+    """
+
+    __slots__ = ("generate", "rng", "batch_size", "low_water", "_ready", "_lock", "_refill_lock", "_scheduled")
+
+    def __init__(self, generate, rng, batch_size=4, low_water=1):
+        self.generate = generate
+        self.rng = rng
+        self.batch_size = batch_size
+        self.low_water = low_water
+        self._ready = deque()
+        self._lock = threading.Lock()
+        self._refill_lock = threading.Lock()
+        self._scheduled = False
+
+    def __len__(self):
+        return len(self._ready)
+
+    def _refill(self):
+        with self._refill_lock:
+            if len(self._ready) > self.low_water:
+                return  # another thread refilled while we waited
+            batch = self.generate(self.rng, self.batch_size)
+            with self._lock:
+                self._ready.extend(batch)
+
+    def _background_refill(self):
+        try:
+            self._refill()
+        finally:
+            with self._lock:
+                self._scheduled = False
+
+    def prefetch(self):
+        """Queue a background refill unless one is already pending."""
+        with self._lock:
+            if self._scheduled:
+                return
+            self._scheduled = True
+        _EXECUTOR.submit(self._background_refill)
+
+    def pop(self):
+        while True:
+            with self._lock:
+                if self._ready:
+                    problem = self._ready.popleft()
+                    low = len(self._ready) <= self.low_water
+                    break
+            self._refill()  # ran dry: fill on this thread
+        if low:
+            self.prefetch()
+        return problem
+
+
+class SessionProblems:
+    """One session's random state: a pool per problem kind plus a spare generator.
+
+    ``rng`` is for one-off draws (the sidebar's fact of the day). Child ``i``
+    of ``seed`` is ``SeedSequence(seed, spawn_key=(i,))``, exactly what
+    ``spawn`` would return, so children are derived when a pool or ``rng``
+    is first needed rather than stored.
+    """
+
+    __slots__ = ("seed", "_rng", "_pools")
+
+    def __init__(self, seed):
+        self.seed = seed
+        self._rng = None
+        self._pools = {}
+
+    def _child(self, index):
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(index,)))
+
+    @property
+    def rng(self):
+        if self._rng is None:
+            self._rng = self._child(0)
+        return self._rng
+
+    def pool(self, kind):
+        if kind not in self._pools:
+            self._pools[kind] = ProblemPool(GENERATORS[kind], self._child(1 + list(GENERATORS).index(kind)))
+        return self._pools[kind]
+
+    def next(self, kind):
+        """The next problem of ``kind`` (one of ``GENERATORS``)."""
+        return self.pool(kind).pop()
+
+    def choice(self, options):
+        return options[int(self.rng.integers(len(options)))]
@@ -0,0 +1,162 @@
+"""Opt-in per-rerun timing with an append-only JSONL log.
+
+A rerun is opened with ``start_rerun`` at the top of the app script and
+closed with ``finish_rerun`` at the bottom. In between, ``span`` times a block
+(for example the lesson branch), ``timed_figure`` times a figure builder and
+``record_chart`` notes the serialized size of a chart payload. When no rerun
+is being recorded every hook is a single attribute lookup.
+
+Streamlit runs each session's script on its own thread, so the open rerun is
+kept in a thread-local.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+ENV_FLAG = "MATHCRAFT_PROFILE"
+LOG_PATH = os.environ.get("MATHCRAFT_PROFILE_LOG", "mathcraft_perf.jsonl")
+PERCENTILES = (50, 95, 99)
+
+_local = threading.local()
+_write_lock = threading.Lock()
+
+
+def env_enabled():
+    return os.environ.get(ENV_FLAG) == "1"
+
+
+class Rerun:
+    """Timings collected during one script run."""
+
+    def __init__(self, session=None):
+        self.session = session
+        self.started = time.time()
+        self.start = time.perf_counter()
+        self.spans = {}
+        self.figures = []
+        self.charts = []
+
+    def as_record(self, lesson):
+        return {
+            "ts": self.started,
+            "session": self.session,
+            "lesson": lesson,
+            "total_ms": (time.perf_counter() - self.start) * 1000,
+            "spans_ms": self.spans,
+            "figures": self.figures,
+            "charts": self.charts,
+        }
+
+
+def start_rerun(enabled, session=None):
+    """Begin recording this thread's rerun if ``enabled``; returns it or None."""
+    _local.rerun = Rerun(session) if enabled else None
+    return _local.rerun
+
+
+def current():
+    return getattr(_local, "rerun", None)
+
+
+@contextmanager
+def span(name):
+    """Time the enclosed block as ``name`` in the current rerun."""
+    rerun = current()
+    if rerun is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rerun.spans[name] = rerun.spans.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def timed_figure(name):
+    """Decorator recording how long a figure builder call takes.
+
+    Apply it outside any cache decorator so cache hits are measured too; that
+    is the time a rerun actually pays.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            rerun = current()
+            if rerun is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                rerun.figures.append({"name": name, "ms": (time.perf_counter() - start) * 1000})
+        return wrapper
+    return decorator
+
+
+def record_chart(name, payload_bytes, points_original, points_emitted):
+    rerun = current()
+    if rerun is not None:
+        rerun.charts.append({
+            "name": name,
+            "bytes": payload_bytes,
+            "points_original": points_original,
+            "points_emitted": points_emitted,
+        })
+
+
+def finish_rerun(lesson, path=None):
+    """Close the current rerun and append it to the log; returns the record."""
+    rerun = current()
+    if rerun is None:
+        return None
+    _local.rerun = None
+    record = rerun.as_record(lesson)
+    line = json.dumps(record, ensure_ascii=False) + "\n"
+    with _write_lock, open(path or LOG_PATH, "a", encoding="utf-8") as log:
+        log.write(line)
+    return record
+
+
+def read_log(path=None, limit=10000):
+    """Return the last ``limit`` records of the log (oldest first)."""
+    path = path or LOG_PATH
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as log:
+        lines = log.readlines()[-limit:]
+    records = []
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            continue  # a line cut short by a crash
+    return records
+
+
+def summarize(records):
+    """Per-lesson percentiles of rerun and lesson-branch time, and chart bytes.
+
+    Returns a list of rows (one per lesson) suitable for ``st.dataframe``.
+    """
+    by_lesson = {}
+    for record in records:
+        by_lesson.setdefault(record["lesson"], []).append(record)
+
+    rows = []
+    for lesson, group in sorted(by_lesson.items()):
+        total = np.array([r["total_ms"] for r in group])
+        branch = np.array([r["spans_ms"].get("lesson", 0.0) for r in group])
+        figure = np.array([sum(f["ms"] for f in r["figures"]) for r in group])
+        payload = np.array([sum(c["bytes"] for c in r["charts"]) for r in group])
+        row = {"lesson": lesson, "reruns": len(group)}
+        for name, values in (("total", total), ("lesson", branch), ("figures", figure)):
+            for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                row[f"{name} p{p} ms"] = round(float(value), 2)
+        row["chart KB/rerun"] = round(float(payload.mean()) / 1024, 1)
+        rows.append(row)
+    return rows
@@ -0,0 +1,63 @@
+"""Compact per-session record of a student's progress.
+
+One instance lives in each session's ``st.session_state``. Visited lessons
+are bits of a single int indexed by lesson position, so marking a visit and
+counting visits are O(1) and the record stays a few hundred bytes no matter
+how long the session runs.
+"""
+import sys
+
+
+class StudentProgress:
+    __slots__ = ("lessons_mask", "problems_attempted", "correct_answers")
+
+    def __init__(self, lessons_mask=0, problems_attempted=0, correct_answers=0):
+        self.lessons_mask = lessons_mask
+        self.problems_attempted = problems_attempted
+        self.correct_answers = correct_answers
+
+    def visit(self, lesson_index):
+        self.lessons_mask |= 1 << lesson_index
+
+    def visited(self, lesson_index):
+        return bool(self.lessons_mask >> lesson_index & 1)
+
+    @property
+    def lessons_completed(self):
+        return bin(self.lessons_mask).count("1")
+
+    def record_answer(self, correct):
+        self.problems_attempted += 1
+        self.correct_answers += bool(correct)
+
+    def completion(self, total_lessons):
+        """Fraction of the ``total_lessons`` lessons visited, from 0 to 1."""
+        return self.lessons_completed / total_lessons
+
+    def __repr__(self):
+        return (f"StudentProgress(lessons_mask={self.lessons_mask:#b}, "
+                f"problems_attempted={self.problems_attempted}, correct_answers={self.correct_answers})")
+
+
+def deep_sizeof(obj, _seen=None):
+    """Approximate bytes held by ``obj`` and everything it references.
+
+    Follows containers, ``__dict__`` and ``__slots__``; shared objects are
+    counted once. NumPy arrays report their buffer through ``sys.getsizeof``.
+    """
+    seen = set() if _seen is None else _seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    else:
+        for name in getattr(type(obj), "__slots__", ()):
+            if hasattr(obj, name):
+                size += deep_sizeof(getattr(obj, name), seen)
+        if hasattr(obj, "__dict__"):
+            size += deep_sizeof(vars(obj), seen)
+    return size
@@ -0,0 +1,63 @@
+"""Adaptive sampling of curves for plotting.
+
+A fixed ``np.linspace`` grid spends as many points on a straight stretch as
+on a sharp bend. ``adaptive`` starts from a coarse grid and keeps halving the
+intervals whose midpoint is farther from the chord than the tolerance, so a
+curve ships a few dozen points where it is flat and more only where it bends.
+Each round evaluates the function once on all the midpoints it needs.
+``refine`` is the same loop for a caller-built initial grid.
+"""
+import numpy as np
+
+
+def adaptive(func, a, b, tolerance=1e-3, initial=33, max_depth=14, max_points=1500):
+    """Sorted ``(x, y)`` arrays sampling ``func`` on ``[a, b]``.
+
+    ``func`` takes and returns NumPy arrays. ``tolerance`` is a fraction of
+    the curve's height on the initial grid of ``initial`` points; see
+    ``refine`` for the rest.
+    """
+    x = np.linspace(a, b, initial)
+    y = func(x)
+    finite = y[np.isfinite(y)]
+    return refine(func, x, y, tolerance * (np.ptp(finite) if len(finite) else 0.0),
+                  max_depth=max_depth, max_points=max_points)
+
+
+def refine(func, x, y, error, min_dx=0.0, max_depth=14, max_points=1500):
+    """Add midpoints to the samples ``(x, y)`` until the chords are within ``error``.
+
+    An interval is split while its midpoint misses the straight line between
+    its ends by more than ``error`` (in y units) and it is wider than
+    ``2 * min_dx``. Intervals touching a NaN are left alone, so a NaN point
+    can mark a gap (an asymptote) the curve must not be drawn across. At
+    most ``max_points`` points are returned; past that only the worst
+    intervals are still split.
+    """
+    active = np.arange(len(x) - 1)
+    for _ in range(max_depth):
+        active = active[x[active + 1] - x[active] > 2 * min_dx]
+        if not len(active) or len(x) >= max_points:
+            break
+        mid = (x[active] + x[active + 1]) / 2
+        y_mid = func(mid)
+        miss = np.abs(y_mid - (y[active] + y[active + 1]) / 2)
+        split = np.flatnonzero(miss > error)
+        room = max_points - len(x)
+        if len(split) > room:
+            split = np.sort(split[np.argsort(miss[split])[len(split) - room:]])
+        left = active[split]
+        x = np.insert(x, left + 1, mid[split])
+        y = np.insert(y, left + 1, y_mid[split])
+        # The k-th inserted midpoint lands at left[k] + 1 + k; both halves go on.
+        placed = left + 1 + np.arange(len(left))
+        active = np.concatenate([placed - 1, placed])
+        active.sort()
+    return x, y
+
+
+def mirrored(x, y, parity=1):
+    """Extend samples of an even (``parity=1``) or odd (-1) function on [0, b] to [-b, b]."""
+    skip = 1 if x[0] == 0 else 0  # do not repeat the point at 0
+    left = slice(len(x) - 1, skip - 1 if skip else None, -1)
+    return np.concatenate([-x[left], x]), np.concatenate([parity * y[left], y])
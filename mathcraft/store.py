@@ -0,0 +1,218 @@
+"""Durable student progress and quiz attempts in SQLite.
+
+Reruns never touch the disk: ``record_visit`` and ``record_answer`` only put
+a tuple on a queue. A background thread drains the queue every
+``flush_interval`` seconds (or sooner once ``batch_size`` events are waiting)
+and writes each batch in one transaction. The database runs in WAL mode so
+the reader used by ``load`` is never blocked by the writer. A batch that
+fails to write (a locked database, a full disk) is retried with backoff,
+then logged and dropped, so the writer keeps going.
+
+Two tables:
+
+* ``progress`` - one row per student with the latest ``StudentProgress``;
+  restoring a session is a primary-key lookup.
+* ``events`` - append-only log of lesson visits and graded answers.
+"""
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+from mathcraft.progress import StudentProgress
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    student_id TEXT PRIMARY KEY,
+    lessons_mask INTEGER NOT NULL,
+    problems_attempted INTEGER NOT NULL,
+    correct_answers INTEGER NOT NULL,
+    updated REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    student_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    kind TEXT NOT NULL,
+    lesson INTEGER,
+    quiz TEXT,
+    question TEXT,
+    answer TEXT,
+    correct INTEGER
+);
+CREATE INDEX IF NOT EXISTS events_by_student ON events (student_id, ts);
+"""
+
+UPSERT_PROGRESS = """
+INSERT INTO progress (student_id, lessons_mask, problems_attempted, correct_answers, updated)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (student_id) DO UPDATE SET
+    lessons_mask = excluded.lessons_mask,
+    problems_attempted = excluded.problems_attempted,
+    correct_answers = excluded.correct_answers,
+    updated = excluded.updated
+"""
+
+INSERT_EVENT = """
+INSERT INTO events (student_id, ts, kind, lesson, quiz, question, answer, correct)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_STOP = object()
+
+log = logging.getLogger(__name__)
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class ProgressStore:
+    def __init__(self, path, flush_interval=1.0, batch_size=500, retries=3, retry_delay=0.5):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.dropped = 0  # events in batches that could not be written
+        self._queue = queue.SimpleQueue()
+        # Latest snapshot per student not yet written, so a reconnect that
+        # beats the writer still sees it.
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._flushed = threading.Condition()
+        self._enqueued = 0
+        self._written = 0
+
+        with closing(_connect(path)) as conn, conn:
+            conn.executescript(SCHEMA)
+        self._reader = _connect(path)
+        self._reader_lock = threading.Lock()
+
+        self._writer = threading.Thread(target=self._run, name="progress-store-writer", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    # --- write side (called from reruns; never blocks on disk) ---
+
+    def _snapshot(self, student_id, progress):
+        row = (student_id, progress.lessons_mask, progress.problems_attempted,
+               progress.correct_answers, time.time())
+        with self._pending_lock:
+            self._pending[student_id] = row
+        return row
+
+    def _put(self, event, row):
+        with self._flushed:
+            self._enqueued += 1
+        self._queue.put((event, row))
+
+    def record_visit(self, student_id, lesson_index, progress):
+        row = self._snapshot(student_id, progress)
+        self._put((student_id, row[-1], "visit", lesson_index, None, None, None, None), row)
+
+    def record_answer(self, student_id, quiz, question, answer, correct, progress):
+        """Log a graded answer; ``correct`` may be None when it was not graded."""
+        row = self._snapshot(student_id, progress)
+        graded = None if correct is None else int(bool(correct))
+        self._put((student_id, row[-1], "answer", None, quiz, str(question), str(answer), graded), row)
+
+    # --- read side ---
+
+    def load(self, student_id):
+        """Return the student's saved ``StudentProgress`` or None."""
+        with self._pending_lock:
+            row = self._pending.get(student_id)
+        if row is None:
+            with self._reader_lock:
+                row = self._reader.execute(
+                    "SELECT student_id, lessons_mask, problems_attempted, correct_answers, updated "
+                    "FROM progress WHERE student_id = ?", (student_id,)
+                ).fetchone()
+        if row is None:
+            return None
+        return StudentProgress(*row[1:4])
+
+    def history(self, student_id, limit=100):
+        """Most recent events for a student, newest first."""
+        with self._reader_lock:
+            return self._reader.execute(
+                "SELECT ts, kind, lesson, quiz, question, answer, correct FROM events "
+                "WHERE student_id = ? ORDER BY ts DESC LIMIT ?", (student_id, limit)
+            ).fetchall()
+
+    # --- background writer ---
+
+    def _drain(self, first):
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, conn, batch):
+        events = [event for event, _ in batch]
+        latest = {}
+        for _, row in batch:
+            latest[row[0]] = row
+        for attempt in range(self.retries + 1):
+            try:
+                with conn:
+                    conn.executemany(INSERT_EVENT, events)
+                    conn.executemany(UPSERT_PROGRESS, list(latest.values()))
+                break
+            except sqlite3.Error as error:
+                if attempt == self.retries:
+                    # Pending snapshots stay, so this process still restores them.
+                    log.error("Dropped %d progress events after %d attempts: %s", len(batch), attempt + 1, error)
+                    self.dropped += len(batch)
+                    latest = {}
+                    break
+                log.warning("Writing %d progress events failed (%s); retrying", len(batch), error)
+                time.sleep(self.retry_delay * 2 ** attempt)
+        with self._pending_lock:
+            for student_id, row in latest.items():
+                if self._pending.get(student_id) is row:
+                    del self._pending[student_id]
+        with self._flushed:
+            self._written += len(batch)
+            self._flushed.notify_all()
+
+    def _run(self):
+        conn = _connect(self.path)
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                # Give the batch a moment to fill before committing.
+                time.sleep(self.flush_interval if self._queue.qsize() < self.batch_size else 0)
+                batch = self._drain(item)
+                stop = _STOP in batch
+                self._write(conn, [entry for entry in batch if entry is not _STOP])
+                if stop:
+                    break
+        finally:
+            conn.close()
+
+    def flush(self, timeout=10.0):
+        """Block until everything recorded so far is on disk (or dropped; see ``dropped``)."""
+        with self._flushed:
+            target = self._enqueued
+            return self._flushed.wait_for(lambda: self._written >= target, timeout)
+
+    def close(self):
+        if not self._writer.is_alive():
+            return
+        self._queue.put(_STOP)
+        self._writer.join()
+        with self._reader_lock:
+            self._reader.close()
@@ -0,0 +1,135 @@
+"""Solve triangles from any three given parts, many at once.
+
+Sides ``a, b, c`` are opposite the angles ``A, B, C`` (degrees). ``solve``
+takes the given parts of a configuration in the order of ``GIVEN[case]``,
+as numbers or NumPy arrays that broadcast together:
+
+* ``SSS`` - a, b, c;
+* ``SAS`` - a, b and the angle C between them;
+* ``ASA`` - A, the side c between the two angles, and B;
+* ``AAS`` - A, B and the side a opposite A;
+* ``SSA`` - a, b and the angle A opposite a, the ambiguous case: zero, one
+  or two triangles.
+
+Everything is computed with the laws of sines and cosines as array
+operations, so a worksheet of a million triangles is a handful of NumPy
+calls. Each result array has a leading axis of length 2 for the two
+possible triangles (only SSA ever fills the second). Parts that do not
+make a triangle are NaN, with ``valid`` False.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+GIVEN = {
+    "SSS": ("a", "b", "c"),
+    "SAS": ("a", "b", "C"),
+    "ASA": ("A", "c", "B"),
+    "AAS": ("A", "B", "a"),
+    "SSA": ("a", "b", "A"),
+}
+CASES = tuple(GIVEN)
+
+Triangles = namedtuple("Triangles", ["a", "b", "c", "A", "B", "C", "area", "perimeter", "valid", "count"])
+Triangles.__doc__ = """Solutions of ``solve``: arrays of shape ``(2, *given shape)``, except
+``count`` (0, 1 or 2 triangles per given set) of the given shape."""
+
+# cos/sin within this of ±1 count as exactly ±1 (a right angle in SSA, a flat SSS).
+_EPS = 1e-12
+
+
+def _cos_rule_angle(adjacent1, adjacent2, opposite):
+    """Angle (degrees) opposite ``opposite``, from the law of cosines.
+
+    Written as the half-angle formula tan(A/2) = √((s-b)(s-c) / (s(s-a))),
+    which stays accurate for angles near 0° and 180°, where arccos of the
+    law of cosines loses half its digits.
+    """
+    s = (adjacent1 + adjacent2 + opposite) / 2
+    near = np.maximum((s - adjacent1) * (s - adjacent2), 0)
+    far = np.maximum(s * (s - opposite), 0)
+    return np.degrees(2 * np.arctan2(np.sqrt(near), np.sqrt(far)))
+
+
+def _sine_rule_side(known_side, known_angle, angle):
+    """Side opposite ``angle``, given a side and its opposite angle."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return known_side * np.sin(np.radians(angle)) / np.sin(np.radians(known_angle))
+
+
+def _from_angles(A, B, C, side, opposite):
+    """Sides of the triangle with angles A, B, C where ``side`` is opposite ``opposite``."""
+    known_angle = {"A": A, "B": B, "C": C}[opposite]
+    return tuple(_sine_rule_side(side, known_angle, angle) for angle in (A, B, C))
+
+
+def _one(a, b, c, A, B, C):
+    return tuple(np.stack([x, np.full_like(x, np.nan)]) for x in (a, b, c, A, B, C))
+
+
+def solve(case, *given):
+    """Solve every triangle described by ``given`` (see ``GIVEN[case]``); returns ``Triangles``."""
+    if case not in GIVEN:
+        raise ValueError(f"unknown case {case!r}; expected one of {', '.join(CASES)}")
+    if len(given) != 3:
+        raise ValueError(f"{case} takes {', '.join(GIVEN[case])}")
+    p, q, r = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in given))
+
+    if case == "SSS":
+        a, b, c = p, q, r
+        A, B = _cos_rule_angle(b, c, a), _cos_rule_angle(a, c, b)
+        parts = _one(a, b, c, A, B, 180 - A - B)
+        ok = (a + b > c) & (a + c > b) & (b + c > a)
+    elif case == "SAS":
+        a, b, C = p, q, r
+        c = np.sqrt(np.maximum(a**2 + b**2 - 2 * a * b * np.cos(np.radians(C)), 0))
+        A = _cos_rule_angle(b, c, a)
+        parts = _one(a, b, c, A, 180 - A - C, C)
+        ok = (C > 0) & (C < 180)
+    elif case in ("ASA", "AAS"):
+        if case == "ASA":
+            A, c, B = p, q, r
+            C = 180 - A - B
+            sides = _from_angles(A, B, C, c, "C")
+        else:
+            A, B, a = p, q, r
+            C = 180 - A - B
+            sides = _from_angles(A, B, C, a, "A")
+        parts = _one(*sides, A, B, C)
+        ok = (A > 0) & (B > 0) & (C > 0)
+    else:
+        return _solve_ssa(p, q, r)
+
+    a, b, c, A, B, C = parts
+    ok = ok & (p > 0) & (q > 0) & (r > 0) & np.all(np.isfinite(np.stack([p, q, r])), axis=0)
+    valid = np.stack([ok, np.zeros_like(ok)])
+    return _finish(a, b, c, A, B, C, valid)
+
+
+def _solve_ssa(a, b, A):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sin_B = b * np.sin(np.radians(A)) / a
+    given_ok = (a > 0) & (b > 0) & (A > 0) & (A < 180)
+    right = np.abs(sin_B - 1) <= _EPS
+    B1 = np.where(right, 90.0, np.degrees(np.arcsin(np.clip(sin_B, -1, 1))))
+    B = np.stack([B1, 180 - B1])
+    C = 180 - A - B
+    valid = given_ok & ((sin_B < 1) | right) & (C > 0)
+    valid[1] &= ~right & (B[1] != B[0])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        c = a * np.sin(np.radians(C)) / np.sin(np.radians(A))
+    stacked = [np.broadcast_to(x, B.shape) for x in (a, b, c, A, B, C)]
+    return _finish(*stacked, valid)
+
+
+def _finish(a, b, c, A, B, C, valid):
+    parts = [np.where(valid, x, np.nan) for x in (a, b, c, A, B, C)]
+    a, b, c, A, B, C = parts
+    area = 0.5 * a * b * np.sin(np.radians(C))
+    return Triangles(a, b, c, A, B, C, area, a + b + c, valid, valid.sum(axis=0))
+
+
+def vertices(a, b, c, A):
+    """Corner coordinates for drawing: A at the origin, B on the x-axis, C above."""
+    theta = np.radians(A)
+    return np.array([[0.0, 0.0], [c, 0.0], [b * np.cos(theta), b * np.sin(theta)]])
@@ -0,0 +1,29 @@
+import io
+
+from mathcraft.bulk import sniff
+
+
+def _file(text):
+    return io.BytesIO(text.encode("utf-8"))
+
+
+def test_pi_expression_first_row_is_not_a_header():
+    source = _file("3π/4\n90\n")
+    assert sniff(source) == (False, ["column 1"])
+    assert source.tell() == 0
+
+
+def test_text_first_row_is_a_header():
+    assert sniff(_file("angle,label\n30,a\n")) == (True, ["angle", "label"])
+
+
+def test_numeric_first_row_is_not_a_header():
+    assert sniff(_file("45°,x\n90,y\n")) == (False, ["column 1", "column 2"])
+
+
+def test_blank_lines_before_the_first_row_are_skipped():
+    assert sniff(_file("\n  \nangle\n30\n")) == (True, ["angle"])
+
+
+def test_file_without_rows_has_no_columns():
+    assert sniff(_file("\n\n")) == (False, [])
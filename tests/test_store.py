@@ -0,0 +1,52 @@
+import sqlite3
+
+import pytest
+
+from mathcraft.progress import StudentProgress
+from mathcraft.store import SCHEMA, ProgressStore
+
+
+def _store(tmp_path):
+    return ProgressStore(str(tmp_path / "progress.db"), flush_interval=0.01, retries=1, retry_delay=0.01)
+
+
+def test_failing_write_is_dropped_and_the_writer_keeps_going(tmp_path):
+    store = _store(tmp_path)
+    progress = StudentProgress()
+    progress.visit(2)
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("DROP TABLE events")  # every insert now fails
+
+    store.record_visit("ada", 2, progress)
+    assert store.flush(timeout=5)
+    assert store.dropped == 1
+    assert store._writer.is_alive()
+    assert store.load("ada").lessons_mask == progress.lessons_mask  # the pending snapshot survives
+
+    with sqlite3.connect(store.path) as conn:
+        conn.executescript(SCHEMA)
+    progress.visit(3)
+    store.record_visit("ada", 3, progress)
+    assert store.flush(timeout=5)
+    assert store.dropped == 1
+    assert [(kind, lesson) for _, kind, lesson, *_ in store.history("ada")] == [("visit", 3)]
+    assert store.load("ada").lessons_mask == progress.lessons_mask
+    store.close()
+
+
+def test_schema_connection_is_closed(tmp_path, monkeypatch):
+    from mathcraft import store as store_module
+
+    opened = []
+    connect = store_module._connect
+
+    def tracking_connect(path):
+        conn = connect(path)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(store_module, "_connect", tracking_connect)
+    store = _store(tmp_path)
+    store.close()
+    with pytest.raises(sqlite3.ProgrammingError):  # closed
+        opened[0].execute("SELECT 1")